@@ -1,3 +1,25 @@
-from .routers import health_router
+from .cache import ResponseCache
+from .errors import DOMAIN_ERRORS_TOTAL, register_error_handlers
+from .middlewares import (
+    AdmissionControlMiddleware,
+    AimdLimit,
+    CompressionMiddleware,
+    ProfilingMiddleware,
+    RequestMetricsMiddleware,
+)
+from .routers import events_router, health_router, metrics_router, projects_router
 
-__all__ = ["health_router"]
+__all__ = [
+    "DOMAIN_ERRORS_TOTAL",
+    "AdmissionControlMiddleware",
+    "AimdLimit",
+    "CompressionMiddleware",
+    "ProfilingMiddleware",
+    "RequestMetricsMiddleware",
+    "ResponseCache",
+    "events_router",
+    "health_router",
+    "metrics_router",
+    "projects_router",
+    "register_error_handlers",
+]
@@ -0,0 +1,171 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+from fastapi import Request
+from pydantic import BaseModel, ConfigDict
+
+from domain.event import DomainEvent
+
+PROJECTS_TAG = "projects"
+
+
+def project_tag(project_id: str) -> str:
+    """Tag of the responses built from one project."""
+    return f"project:{project_id}"
+
+
+def event_tags(event: DomainEvent) -> set[str]:
+    """Tags of the responses a committed event makes stale.
+
+    An event about a project changes its own responses and every listing.
+    """
+    project_id = getattr(event, "project_id", None)
+    if project_id is None:
+        return set()
+    return {project_tag(project_id), PROJECTS_TAG}
+
+
+class CachedResponse(BaseModel):
+    """Serialized body of a read endpoint, with its entity tag."""
+
+    model_config = ConfigDict(frozen=True)
+
+    body: bytes
+    etag: str
+    # Sent along with the body, e.g. the link to the next page
+    headers: dict[str, str] = {}
+
+
+class _Entry(BaseModel):
+    response: CachedResponse
+    tags: frozenset[str]
+    expires_at: float
+
+
+class ResponseCache:
+    """LRU cache of read responses, invalidated by committed domain events.
+
+    Entries are tagged with the aggregates they were built from. Units of work
+    publish their events to the cache after commit, which drops exactly the
+    entries with a matching tag, so a read following a write never sees the
+    old response in the same process. The TTL only bounds how long other
+    processes, which do not see this process's events, may serve stale data.
+    Memory is bounded by the number of entries and the size of their bodies.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            max_bytes: Total body size kept before evicting
+            ttl_seconds: Lifetime of an entry
+            clock: Monotonic time source
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._size = 0
+        # Bumped on every invalidation, see ``get_or_load``
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(
+        self,
+        key: str,
+        tags: Iterable[str],
+        load: Callable[[], Awaitable[CachedResponse]],
+    ) -> CachedResponse:
+        """Return the cached response, loading and caching it on a miss.
+
+        A response loaded while an invalidation happened is returned but not
+        cached, since it may have been read before the change was committed.
+        Errors raised by ``load`` are not cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        response = await load()
+        if generation == self._generation:
+            self.put(key, response, tags)
+        return response
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.response
+
+    def put(self, key: str, response: CachedResponse, tags: Iterable[str]) -> None:
+        """Cache a response under the tags of the aggregates it was built from."""
+        if len(response.body) > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        entry = _Entry(
+            response=response,
+            tags=frozenset(tags),
+            expires_at=self._clock() + self._ttl_seconds,
+        )
+        self._entries[key] = entry
+        self._size += len(response.body)
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Drop every entry carrying one of the tags."""
+        self._generation += 1
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        """Drop the entries made stale by committed events."""
+        self.invalidate(set().union(*(event_tags(event) for event in events)))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.response.body)
+        for tag in entry.tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+
+
+def request_cache_key(request: Request) -> str:
+    """Key a request by its path, query parameters and credentials.
+
+    Credentials are hashed, so responses are never shared across callers with
+    different authorization and no secret is kept in memory.
+    """
+    query = sorted(request.query_params.multi_items())
+    scope = hashlib.blake2b(
+        request.headers.get("authorization", "").encode(), digest_size=8
+    ).hexdigest()
+    return f"{request.method} {request.url.path} {query} {scope}"
@@ -0,0 +1,54 @@
+import hashlib
+
+from fastapi import Request, Response
+
+# Bumped whenever the JSON representation changes, so cached copies are revalidated
+_REPRESENTATION_VERSION = "1"
+
+
+def strong_etag(*parts: str) -> str:
+    """Derive a strong entity tag from the values identifying a representation."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_REPRESENTATION_VERSION.encode())
+    for part in parts:
+        digest.update(b"\x00")
+        digest.update(part.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check ``If-None-Match`` against the current entity tag.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(_opaque(tag) == _opaque(etag) for tag in header.split(","))
+
+
+def json_response(
+    content: bytes,
+    etag: str,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Build a JSON response from already serialized content."""
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers={"ETag": etag, **(headers or {})},
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build the 304 answer to a matching conditional request."""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,81 @@
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Request
+
+from adapters.inbound.api.cache import ResponseCache
+from application.commands.bus import CommandBus
+from application.health import HealthMonitor
+from application.ports import EventSubscriber
+from application.queries.handlers.get_project_query_handler import (
+    GetProjectQueryHandler,
+)
+from application.queries.handlers.list_projects_query_handler import (
+    ListProjectsQueryHandler,
+)
+from domain.ports import UnitOfWork
+
+
+def get_command_bus(request: Request) -> CommandBus:
+    """Return the command bus built at startup."""
+    bus: CommandBus = request.app.state.command_bus
+    return bus
+
+
+def get_unit_of_work(request: Request) -> UnitOfWork[Any]:
+    """Create the unit of work of the current request."""
+    uow: UnitOfWork[Any] = request.app.state.unit_of_work_factory()
+    return uow
+
+
+def get_project_handler(request: Request) -> GetProjectQueryHandler:
+    """Return the handler reading a single project."""
+    handler: GetProjectQueryHandler = request.app.state.get_project_handler
+    return handler
+
+
+def get_list_projects_handler(request: Request) -> ListProjectsQueryHandler:
+    """Return the handler listing projects."""
+    handler: ListProjectsQueryHandler = request.app.state.list_projects_handler
+    return handler
+
+
+def get_event_subscriber(request: Request) -> EventSubscriber:
+    """Return the source of live domain events."""
+    subscriber: EventSubscriber = request.app.state.event_subscriber
+    return subscriber
+
+
+def get_health_monitor(request: Request) -> HealthMonitor:
+    """Return the monitor caching dependency probe results."""
+    monitor: HealthMonitor = request.app.state.health_monitor
+    return monitor
+
+
+def get_metrics_exposition(request: Request) -> Callable[[], bytes]:
+    """Return the function rendering the collected metrics."""
+    exposition: Callable[[], bytes] = request.app.state.metrics_exposition
+    return exposition
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    """Return the cache of read responses."""
+    cache: ResponseCache = request.app.state.response_cache
+    return cache
+
+
+def get_client_id(request: Request) -> str | None:
+    """Identify the API client sending the request, for per-client rate limits.
+
+    Clients are told apart by the identity an authentication middleware
+    verified, see Starlette's ``AuthenticationMiddleware``, or by their
+    address otherwise. Unverified credentials are ignored: a client could
+    send a new ``Authorization`` header with every request to get a fresh
+    limit each time.
+    """
+    user = request.scope.get("user")
+    if user is not None and user.is_authenticated:
+        return f"user:{user.identity}"
+    if request.client is not None:
+        return f"address:{request.client.host}"
+    return None
@@ -0,0 +1,82 @@
+import math
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from application.commands.exceptions import (
+    IdempotencyKeyReusedError,
+    RateLimitExceededError,
+)
+from application.ports import MetricsRecorder, ProviderUnavailableError
+from domain.exception import DomainError, EntityNotFoundError
+from domain.project.exceptions import (
+    ProjectAlreadyExistsError,
+    RemoteRepositoryDoesNotExistError,
+)
+
+DOMAIN_ERRORS_TOTAL = "domain_errors_total"
+
+# Domain errors not listed here are invalid input and answered with 400
+_STATUS_CODES: dict[type[DomainError], int] = {
+    EntityNotFoundError: 404,
+    ProjectAlreadyExistsError: 409,
+    IdempotencyKeyReusedError: 409,
+    RemoteRepositoryDoesNotExistError: 422,
+    RateLimitExceededError: 429,
+}
+
+
+def register_error_handlers(
+    app: FastAPI, metrics: MetricsRecorder | None = None
+) -> None:
+    """Translate errors raised by handlers into JSON error responses.
+
+    Domain errors get the status of their type. A provider that cannot answer,
+    e.g. because its circuit is open, is answered with 503 and ``Retry-After``
+    when the provider says when to retry.
+
+    Args:
+        app: Application to register the handlers on
+        metrics: Recorder counting domain errors by their status, if given
+    """
+
+    async def domain_error_handler(
+        _request: Request, error: DomainError
+    ) -> JSONResponse:
+        if metrics is not None:
+            metrics.increment(DOMAIN_ERRORS_TOTAL, labels={"status": error.status})
+        headers = None
+        if isinstance(error, RateLimitExceededError):
+            headers = {"Retry-After": str(math.ceil(error.retry_after_seconds))}
+        return JSONResponse(
+            status_code=status_code_for(error),
+            content={"error": error.status, "message": error.message},
+            headers=headers,
+        )
+
+    async def provider_error_handler(
+        _request: Request, error: ProviderUnavailableError
+    ) -> JSONResponse:
+        headers = None
+        if error.retry_after_seconds is not None:
+            headers = {"Retry-After": str(math.ceil(error.retry_after_seconds))}
+        return JSONResponse(
+            status_code=503,
+            content={
+                "error": "provider_unavailable",
+                "message": "The repository provider is unavailable, retry later",
+            },
+            headers=headers,
+        )
+
+    app.add_exception_handler(DomainError, domain_error_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(ProviderUnavailableError, provider_error_handler)  # type: ignore[arg-type]
+
+
+def status_code_for(error: DomainError) -> int:
+    """Return the HTTP status code of a domain error."""
+    for error_type in type(error).__mro__:
+        status_code = _STATUS_CODES.get(error_type)
+        if status_code is not None:
+            return status_code
+    return 400
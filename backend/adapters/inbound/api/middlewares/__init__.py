@@ -0,0 +1,35 @@
+from .admission import (
+    HTTP_REQUESTS_SHED_TOTAL,
+    AdmissionControlMiddleware,
+    AimdLimit,
+)
+from .compression import (
+    COMPRESSIBLE_MEDIA_TYPES,
+    CompressionMiddleware,
+    StreamEncoder,
+    negotiate_encoding,
+)
+from .metrics import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_REQUESTS_TOTAL,
+    RequestMetricsMiddleware,
+)
+from .profiling import PROFILE_HEADER, ProfilingMiddleware, StackSampler
+
+__all__ = [
+    "COMPRESSIBLE_MEDIA_TYPES",
+    "HTTP_REQUESTS_IN_FLIGHT",
+    "HTTP_REQUESTS_SHED_TOTAL",
+    "HTTP_REQUESTS_TOTAL",
+    "HTTP_REQUEST_DURATION_SECONDS",
+    "PROFILE_HEADER",
+    "AdmissionControlMiddleware",
+    "AimdLimit",
+    "CompressionMiddleware",
+    "ProfilingMiddleware",
+    "RequestMetricsMiddleware",
+    "StackSampler",
+    "StreamEncoder",
+    "negotiate_encoding",
+]
@@ -0,0 +1,175 @@
+import time
+from collections.abc import Callable, Iterable
+
+from starlette.responses import JSONResponse
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.ports import MetricsRecorder
+
+HTTP_REQUESTS_SHED_TOTAL = "http_requests_shed_total"
+
+_UNMATCHED_ROUTE = "unmatched"
+
+
+class AimdLimit:
+    """Concurrency limit following latency: additive increase, multiplicative decrease.
+
+    While requests finish within ``latency_target`` and the limit is in use,
+    it grows by about one per ``limit`` completed requests. A slower request
+    shrinks it by ``backoff``, at most once per ``latency_target`` so that one
+    burst of slow responses does not collapse it to the minimum.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        latency_target: float = 0.5,
+        backoff: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limit.
+
+        Args:
+            initial_limit: Concurrent requests admitted before any sample
+            min_limit: Lowest limit, so some work always gets done
+            max_limit: Highest limit
+            latency_target: Latency in seconds above which the limit shrinks
+            backoff: Factor applied to the limit when it shrinks
+            clock: Monotonic time source
+        """
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_target = latency_target
+        self._backoff = backoff
+        self._clock = clock
+        self._decreased_at = float("-inf")
+        self.in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """Return the number of requests admitted concurrently."""
+        return int(self._limit)
+
+    def try_acquire(self) -> bool:
+        """Admit a request if the limit allows, every admission must be released."""
+        if self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float) -> None:
+        """Release an admitted request and adapt the limit to its latency."""
+        in_use = self.in_flight
+        self.in_flight -= 1
+        if latency > self._latency_target:
+            now = self._clock()
+            if now - self._decreased_at >= self._latency_target:
+                self._limit = max(self._min_limit, self._limit * self._backoff)
+                self._decreased_at = now
+        # Growing an unused limit would admit a burst the service never handled
+        elif in_use * 2 >= self._limit:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+
+class AdmissionControlMiddleware:
+    """Sheds load with a fast 503 once a route reaches its adaptive limit.
+
+    Every route, identified by method and path template, has its own
+    ``AimdLimit``, so one slow endpoint cannot starve the others. Rejected
+    requests get ``Retry-After`` instead of queueing in the event loop, which
+    keeps the latency of admitted requests bounded. A request counts against
+    the limit until its response starts, so long-lived streams do not hold a
+    slot. Paths under ``bypass_paths``, such as health checks and metrics,
+    are always admitted. Routes are read from the application on lifespan
+    startup, or on the first request if the server runs no lifespan.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit_factory: Callable[[], AimdLimit] = AimdLimit,
+        bypass_paths: Iterable[str] = ("/api/v1/health", "/metrics"),
+        retry_after_seconds: int = 1,
+        metrics: MetricsRecorder | None = None,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            limit_factory: Builds the limit of a route on its first request
+            bypass_paths: Path prefixes that are never limited
+            retry_after_seconds: Value of ``Retry-After`` on rejected requests
+            metrics: Recorder counting shed requests by route, if given
+        """
+        self._app = app
+        self._limit_factory = limit_factory
+        self._bypass_paths = tuple(bypass_paths)
+        self._retry_after = str(retry_after_seconds)
+        self._metrics = metrics
+        self._limits: dict[str, AimdLimit] = {}
+        self._routes: list[BaseRoute] | None = None
+
+    def limit_for(self, route: str) -> AimdLimit:
+        """Return the limit of a route, e.g. ``GET /api/v1/projects/{project_id}``."""
+        limit = self._limits.get(route)
+        if limit is None:
+            limit = self._limit_factory()
+            self._limits[route] = limit
+        return limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            self._routes = _routes(scope)
+        if scope["type"] != "http" or scope["path"].startswith(self._bypass_paths):
+            await self._app(scope, receive, send)
+            return
+
+        route = f"{scope['method']} {self._route(scope)}"
+        limit = self.limit_for(route)
+        if not limit.try_acquire():
+            if self._metrics is not None:
+                self._metrics.increment(
+                    HTTP_REQUESTS_SHED_TOTAL, labels={"route": route}
+                )
+            response = JSONResponse(
+                {"error": "overloaded", "message": "Server is overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": self._retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        released = False
+
+        async def send_releasing(message: Message) -> None:
+            nonlocal released
+            if message["type"] == "http.response.start" and not released:
+                released = True
+                limit.release(time.perf_counter() - started)
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_releasing)
+        finally:
+            if not released:
+                limit.release(time.perf_counter() - started)
+
+    def _route(self, scope: Scope) -> str:
+        if self._routes is None:
+            self._routes = _routes(scope)
+        for route in self._routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", None) or _UNMATCHED_ROUTE
+        return _UNMATCHED_ROUTE
+
+
+def _routes(scope: Scope) -> list[BaseRoute]:
+    # Included routers are copied into the application's routes with their
+    # prefix, so every route carries its full template
+    return list(getattr(scope.get("app"), "routes", []))
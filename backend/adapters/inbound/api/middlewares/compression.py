@@ -0,0 +1,208 @@
+import zlib
+from collections.abc import Callable, Collection, Mapping
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSIBLE_MEDIA_TYPES = frozenset(
+    {
+        "application/json",
+        "application/problem+json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/event-stream",
+        "text/html",
+        "text/plain",
+    }
+)
+
+
+class StreamEncoder(Protocol):
+    """Compresses a response body chunk by chunk."""
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk and flush it, so the client can decode it right away."""
+        ...
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Compresses responses with gzip when the client accepts it.
+
+    Complete bodies are compressed once they reach ``minimum_size``; streamed
+    bodies such as NDJSON exports and server-sent events are always
+    compressed, flushing after every chunk so each line or event reaches the
+    client as soon as it is produced. Only media types in the allowlist are
+    compressed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        media_types: Collection[str] = COMPRESSIBLE_MEDIA_TYPES,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            minimum_size: Smallest complete body, in bytes, worth compressing
+            gzip_level: zlib compression level (1-9)
+            media_types: Media types that are compressed
+        """
+        self._app = app
+        self._minimum_size = minimum_size
+        self._media_types = frozenset(media_types)
+        self._encoders: dict[str, Callable[[], StreamEncoder]] = {
+            "gzip": lambda: _GzipEncoder(gzip_level)
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self._app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self._encoders
+        )
+        if encoding is None:
+            await self._app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send,
+            encoding,
+            self._encoders[encoding],
+            self._minimum_size,
+            self._media_types,
+        )
+        await self._app(scope, receive, responder.send)
+
+
+def negotiate_encoding(
+    accept_encoding: str, supported: Mapping[str, object]
+) -> str | None:
+    """Pick the supported content coding the client rates highest.
+
+    Codings the client rates equally are chosen in the order of ``supported``.
+    Returns None when the client accepts none of them.
+    """
+    ratings: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        ratings[coding] = quality
+
+    best: str | None = None
+    best_quality = 0.0
+    for coding in supported:
+        quality = ratings.get(coding, ratings.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _CompressingResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        encoder_factory: Callable[[], StreamEncoder],
+        minimum_size: int,
+        media_types: frozenset[str],
+    ):
+        self._send = send
+        self._encoding = encoding
+        self._encoder_factory = encoder_factory
+        self._minimum_size = minimum_size
+        self._media_types = media_types
+        self._start: Message | None = None
+        self._encoder: StreamEncoder | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+            if not self._compressible(message):
+                self._passthrough = True
+                await self._send(message)
+        elif message["type"] == "http.response.body":
+            await self._send_body(message)
+        else:
+            await self._send(message)
+
+    async def _send_body(self, message: Message) -> None:
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._encoder is None:
+            assert self._start is not None
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+
+            self._encoder = self._encoder_factory()
+            headers = MutableHeaders(raw=self._start["headers"])
+            headers["Content-Encoding"] = self._encoding
+            headers.add_vary_header("Accept-Encoding")
+            # The compressed bytes differ, so the tag can only match weakly
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self._encoder.compress(body) + self._encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send(self._start)
+
+        body = self._encoder.compress(body)
+        if not more_body:
+            body += self._encoder.finish()
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    def _compressible(self, message: Message) -> bool:
+        status: int = message["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return media_type in self._media_types
@@ -0,0 +1,63 @@
+import time
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.ports import MetricsRecorder
+
+HTTP_REQUEST_DURATION_SECONDS = "http_request_duration_seconds"
+HTTP_REQUESTS_TOTAL = "http_requests_total"
+HTTP_REQUESTS_IN_FLIGHT = "http_requests_in_flight"
+
+# Requests matching no route share one label, so scanners cannot blow up cardinality
+_UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records latency, status counts and in-flight requests per route.
+
+    Plain ASGI middleware: it wraps ``send`` to catch the status code instead
+    of buffering requests and responses. Routes are labelled by their path
+    template, never the concrete path.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRecorder):
+        self._app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = {"method": method}
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self._metrics.add_to_gauge(HTTP_REQUESTS_IN_FLIGHT, 1, in_flight)
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            labels = {
+                "method": method,
+                "route": _route(scope),
+                "status": str(status),
+            }
+            self._metrics.observe(
+                HTTP_REQUEST_DURATION_SECONDS, time.perf_counter() - started, labels
+            )
+            self._metrics.increment(HTTP_REQUESTS_TOTAL, labels=labels)
+            self._metrics.add_to_gauge(HTTP_REQUESTS_IN_FLIGHT, -1, in_flight)
+
+
+def _route(scope: Scope) -> str:
+    # Set by the router once a route matches; included routers carry their prefix
+    route: BaseRoute | None = scope.get("route")
+    return getattr(route, "path", None) or _UNMATCHED_ROUTE
@@ -0,0 +1,164 @@
+import asyncio
+import hmac
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+PROFILE_HEADER = b"x-profile-token"
+
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class StackSampler:
+    """Samples the call stack of one thread from a background thread.
+
+    Sampling reads ``sys._current_frames()`` every ``interval_seconds`` and
+    counts identical stacks, so the sampled code is never traced or slowed
+    down beyond the occasional GIL hand-off. Stacks are kept root first, in
+    the collapsed format flamegraph.pl and speedscope read.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval_seconds: float = 0.005,
+        within: FrameType | None = None,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            thread_id: Identifier of the thread to sample
+            interval_seconds: Time between two samples
+            within: Only stacks running through this frame are kept, e.g. the
+                frame of a coroutine, if set
+        """
+        self._thread_id = thread_id
+        self._interval_seconds = interval_seconds
+        self._within = within
+        self._stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread to finish."""
+        self._stopped.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks, one ``stack count`` per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.items())
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None and self._keeps(frame):
+                self._stacks[_collapse(frame)] += 1
+
+    def _keeps(self, frame: FrameType) -> bool:
+        if self._within is None:
+            return True
+        current: FrameType | None = frame
+        while current is not None:
+            if current is self._within:
+                return True
+            current = current.f_back
+        return False
+
+
+class ProfilingMiddleware:
+    """Profiles single requests with a ``StackSampler`` on demand.
+
+    A request is profiled when it carries the admin token in the
+    ``X-Profile-Token`` header or is picked by the sampling rate. The profile
+    of each request is written as a ``.collapsed`` file to the output
+    directory. The event loop thread is sampled, but only stacks running
+    through this request's coroutine are kept: other requests the loop serves
+    meanwhile are left out, and so is work the request hands to other tasks,
+    e.g. the body of a streaming response. One request is profiled at a time
+    to bound the sampling overhead. The application only adds the middleware
+    when profiling is configured, so disabled profiling costs nothing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str | Path,
+        token: str | None = None,
+        sample_rate: float = 0.0,
+        interval_seconds: float = 0.005,
+        random_source: Callable[[], float] = random.random,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            directory: Directory the profiles are written to
+            token: Admin token activating profiling, header activation is off if None
+            sample_rate: Share (0-1) of requests profiled without the header
+            interval_seconds: Time between two stack samples
+            random_source: Returns a float in [0, 1), used for the sampling rate
+        """
+        self._app = app
+        self._directory = Path(directory)
+        self._token = token.encode() if token else None
+        self._sample_rate = sample_rate
+        self._interval_seconds = interval_seconds
+        self._random = random_source
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._selected(scope):
+            await self._app(scope, receive, send)
+            return
+
+        self._active = True
+        # Coroutine frames outlive suspensions, so this frame is on the loop
+        # thread's stack exactly while the request's own code runs
+        sampler = StackSampler(
+            threading.get_ident(), self._interval_seconds, within=sys._getframe()
+        )
+        sampler.start()
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            sampler.stop()
+            self._active = False
+            await asyncio.to_thread(self._write, scope, sampler.collapsed())
+
+    def _selected(self, scope: Scope) -> bool:
+        if self._token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self._token)
+        return self._sample_rate > 0 and self._random() < self._sample_rate
+
+    def _write(self, scope: Scope, profile: str) -> None:
+        name = _UNSAFE_FILENAME_CHARACTERS.sub("_", f"{scope['method']}{scope['path']}")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{time.time_ns()}-{name}.collapsed"
+        path.write_text(profile)
+
+
+def _collapse(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
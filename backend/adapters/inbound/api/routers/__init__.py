@@ -1,3 +1,6 @@
+from .events import router as events_router
 from .health import router as health_router
+from .metrics import router as metrics_router
+from .projects import router as projects_router
 
-__all__ = ["health_router"]
+__all__ = ["events_router", "health_router", "metrics_router", "projects_router"]
@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from adapters.inbound.api.dependencies import get_event_subscriber
+from adapters.inbound.api.sse import SSE_MEDIA_TYPE, sse_response
+from application.ports import EventSubscriber
+
+router = APIRouter(tags=["events"])
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+)
+async def stream_events(
+    events: Annotated[EventSubscriber, Depends(get_event_subscriber)],
+) -> StreamingResponse:
+    """Push the domain events committed after subscribing as server-sent events.
+
+    Events come from the hub of the serving process, so a client only sees
+    events committed by that process: not those of other web server workers,
+    nor those of the job worker, e.g. projects created in bulk.
+    """
+    return sse_response(events.subscribe())
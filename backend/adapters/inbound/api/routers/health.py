@@ -1,8 +1,12 @@
 from datetime import UTC, datetime
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel
 
+from adapters.inbound.api.dependencies import get_health_monitor
+from application.health import HealthMonitor
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -15,6 +19,8 @@ class HealthResponse(BaseModel):
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+_LIVE = b'{"status":"alive"}'
+
 
 @router.get("/")
 async def health_check() -> HealthResponse:
@@ -29,3 +35,26 @@ async def health_check() -> HealthResponse:
         service="review-genie-backend",
         version="0.1.0",
     )
+
+
+@router.get("/live")
+async def liveness() -> Response:
+    """Liveness probe, answers as long as the event loop serves requests."""
+    return Response(content=_LIVE, media_type="application/json")
+
+
+@router.get("/ready")
+async def readiness(
+    monitor: Annotated[HealthMonitor, Depends(get_health_monitor)],
+) -> Response:
+    """Readiness probe, answered from the cached results of background probes.
+
+    Returns:
+        The status and per-dependency latency, with 503 while not ready.
+    """
+    report = monitor.report()
+    return Response(
+        content=report.model_dump_json(),
+        status_code=200 if report.ready else 503,
+        media_type="application/json",
+    )
@@ -0,0 +1,18 @@
+from collections.abc import Callable
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+
+from adapters.inbound.api.dependencies import get_metrics_exposition
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(
+    exposition: Annotated[Callable[[], bytes], Depends(get_metrics_exposition)],
+) -> Response:
+    """Serve the collected metrics in the Prometheus text format."""
+    return Response(content=exposition(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,207 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from adapters.inbound.api.cache import (
+    PROJECTS_TAG,
+    CachedResponse,
+    ResponseCache,
+    project_tag,
+    request_cache_key,
+)
+from adapters.inbound.api.conditional import (
+    is_not_modified,
+    json_response,
+    not_modified,
+    strong_etag,
+)
+from adapters.inbound.api.dependencies import (
+    get_client_id,
+    get_command_bus,
+    get_list_projects_handler,
+    get_project_handler,
+    get_response_cache,
+)
+from adapters.inbound.api.streaming import NDJSON_MEDIA_TYPE, ndjson_response
+from application.commands.bus import CommandBus
+from application.commands.commands import CreateProjectCommand
+from application.queries.handlers.get_project_query_handler import (
+    GetProjectQueryHandler,
+)
+from application.queries.handlers.list_projects_query_handler import (
+    ListProjectsQueryHandler,
+)
+from application.queries.queries import GetProjectQuery, ListProjectsQuery
+from domain.project.aggregate import Project
+
+
+class CreateProjectRequest(BaseModel):
+    """Project creation request model."""
+
+    url: str
+    rules: list[str] = []
+
+
+class ProjectResponse(BaseModel):
+    """Project response model."""
+
+    id: str
+    url: str
+    provider: str
+    owner: str
+    repository_id: str
+    rules: list[str]
+    pull_request_policy: str
+    retry_limit_type: str
+    retry_limit_value: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectResponse":
+        return cls(
+            id=project.id(),
+            url=str(project.url),
+            provider=str(project.provider),
+            owner=str(project.owner),
+            repository_id=str(project.repo_id),
+            rules=list(project.rules.rules),
+            pull_request_policy=project.policies.pull_request_policy.value,
+            retry_limit_type=project.policies.retry_limit_type.value,
+            retry_limit_value=project.policies.retry_limit_value,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
+
+
+_project_list = TypeAdapter(list[ProjectResponse])
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+@router.post("/", status_code=201, response_model=ProjectResponse)
+async def create_project(
+    body: CreateProjectRequest,
+    request: Request,
+    bus: Annotated[CommandBus, Depends(get_command_bus)],
+    projects: Annotated[GetProjectQueryHandler, Depends(get_project_handler)],
+    client_id: Annotated[str | None, Depends(get_client_id)],
+    idempotency_key: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Start tracking a repository.
+
+    Returns:
+        The created project, with its location and entity tag.
+    """
+    project_id = await bus.dispatch(
+        CreateProjectCommand(
+            url=body.url,
+            rules=body.rules,
+            idempotency_key=idempotency_key,
+            client_id=client_id,
+        )
+    )
+    project = await projects.handle(GetProjectQuery(project_id=project_id))
+    location = request.url_for("get_project", project_id=project_id).path
+    return json_response(
+        _encode_project(project),
+        _project_etag(project),
+        status_code=201,
+        headers={"Location": location},
+    )
+
+
+@router.get("/", response_model=list[ProjectResponse])
+async def list_projects(
+    request: Request,
+    handler: Annotated[ListProjectsQueryHandler, Depends(get_list_projects_handler)],
+    cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Response:
+    """List one page of tracked projects, oldest first.
+
+    The next page, if any, is linked by the ``Link`` header. Answers 304
+    while none of the page's projects changed.
+    """
+
+    async def load() -> CachedResponse:
+        page = await handler.handle(ListProjectsQuery(limit=limit, cursor=cursor))
+        projects = page.items
+        headers = {}
+        if page.next_cursor is not None:
+            headers["Link"] = _next_page_link(request, page.next_cursor)
+        return CachedResponse(
+            body=_project_list.dump_json(
+                [ProjectResponse.from_project(project) for project in projects]
+            ),
+            etag=strong_etag(
+                *(
+                    f"{project.id()}@{project.updated_at.isoformat()}"
+                    for project in projects
+                )
+            ),
+            headers=headers,
+        )
+
+    cached = await cache.get_or_load(request_cache_key(request), [PROJECTS_TAG], load)
+    if is_not_modified(request, cached.etag):
+        return not_modified(cached.etag)
+    return json_response(cached.body, cached.etag, headers=cached.headers)
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def stream_projects(
+    handler: Annotated[ListProjectsQueryHandler, Depends(get_list_projects_handler)],
+) -> StreamingResponse:
+    """Stream every tracked project as newline-delimited JSON, for exports."""
+    return ndjson_response(
+        handler.stream(ListProjectsQuery()),
+        _encode_project,
+    )
+
+
+@router.get("/{project_id}", response_model=ProjectResponse)
+async def get_project(
+    project_id: str,
+    request: Request,
+    handler: Annotated[GetProjectQueryHandler, Depends(get_project_handler)],
+    cache: Annotated[ResponseCache, Depends(get_response_cache)],
+) -> Response:
+    """Return a project, answering 304 while it is unchanged."""
+
+    async def load() -> CachedResponse:
+        project = await handler.handle(GetProjectQuery(project_id=project_id))
+        return CachedResponse(
+            body=_encode_project(project), etag=_project_etag(project)
+        )
+
+    cached = await cache.get_or_load(
+        request_cache_key(request), [project_tag(project_id)], load
+    )
+    if is_not_modified(request, cached.etag):
+        return not_modified(cached.etag)
+    return json_response(cached.body, cached.etag)
+
+
+def _next_page_link(request: Request, cursor: str) -> str:
+    url = request.url.include_query_params(cursor=cursor)
+    return f'<{url.path}?{url.query}>; rel="next"'
+
+
+def _project_etag(project: Project) -> str:
+    return strong_etag(project.id(), project.updated_at.isoformat())
+
+
+def _encode_project(project: Project) -> bytes:
+    return ProjectResponse.from_project(project).model_dump_json().encode()
@@ -0,0 +1,54 @@
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from application.ports import EventSubscription
+from domain.event import DomainEvent
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def sse_response(
+    subscription: EventSubscription, heartbeat_seconds: float = 15.0
+) -> StreamingResponse:
+    """Stream the events of a subscription as server-sent events.
+
+    A comment is sent when no event arrived for ``heartbeat_seconds`` so that
+    proxies keep the connection open. An evicted subscriber receives an
+    ``evicted`` event and the stream ends; the client should reload its state
+    and reconnect.
+    """
+    return StreamingResponse(
+        _messages(subscription, heartbeat_seconds),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    """Encode a domain event as a server-sent event message."""
+    return (
+        f"id: {event.id}\nevent: {event.type}\ndata: ".encode()
+        + event.model_dump_json().encode()
+        + b"\n\n"
+    )
+
+
+async def _messages(
+    subscription: EventSubscription, heartbeat_seconds: float
+) -> AsyncIterator[bytes]:
+    try:
+        yield b"retry: 3000\n\n"
+        while True:
+            event = await subscription.get(timeout=heartbeat_seconds)
+            if event is not None:
+                yield encode_event(event)
+            elif subscription.evicted:
+                yield b"event: evicted\ndata: {}\n\n"
+                return
+            elif subscription.closed:
+                return
+            else:
+                yield b": keep-alive\n\n"
+    finally:
+        subscription.close()
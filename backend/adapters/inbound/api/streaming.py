@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_response[T](
+    items: AsyncIterable[T],
+    encode: Callable[[T], bytes],
+    flush_bytes: int = 64 * 1024,
+) -> StreamingResponse:
+    """Stream items as newline-delimited JSON.
+
+    Lines are written in chunks of about ``flush_bytes``, and the next chunk
+    is produced only once the server has sent the previous one. A slow client
+    therefore pauses the iteration instead of growing a buffer.
+
+    Args:
+        items: Items to write, typically streamed from a repository
+        encode: Serializes one item to JSON without a trailing newline
+        flush_bytes: Size at which buffered lines are written out
+    """
+    return StreamingResponse(
+        _ndjson_chunks(items, encode, flush_bytes), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+async def _ndjson_chunks[T](
+    items: AsyncIterable[T], encode: Callable[[T], bytes], flush_bytes: int
+) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    first = True
+    async for item in items:
+        buffer += encode(item)
+        buffer += b"\n"
+        # The first line goes out at once to keep the time to first byte low
+        if first or len(buffer) >= flush_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+            first = False
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,4 @@
+from .fan_out import FanOutEventPublisher
+from .hub import InMemoryEventHub, Subscription
+
+__all__ = ["FanOutEventPublisher", "InMemoryEventHub", "Subscription"]
@@ -0,0 +1,19 @@
+from collections.abc import Iterable, Sequence
+
+from application.ports import EventPublisher
+from domain.event import DomainEvent
+
+
+class FanOutEventPublisher:
+    """Publishes committed events to several publishers, in the given order.
+
+    Order matters when one publisher must see an event before the others,
+    e.g. a cache has to drop stale entries before live subscribers react.
+    """
+
+    def __init__(self, publishers: Iterable[EventPublisher]):
+        self._publishers = list(publishers)
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        for publisher in self._publishers:
+            await publisher.publish(events)
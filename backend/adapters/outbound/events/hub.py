@@ -0,0 +1,126 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+from types import TracebackType
+from typing import Self
+
+from domain.event import DomainEvent
+
+type EventFilter = Callable[[DomainEvent], bool]
+
+
+class Subscription:
+    """Events delivered to one subscriber of the hub, in publication order.
+
+    Iterating ends when the subscription is closed. A subscriber that falls
+    behind by more than its queue size is evicted: its pending events are
+    dropped and ``evicted`` is set, so it can resynchronise and subscribe again.
+    """
+
+    def __init__(self, hub: "InMemoryEventHub", accepts: EventFilter, max_pending: int):
+        self._hub = hub
+        self._accepts = accepts
+        self._queue: asyncio.Queue[DomainEvent | None] = asyncio.Queue(max_pending)
+        self._closed = False
+        self.evicted = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __aiter__(self) -> AsyncIterator[DomainEvent]:
+        return self._iterate()
+
+    async def get(self, timeout: float | None = None) -> DomainEvent | None:
+        """Wait for the next event.
+
+        Returns:
+            The event, or None when the timeout elapsed or the subscription closed
+        """
+        if self._closed and self._queue.empty():
+            return None
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._queue.get()
+        except TimeoutError:
+            return None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription is closed and every event was consumed."""
+        return self._closed and self._queue.empty()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if self._closed:
+            return
+        self._closed = True
+        self._hub._unsubscribe(self)
+        self._wake()
+
+    def _offer(self, event: DomainEvent) -> None:
+        if not self._accepts(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._evict()
+
+    def _evict(self) -> None:
+        self.evicted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.close()
+
+    def _wake(self) -> None:
+        # Wakes a pending get; the queue has room since events are never added
+        # after closing and eviction empties it
+        if not self._queue.full():
+            self._queue.put_nowait(None)
+
+    async def _iterate(self) -> AsyncIterator[DomainEvent]:
+        while (event := await self.get()) is not None:
+            yield event
+
+
+class InMemoryEventHub:
+    """In-process fan-out of committed domain events to live subscribers.
+
+    Publishing never waits for subscribers: every subscriber has a bounded
+    queue, and one that cannot keep up is evicted instead of slowing down the
+    publisher or growing without bound. Events are not persisted, subscribers
+    only see events published while they are subscribed.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        """Initialize the hub.
+
+        Args:
+            max_pending: Events a subscriber may fall behind before eviction
+        """
+        self._max_pending = max_pending
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self, accepts: EventFilter = lambda _: True) -> Subscription:
+        """Subscribe to events matching the filter."""
+        subscription = Subscription(self, accepts, self._max_pending)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        for event in events:
+            for subscription in list(self._subscriptions):
+                subscription._offer(event)
+
+    def subscriber_count(self) -> int:
+        """Return the number of live subscriptions."""
+        return len(self._subscriptions)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
@@ -0,0 +1,3 @@
+from .in_memory import InMemoryIdempotencyStore
+
+__all__ = ["InMemoryIdempotencyStore"]
@@ -0,0 +1,41 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from application.ports import IdempotencyStore, StoredCommandOutcome
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Process-local idempotency store with per-entry expiry.
+
+    Bounded by ``max_entries``; the oldest entry is evicted first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, StoredCommandOutcome]] = (
+            OrderedDict()
+        )
+
+    async def get(self, key: str) -> StoredCommandOutcome | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, outcome = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return outcome
+
+    async def put(
+        self, key: str, outcome: StoredCommandOutcome, ttl_seconds: float
+    ) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (self._clock() + ttl_seconds, outcome)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,3 @@
+from .in_memory import InMemoryJobQueue
+
+__all__ = ["InMemoryJobQueue"]
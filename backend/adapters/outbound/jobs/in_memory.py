@@ -0,0 +1,116 @@
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+
+from application.ports import Job, JobQueue, JobStatus
+
+
+class InMemoryJobQueue(JobQueue):
+    """Process-local job queue for development and tests.
+
+    Mirrors the semantics of the PostgreSQL queue but is lost on restart and
+    cannot be shared between processes.
+    """
+
+    durable = False
+
+    def __init__(self, clock: Callable[[], datetime] = lambda: datetime.now(UTC)):
+        self._clock = clock
+        self._entries: dict[uuid.UUID, _Entry] = {}
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: dict[str, Any],
+        run_at: datetime | None = None,
+        max_attempts: int = 5,
+    ) -> Job:
+        job = Job(
+            id=uuid.uuid4(),
+            job_type=job_type,
+            payload=payload,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_at=run_at or self._clock(),
+        )
+        self._entries[job.id] = _Entry(job=job)
+        return job
+
+    async def claim(
+        self, job_type: str, limit: int, visibility_timeout: float
+    ) -> list[Job]:
+        now = self._clock()
+        due = sorted(
+            (
+                entry
+                for entry in self._entries.values()
+                if entry.job.job_type == job_type and entry.is_claimable(now)
+            ),
+            key=lambda entry: entry.job.run_at,
+        )[:limit]
+
+        claimed: list[Job] = []
+        for entry in due:
+            entry.job = entry.job.model_copy(
+                update={"attempts": entry.job.attempts + 1}
+            )
+            entry.locked_until = now + timedelta(seconds=visibility_timeout)
+            claimed.append(entry.job)
+        return claimed
+
+    async def complete(self, job: Job) -> bool:
+        entry = self._leased(job)
+        if entry is None:
+            return False
+        entry.status = JobStatus.DONE
+        entry.locked_until = None
+        return True
+
+    async def retry(self, job: Job, run_at: datetime, error: str) -> bool:
+        entry = self._leased(job)
+        if entry is None:
+            return False
+        entry.job = entry.job.model_copy(update={"run_at": run_at})
+        entry.locked_until = None
+        entry.last_error = error
+        return True
+
+    async def bury(self, job: Job, error: str) -> bool:
+        entry = self._leased(job)
+        if entry is None:
+            return False
+        entry.status = JobStatus.DEAD
+        entry.locked_until = None
+        entry.last_error = error
+        return True
+
+    def status(self, job_id: uuid.UUID) -> JobStatus:
+        """Return the status of a job."""
+        return self._entries[job_id].status
+
+    def last_error(self, job_id: uuid.UUID) -> str | None:
+        """Return the error of the job's last failed attempt."""
+        return self._entries[job_id].last_error
+
+    def _leased(self, job: Job) -> "_Entry | None":
+        entry = self._entries[job.id]
+        if entry.status is not JobStatus.PENDING or entry.job.attempts != job.attempts:
+            return None
+        return entry
+
+
+class _Entry(BaseModel):
+    job: Job
+    status: JobStatus = JobStatus.PENDING
+    locked_until: datetime | None = None
+    last_error: str | None = None
+
+    def is_claimable(self, now: datetime) -> bool:
+        return (
+            self.status is JobStatus.PENDING
+            and self.job.run_at <= now
+            and (self.locked_until is None or self.locked_until <= now)
+        )
@@ -0,0 +1,9 @@
+from .prometheus import render_prometheus
+from .registry import DEFAULT_BUCKETS, HistogramSnapshot, InMemoryMetricsRegistry
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "HistogramSnapshot",
+    "InMemoryMetricsRegistry",
+    "render_prometheus",
+]
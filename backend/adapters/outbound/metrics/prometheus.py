@@ -0,0 +1,46 @@
+import math
+
+from .registry import InMemoryMetricsRegistry, LabelSet
+
+
+def render_prometheus(registry: InMemoryMetricsRegistry) -> bytes:
+    """Render the registry in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for name, series in sorted(registry.counters().items()):
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(series.items()):
+            lines.append(f"{name}{_labels(labels)} {_value(value)}")
+
+    for name, series in sorted(registry.gauges().items()):
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in sorted(series.items()):
+            lines.append(f"{name}{_labels(labels)} {_value(value)}")
+
+    for name, histograms in sorted(registry.histograms().items()):
+        lines.append(f"# TYPE {name} histogram")
+        for labels, snapshot in sorted(histograms.items()):
+            for bound, count in snapshot.buckets:
+                bucket_labels = (*labels, ("le", _value(bound)))
+                lines.append(f"{name}_bucket{_labels(bucket_labels)} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {_value(snapshot.sum)}")
+            lines.append(f"{name}_count{_labels(labels)} {snapshot.count}")
+
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
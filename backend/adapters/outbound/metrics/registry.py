@@ -0,0 +1,116 @@
+import bisect
+from collections.abc import Mapping, Sequence
+
+from pydantic import BaseModel
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+type LabelSet = tuple[tuple[str, str], ...]
+
+
+class HistogramSnapshot(BaseModel):
+    """Cumulative bucket counts of one labelled histogram."""
+
+    buckets: list[tuple[float, int]]
+    count: int
+    sum: float
+
+
+class InMemoryMetricsRegistry:
+    """Process-local metrics store implementing ``MetricsRecorder``.
+
+    Samples are aggregated on write into counters, gauges and fixed-bucket
+    histograms, so recording is a dictionary lookup and a few additions.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize the registry.
+
+        Args:
+            buckets: Upper bounds of the histogram buckets, in ascending order
+        """
+        self._bounds = tuple(buckets)
+        self._counters: dict[str, dict[LabelSet, float]] = {}
+        self._gauges: dict[str, dict[LabelSet, float]] = {}
+        self._histograms: dict[str, dict[LabelSet, _Histogram]] = {}
+
+    def observe(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = _label_set(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram(self._bounds)
+        histogram.observe(value)
+
+    def increment(
+        self, name: str, amount: float = 1.0, labels: Mapping[str, str] | None = None
+    ) -> None:
+        series = self._counters.setdefault(name, {})
+        key = _label_set(labels)
+        series[key] = series.get(key, 0.0) + amount
+
+    def add_to_gauge(
+        self, name: str, amount: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        series = self._gauges.setdefault(name, {})
+        key = _label_set(labels)
+        series[key] = series.get(key, 0.0) + amount
+
+    def counter(self, name: str, labels: Mapping[str, str] | None = None) -> float:
+        """Return the value of a counter, zero if never incremented."""
+        return self._counters.get(name, {}).get(_label_set(labels), 0.0)
+
+    def gauge(self, name: str, labels: Mapping[str, str] | None = None) -> float:
+        """Return the value of a gauge, zero if never set."""
+        return self._gauges.get(name, {}).get(_label_set(labels), 0.0)
+
+    def histogram(
+        self, name: str, labels: Mapping[str, str] | None = None
+    ) -> HistogramSnapshot | None:
+        """Return the snapshot of a histogram, None if never observed."""
+        histogram = self._histograms.get(name, {}).get(_label_set(labels))
+        return None if histogram is None else histogram.snapshot()
+
+    def counters(self) -> dict[str, dict[LabelSet, float]]:
+        """Return every counter series, by metric name and label set."""
+        return {name: dict(series) for name, series in self._counters.items()}
+
+    def gauges(self) -> dict[str, dict[LabelSet, float]]:
+        """Return every gauge series, by metric name and label set."""
+        return {name: dict(series) for name, series in self._gauges.items()}
+
+    def histograms(self) -> dict[str, dict[LabelSet, HistogramSnapshot]]:
+        """Return a snapshot of every histogram series."""
+        return {
+            name: {key: histogram.snapshot() for key, histogram in series.items()}
+            for name, series in self._histograms.items()
+        }
+
+
+class _Histogram:
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative: list[tuple[float, int]] = []
+        total = 0
+        for bound, count in zip(
+            (*self._bounds, float("inf")), self._counts, strict=True
+        ):
+            total += count
+            cumulative.append((bound, total))
+        return HistogramSnapshot(buckets=cumulative, count=total, sum=self._sum)
+
+
+def _label_set(labels: Mapping[str, str] | None) -> LabelSet:
+    if not labels:
+        return ()
+    return tuple(sorted(labels.items()))
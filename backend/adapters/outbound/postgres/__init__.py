@@ -0,0 +1,31 @@
+from .health import PostgresProbe
+from .jobs import PostgresJobQueue, jobs_table
+from .metadata import metadata
+from .projects import project_from_row, project_to_row, projects_table
+from .read_repository import PostgresProjectReadRepository
+from .specifications import (
+    PostgresAllProjectsSpecification,
+    PostgresExistingProjectsSpecification,
+    PostgresProjectAlreadyExistsSpecification,
+    PostgresProjectByIdSpecification,
+    ProjectSelect,
+)
+from .unit_of_work import PostgresQuery, PostgresUnitOfWork
+
+__all__ = [
+    "PostgresAllProjectsSpecification",
+    "PostgresExistingProjectsSpecification",
+    "PostgresJobQueue",
+    "PostgresProbe",
+    "PostgresProjectAlreadyExistsSpecification",
+    "PostgresProjectByIdSpecification",
+    "PostgresProjectReadRepository",
+    "PostgresQuery",
+    "PostgresUnitOfWork",
+    "ProjectSelect",
+    "jobs_table",
+    "metadata",
+    "project_from_row",
+    "project_to_row",
+    "projects_table",
+]
@@ -0,0 +1,20 @@
+from sqlalchemy import Executable, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class PostgresProbe:
+    """Checks that a pooled connection can run a statement."""
+
+    def __init__(self, engine: AsyncEngine, statement: Executable | None = None):
+        """Initialize the probe.
+
+        Args:
+            engine: Database engine
+            statement: Statement to run, ``SELECT 1`` by default
+        """
+        self._engine = engine
+        self._statement = select(1) if statement is None else statement
+
+    async def check(self) -> None:
+        async with self._engine.connect() as connection:
+            await connection.execute(self._statement)
@@ -0,0 +1,165 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    Update,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from application.ports import Job, JobQueue, JobStatus
+
+from .metadata import metadata
+
+jobs_table = Table(
+    "jobs",
+    metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("job_type", String(100), nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("status", String(20), nullable=False, default=JobStatus.PENDING.value),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("max_attempts", Integer, nullable=False),
+    Column("run_at", DateTime(timezone=True), nullable=False),
+    Column("locked_until", DateTime(timezone=True)),
+    Column("last_error", Text),
+    Column(
+        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    Index(
+        "ix_jobs_pending_by_type",
+        "job_type",
+        "run_at",
+        postgresql_where="status = 'pending'",
+    ),
+)
+
+
+class PostgresJobQueue(JobQueue):
+    """Durable job queue on a PostgreSQL table.
+
+    Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any
+    number of worker processes poll the same table without blocking each other
+    or claiming the same job twice.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: dict[str, Any],
+        run_at: datetime | None = None,
+        max_attempts: int = 5,
+    ) -> Job:
+        job = Job(
+            id=uuid.uuid4(),
+            job_type=job_type,
+            payload=payload,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_at=run_at or datetime.now(UTC),
+        )
+        async with self._engine.begin() as connection:
+            await connection.execute(
+                insert(jobs_table).values(
+                    id=job.id,
+                    job_type=job.job_type,
+                    payload=job.payload,
+                    status=JobStatus.PENDING.value,
+                    attempts=0,
+                    max_attempts=job.max_attempts,
+                    run_at=job.run_at,
+                )
+            )
+        return job
+
+    async def claim(
+        self, job_type: str, limit: int, visibility_timeout: float
+    ) -> list[Job]:
+        async with self._engine.begin() as connection:
+            result = await connection.execute(
+                claim_statement(job_type, limit, visibility_timeout)
+            )
+            return [Job.model_validate(row._asdict()) for row in result]
+
+    async def complete(self, job: Job) -> bool:
+        return await self._update(job, status=JobStatus.DONE.value, locked_until=None)
+
+    async def retry(self, job: Job, run_at: datetime, error: str) -> bool:
+        return await self._update(
+            job, run_at=run_at, locked_until=None, last_error=error
+        )
+
+    async def bury(self, job: Job, error: str) -> bool:
+        return await self._update(
+            job, status=JobStatus.DEAD.value, locked_until=None, last_error=error
+        )
+
+    async def _update(self, job: Job, **values: Any) -> bool:
+        async with self._engine.begin() as connection:
+            result = await connection.execute(lease_update_statement(job, **values))
+            return result.rowcount == 1
+
+
+def lease_update_statement(job: Job, **values: Any) -> Update:
+    """Build the update of a claimed job, matching only while its lease is held.
+
+    Another claim of the job counts another attempt, so an update from the
+    worker of an earlier claim matches no row.
+    """
+    return (
+        update(jobs_table)
+        .where(
+            jobs_table.c.id == job.id,
+            jobs_table.c.attempts == job.attempts,
+            jobs_table.c.status == JobStatus.PENDING.value,
+        )
+        .values(**values)
+    )
+
+
+def claim_statement(job_type: str, limit: int, visibility_timeout: float) -> Update:
+    """Build the statement claiming due jobs, skipping rows locked by other workers."""
+    now = func.now()
+    due = (
+        select(jobs_table.c.id)
+        .where(
+            jobs_table.c.status == JobStatus.PENDING.value,
+            jobs_table.c.job_type == job_type,
+            jobs_table.c.run_at <= now,
+            or_(jobs_table.c.locked_until.is_(None), jobs_table.c.locked_until <= now),
+        )
+        .order_by(jobs_table.c.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(jobs_table)
+        .where(jobs_table.c.id.in_(due.scalar_subquery()))
+        .values(
+            attempts=jobs_table.c.attempts + 1,
+            locked_until=now + timedelta(seconds=visibility_timeout),
+        )
+        .returning(
+            jobs_table.c.id,
+            jobs_table.c.job_type,
+            jobs_table.c.payload,
+            jobs_table.c.attempts,
+            jobs_table.c.max_attempts,
+            jobs_table.c.run_at,
+        )
+    )
@@ -0,0 +1,79 @@
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Index, Integer, RowMapping, String, Table
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.sql.dml import ReturningInsert
+
+from domain.project import value_objects as vo
+from domain.project.aggregate import Project
+
+from .metadata import metadata
+
+projects_table = Table(
+    "projects",
+    metadata,
+    Column("id", String(255), primary_key=True),
+    Column("provider", String(20), nullable=False),
+    Column("owner", String(100), nullable=False),
+    Column("repository_id", String(100), nullable=False),
+    Column("url", String(500), nullable=False),
+    Column("rules", JSONB, nullable=False),
+    Column("pull_request_policy", String(30), nullable=False),
+    Column("retry_limit_type", String(20), nullable=False),
+    Column("retry_limit_value", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    # Listings page through projects in this order
+    Index("ix_projects_created_at_id", "created_at", "id"),
+)
+
+
+def insert_projects_statement() -> ReturningInsert[tuple[str]]:
+    """Build the insert of new projects, run with one parameter set per project.
+
+    Projects whose id is already taken are skipped rather than failing the
+    transaction; only the ids of the inserted projects are returned, so the
+    caller can tell which ones conflicted.
+    """
+    return (
+        insert(projects_table)
+        .on_conflict_do_nothing(index_elements=[projects_table.c.id])
+        .returning(projects_table.c.id)
+    )
+
+
+def project_to_row(project: Project) -> dict[str, Any]:
+    """Map a project to a row of the projects table."""
+    return {
+        "id": project.id(),
+        "provider": str(project.provider),
+        "owner": str(project.owner),
+        "repository_id": str(project.repo_id),
+        "url": str(project.url),
+        "rules": list(project.rules.rules),
+        "pull_request_policy": project.policies.pull_request_policy.value,
+        "retry_limit_type": project.policies.retry_limit_type.value,
+        "retry_limit_value": project.policies.retry_limit_value,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+    }
+
+
+def project_from_row(row: RowMapping | Mapping[str, Any]) -> Project:
+    """Rebuild a project from a row of the projects table."""
+    return Project(
+        project_id=vo.ProjectId(row["id"]),
+        repo_id=vo.RepositoryId(row["repository_id"]),
+        provider=vo.Provider(vo.ProviderType(row["provider"])),
+        policies=vo.Policies(
+            pull_request_policy=vo.PullRequestPolicy(row["pull_request_policy"]),
+            retry_limit_type=vo.RetryLimitType(row["retry_limit_type"]),
+            retry_limit_value=row["retry_limit_value"],
+        ),
+        rules=vo.Rules(list(row["rules"])),
+        url=vo.URL(row["url"]),
+        owner=vo.Owner(row["owner"]),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
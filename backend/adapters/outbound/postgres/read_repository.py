@@ -0,0 +1,53 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domain.exception import EntityNotFoundError
+from domain.ports import ReadRepository
+from domain.ports.specifications import Specification
+from domain.project.aggregate import Project
+
+from .projects import project_from_row
+from .specifications import ProjectSelect
+from .unit_of_work import PostgresQuery
+
+
+class PostgresProjectReadRepository(ReadRepository[Project]):
+    """Reads projects outside of a unit of work, one pooled connection per query."""
+
+    def __init__(self, engine: AsyncEngine, stream_batch_size: int = 500):
+        """Initialize the repository.
+
+        Args:
+            engine: Database engine
+            stream_batch_size: Rows fetched per round trip when streaming
+        """
+        self._engine = engine
+        self._stream_batch_size = stream_batch_size
+
+    async def find_one(self, specification: Specification[Any]) -> Project:
+        projects = await self.find_all(specification)
+        if not projects:
+            raise EntityNotFoundError()
+        return projects[0]
+
+    async def find_all(self, specification: Specification[Any]) -> list[Project]:
+        query: PostgresQuery[list[Project]] = specification.to_query()
+        async with self._engine.connect() as connection:
+            return await query(connection)
+
+    async def stream(self, specification: Specification[Any]) -> AsyncIterator[Project]:
+        """Iterate over matching projects through a server-side cursor.
+
+        Rows are fetched in batches as the consumer advances, so memory stays
+        constant however many projects match.
+        """
+        query = specification.to_query()
+        if not isinstance(query, ProjectSelect):
+            raise TypeError(f"Cannot stream {type(specification).__name__}")
+        statement = query.statement.execution_options(yield_per=self._stream_batch_size)
+        async with self._engine.connect() as connection:
+            result = await connection.stream(statement)
+            async for row in result.mappings():
+                yield project_from_row(row)
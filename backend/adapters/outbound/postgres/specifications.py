@@ -0,0 +1,79 @@
+from typing import Any
+
+from sqlalchemy import Select, exists, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from domain.ports.specifications import (
+    AllProjectsSpecification,
+    ExistingProjectsSpecification,
+    ProjectAlreadyExistsSpecification,
+    ProjectByIdSpecification,
+)
+from domain.project.aggregate import Project
+
+from .projects import project_from_row, projects_table
+from .unit_of_work import PostgresQuery
+
+
+class PostgresProjectAlreadyExistsSpecification(
+    ProjectAlreadyExistsSpecification[PostgresQuery[bool]]
+):
+    def to_query(self) -> PostgresQuery[bool]:
+        statement = select(exists().where(projects_table.c.id == self.repo_id))
+
+        async def query(connection: AsyncConnection) -> bool:
+            return bool(await connection.scalar(statement))
+
+        return query
+
+
+class PostgresExistingProjectsSpecification(
+    ExistingProjectsSpecification[PostgresQuery[set[str]]]
+):
+    def to_query(self) -> PostgresQuery[set[str]]:
+        statement = select(projects_table.c.id).where(
+            projects_table.c.id.in_(self.project_ids)
+        )
+
+        async def query(connection: AsyncConnection) -> set[str]:
+            return set(await connection.scalars(statement))
+
+        return query
+
+
+class PostgresProjectByIdSpecification(
+    ProjectByIdSpecification[PostgresQuery[list[Project]]]
+):
+    def to_query(self) -> PostgresQuery[list[Project]]:
+        return ProjectSelect(
+            select(projects_table).where(projects_table.c.id == self.project_id)
+        )
+
+
+class PostgresAllProjectsSpecification(
+    AllProjectsSpecification[PostgresQuery[list[Project]]]
+):
+    def to_query(self) -> PostgresQuery[list[Project]]:
+        sort_key = (projects_table.c.created_at, projects_table.c.id)
+        statement = select(projects_table).order_by(*sort_key)
+        if self.after is not None:
+            after = (
+                literal(value, column.type)
+                for value, column in zip(self.after, sort_key, strict=True)
+            )
+            # A row comparison, so the (created_at, id) index seeks to the page
+            statement = statement.where(tuple_(*sort_key) > tuple_(*after))
+        if self.limit is not None:
+            statement = statement.limit(self.limit)
+        return ProjectSelect(statement)
+
+
+class ProjectSelect:
+    """Query loading whole project rows, which repositories may also stream."""
+
+    def __init__(self, statement: Select[Any]):
+        self.statement = statement
+
+    async def __call__(self, connection: AsyncConnection) -> list[Project]:
+        result = await connection.execute(self.statement)
+        return [project_from_row(row) for row in result.mappings()]
@@ -0,0 +1,91 @@
+from collections.abc import Awaitable, Callable, Sequence
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from application.ports import EventPublisher
+from domain.entity import Entity
+from domain.ports import UnitOfWork
+from domain.ports.specifications import Specification
+from domain.project.aggregate import Project
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+from .projects import insert_projects_statement, project_to_row
+
+type PostgresQuery[TResult] = Callable[[AsyncConnection], Awaitable[TResult]]
+
+
+class PostgresUnitOfWork[TQueryResult](UnitOfWork[TQueryResult]):
+    """Unit of work running one PostgreSQL transaction.
+
+    A connection is checked out of the engine's pool when the unit of work is
+    entered and returned when it exits, so one instance serves one command.
+    Saved projects are inserted, a project whose id is taken raises
+    ``ProjectAlreadyExistsError``. Events recorded by saved entities are
+    published after the commit.
+    """
+
+    def __init__(self, engine: AsyncEngine, publisher: EventPublisher | None = None):
+        self._engine = engine
+        self._publisher = publisher
+        self._connection: AsyncConnection | None = None
+        self._saved: list[Entity] = []
+
+    async def __aenter__(self) -> Self:
+        self._connection = await self._engine.connect()
+        await self._connection.begin()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            await self.rollback()
+        finally:
+            await self._active_connection().close()
+            self._connection = None
+
+    async def commit(self) -> None:
+        await self._active_connection().commit()
+        events = [event for entity in self._saved for event in entity.pull_events()]
+        self._saved.clear()
+        if self._publisher is not None and events:
+            await self._publisher.publish(events)
+
+    async def rollback(self) -> None:
+        self._saved.clear()
+        await self._active_connection().rollback()
+
+    async def save(self, entity: Entity) -> None:
+        await self.save_all([entity])
+
+    async def save_all(self, entities: Sequence[Entity]) -> None:
+        if not entities:
+            return
+        rows: list[dict[str, Any]] = []
+        for entity in entities:
+            if not isinstance(entity, Project):
+                raise TypeError(f"Cannot persist {type(entity).__name__}")
+            rows.append(project_to_row(entity))
+        result = await self._active_connection().execute(
+            insert_projects_statement(), rows
+        )
+        # A concurrent command created the project since it was checked for
+        inserted = set(result.scalars())
+        for row in rows:
+            if row["id"] not in inserted:
+                raise ProjectAlreadyExistsError(row["url"])
+        self._saved.extend(entities)
+
+    async def make_query(self, specification: Specification[Any]) -> TQueryResult:
+        query: PostgresQuery[TQueryResult] = specification.to_query()
+        return await query(self._active_connection())
+
+    def _active_connection(self) -> AsyncConnection:
+        if self._connection is None:
+            raise RuntimeError("The unit of work is used outside its context")
+        return self._connection
@@ -0,0 +1,19 @@
+from .in_memory import (
+    InMemoryAllProjectsSpecification,
+    InMemoryExistingProjectsSpecification,
+    InMemoryProjectAlreadyExistsSpecification,
+    InMemoryProjectByIdSpecification,
+    InMemoryProjectReadRepository,
+    InMemoryProjectStore,
+    InMemoryUnitOfWork,
+)
+
+__all__ = [
+    "InMemoryAllProjectsSpecification",
+    "InMemoryExistingProjectsSpecification",
+    "InMemoryProjectAlreadyExistsSpecification",
+    "InMemoryProjectByIdSpecification",
+    "InMemoryProjectReadRepository",
+    "InMemoryProjectStore",
+    "InMemoryUnitOfWork",
+]
@@ -0,0 +1,137 @@
+from bisect import bisect_right
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from application.ports import EventPublisher
+from domain.entity import Entity
+from domain.exception import EntityNotFoundError
+from domain.ports import ReadRepository, UnitOfWork
+from domain.ports.specifications import (
+    AllProjectsSpecification,
+    ExistingProjectsSpecification,
+    ProjectAlreadyExistsSpecification,
+    ProjectByIdSpecification,
+    Specification,
+)
+from domain.project.aggregate import Project
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+type InMemoryQuery[TResult] = Callable[[Mapping[str, Project]], TResult]
+
+
+class InMemoryProjectStore:
+    """Committed projects of a process, shared by its units of work."""
+
+    def __init__(self) -> None:
+        self.projects: dict[str, Project] = {}
+
+
+class InMemoryUnitOfWork[TQueryResult](UnitOfWork[TQueryResult]):
+    """Unit of work over an in-memory store for development and tests.
+
+    Saved projects are staged until ``commit``, so a failed command leaves the
+    store untouched; committing a project whose id is taken raises
+    ``ProjectAlreadyExistsError``. Queries see committed projects only. Events
+    recorded by the saved projects are published after the commit.
+    """
+
+    def __init__(
+        self, store: InMemoryProjectStore, publisher: EventPublisher | None = None
+    ):
+        self._store = store
+        self._publisher = publisher
+        self._staged: dict[str, Project] = {}
+
+    async def commit(self) -> None:
+        for project_id, project in self._staged.items():
+            if project_id in self._store.projects:
+                # Committed by a concurrent command since it was checked for
+                raise ProjectAlreadyExistsError(str(project.url))
+        self._store.projects.update(self._staged)
+        events = [
+            event for entity in self._staged.values() for event in entity.pull_events()
+        ]
+        self._staged.clear()
+        if self._publisher is not None and events:
+            await self._publisher.publish(events)
+
+    async def rollback(self) -> None:
+        self._staged.clear()
+
+    async def save(self, entity: Entity) -> None:
+        if not isinstance(entity, Project):
+            raise TypeError(f"Cannot persist {type(entity).__name__}")
+        self._staged[entity.id()] = entity
+
+    async def make_query(self, specification: Specification[Any]) -> TQueryResult:
+        query: InMemoryQuery[TQueryResult] = specification.to_query()
+        return query(self._store.projects)
+
+
+class InMemoryProjectReadRepository(ReadRepository[Project]):
+    """Reads committed projects of an in-memory store."""
+
+    def __init__(self, store: InMemoryProjectStore):
+        self._store = store
+
+    async def find_one(self, specification: Specification[Any]) -> Project:
+        projects = await self.find_all(specification)
+        if not projects:
+            raise EntityNotFoundError()
+        return projects[0]
+
+    async def find_all(self, specification: Specification[Any]) -> list[Project]:
+        query: InMemoryQuery[list[Project]] = specification.to_query()
+        return query(self._store.projects)
+
+
+class InMemoryProjectAlreadyExistsSpecification(
+    ProjectAlreadyExistsSpecification[InMemoryQuery[bool]]
+):
+    def to_query(self) -> InMemoryQuery[bool]:
+        return lambda projects: self.repo_id in projects
+
+
+class InMemoryExistingProjectsSpecification(
+    ExistingProjectsSpecification[InMemoryQuery[set[str]]]
+):
+    def to_query(self) -> InMemoryQuery[set[str]]:
+        return lambda projects: {
+            project_id for project_id in self.project_ids if project_id in projects
+        }
+
+
+class InMemoryProjectByIdSpecification(
+    ProjectByIdSpecification[InMemoryQuery[list[Project]]]
+):
+    def to_query(self) -> InMemoryQuery[list[Project]]:
+        def query(projects: Mapping[str, Project]) -> list[Project]:
+            project = projects.get(self.project_id)
+            return [] if project is None else [project]
+
+        return query
+
+
+class InMemoryAllProjectsSpecification(
+    AllProjectsSpecification[InMemoryQuery[list[Project]]]
+):
+    def to_query(self) -> InMemoryQuery[list[Project]]:
+        def query(projects: Mapping[str, Project]) -> list[Project]:
+            ordered = sorted(projects.values(), key=_sort_key)
+            if self.after is not None:
+                created_at, project_id = self.after
+                after = (_as_utc(created_at), project_id)
+                ordered = ordered[bisect_right(ordered, after, key=_sort_key) :]
+            return ordered if self.limit is None else ordered[: self.limit]
+
+        return query
+
+
+def _sort_key(project: Project) -> tuple[datetime, str]:
+    return _as_utc(project.created_at), project.id()
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Naive and aware timestamps do not compare, so naive ones are taken as UTC
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
@@ -0,0 +1,46 @@
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from .exceptions import (
+    CircuitOpenError,
+    ProviderError,
+    ProviderQueryError,
+    ProviderRequestError,
+)
+from .health import CircuitBreakerProbe
+from .http_client import ProviderHttpClient, ProviderResponse
+from .rate_limit import RateLimitScheduler, RequestPriority, request_priority
+from .singleflight import SingleFlight
+from .validator_cache import (
+    CachedResponse,
+    HttpValidatorCache,
+    InMemoryHttpValidatorCache,
+)
+from .verifiers import (
+    CircuitBreakingBatchVerifier,
+    CircuitBreakingVerifier,
+    CoalescingVerifier,
+    ConcurrentBatchVerifier,
+)
+
+__all__ = [
+    "CachedResponse",
+    "CircuitBreaker",
+    "CircuitBreakerProbe",
+    "CircuitBreakerRegistry",
+    "CircuitBreakingBatchVerifier",
+    "CircuitBreakingVerifier",
+    "CircuitOpenError",
+    "CircuitState",
+    "CoalescingVerifier",
+    "ConcurrentBatchVerifier",
+    "HttpValidatorCache",
+    "InMemoryHttpValidatorCache",
+    "ProviderError",
+    "ProviderHttpClient",
+    "ProviderQueryError",
+    "ProviderRequestError",
+    "ProviderResponse",
+    "RateLimitScheduler",
+    "RequestPriority",
+    "SingleFlight",
+    "request_priority",
+]
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from http import HTTPStatus
+
+import aiohttp
+
+from .exceptions import CircuitOpenError, ProviderError, ProviderRequestError
+
+# Statuses GitHub rejects requests over its rate limits with
+_RATE_LIMITED_STATUSES = frozenset({HTTPStatus.FORBIDDEN, HTTPStatus.TOO_MANY_REQUESTS})
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Calls pass through, outcomes are recorded
+    OPEN = "open"  # Calls fail fast until the open duration elapses
+    HALF_OPEN = "half_open"  # A limited number of trial calls probe the provider
+
+
+class CircuitBreaker:
+    """Fails fast while a provider keeps failing.
+
+    Outcomes of the most recent calls are kept in a sliding window. Once the
+    window holds ``minimum_calls`` outcomes and the failure rate reaches the
+    threshold, the circuit opens and calls raise ``CircuitOpenError`` without
+    reaching the provider. After ``open_seconds`` a few trial calls are let
+    through: if they succeed the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        call_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            name: Name of the guarded dependency, usually the provider
+            failure_rate_threshold: Failure rate (0-1) that opens the circuit
+            window_size: Number of recent outcomes the failure rate is based on
+            minimum_calls: Outcomes required before the circuit may open
+            open_seconds: Time the circuit stays open before trial calls
+            half_open_max_calls: Trial calls allowed while half-open
+            call_timeout: Seconds after which a call counts as failed, if set
+            clock: Monotonic time source
+        """
+        self.name = name
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_calls = minimum_calls
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._call_timeout = call_timeout
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, moving from open to half-open when due."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+            self._half_open_successes = 0
+        return self._state
+
+    async def call[T](self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run the operation through the circuit.
+
+        Provider errors, connection errors and timeouts count as failures and
+        are re-raised. Rate-limit rejections (403 and 429) are left to the
+        rate-limit scheduler: they say nothing about the provider's health.
+
+        Raises:
+            CircuitOpenError: If the circuit does not let the call through
+        """
+        self.before_call()
+        try:
+            if self._call_timeout is None:
+                result = await operation()
+            else:
+                async with asyncio.timeout(self._call_timeout):
+                    result = await operation()
+        except (ProviderError, aiohttp.ClientError, TimeoutError) as error:
+            if _is_rate_limited(error):
+                self.release()
+            else:
+                self.record_failure()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+        return result
+
+    def before_call(self) -> None:
+        """Reserve a call, every reservation must be followed by a record.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or out of trial calls
+        """
+        state = self.state
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError(self.name, self._retry_after())
+        if state is CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self._half_open_max_calls:
+                raise CircuitOpenError(self.name, self._retry_after())
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._half_open_successes += 1
+            if self._half_open_successes >= self._half_open_max_calls:
+                self._close()
+            return
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if len(self._outcomes) >= self._minimum_calls and (
+            self._failure_rate() >= self._failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Give back a reserved call whose outcome says nothing about the provider."""
+        if self._state is CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _failure_rate(self) -> float:
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _retry_after(self) -> float:
+        return max(self._open_seconds - (self._clock() - self._opened_at), 0.0)
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    # The error has no headers to tell a rate limit from a denied permission,
+    # neither says anything about the provider's health
+    return (
+        isinstance(error, ProviderRequestError)
+        and error.status in _RATE_LIMITED_STATUSES
+    )
+
+
+class CircuitBreakerRegistry:
+    """Keeps one circuit breaker per provider, so one outage does not trip others."""
+
+    def __init__(self, factory: Callable[[str], CircuitBreaker] = CircuitBreaker):
+        """Initialize the registry.
+
+        Args:
+            factory: Builds the breaker for a provider name on first use
+        """
+        self._factory = factory
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Return the breaker for the provider, creating it if needed."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._factory(name)
+            self._breakers[name] = breaker
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the state of every known breaker."""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
@@ -0,0 +1,51 @@
+from application.ports import ProviderUnavailableError
+
+
+class ProviderError(ProviderUnavailableError):
+    """Base class for errors raised by provider clients."""
+
+    def __init__(self, message: str):
+        """Initialize provider error.
+
+        Args:
+            message: Error message
+        """
+        super().__init__(message)
+        self.message = message
+
+
+class ProviderRequestError(ProviderError):
+    """Error raised when a provider answers with an unexpected status."""
+
+    def __init__(self, url: str, status: int) -> None:
+        """Initialize provider request error."""
+        message = f"Provider request to '{url}' failed with status {status}"
+        super().__init__(message)
+        self.url = url
+        self.status = status
+
+
+class CircuitOpenError(ProviderError):
+    """Error raised when a call is rejected because the provider's circuit is open."""
+
+    def __init__(self, provider: str, retry_after: float) -> None:
+        """Initialize circuit open error."""
+        message = (
+            f"Circuit for provider '{provider}' is open, "
+            f"retry in {retry_after:.1f} seconds"
+        )
+        super().__init__(message)
+        self.provider = provider
+        self.retry_after = retry_after
+        self.retry_after_seconds = retry_after
+
+
+class ProviderQueryError(ProviderError):
+    """Error raised when a provider reports errors for a GraphQL query."""
+
+    def __init__(self, url: str, errors: list[str]) -> None:
+        """Initialize provider query error."""
+        message = f"Provider query to '{url}' failed: {'; '.join(errors)}"
+        super().__init__(message)
+        self.url = url
+        self.errors = errors
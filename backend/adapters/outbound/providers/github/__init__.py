@@ -0,0 +1,11 @@
+from .batch_verifier import GitHubBatchRepositoryVerifier
+from .client import GITHUB_API_URL, GITHUB_GRAPHQL_URL, github_headers
+from .verifier import GitHubRepositoryVerifier
+
+__all__ = [
+    "GITHUB_API_URL",
+    "GITHUB_GRAPHQL_URL",
+    "GitHubBatchRepositoryVerifier",
+    "GitHubRepositoryVerifier",
+    "github_headers",
+]
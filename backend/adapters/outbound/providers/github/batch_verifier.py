@@ -0,0 +1,114 @@
+import asyncio
+from collections.abc import Sequence
+from http import HTTPStatus
+from typing import Any
+
+from domain.project import value_objects as vo
+from domain.project.ports import BatchRemoteRepositoryVerifier, RemoteRepository
+
+from ..exceptions import ProviderQueryError, ProviderRequestError
+from ..http_client import ProviderHttpClient
+from .client import GITHUB_GRAPHQL_URL
+
+
+class GitHubBatchRepositoryVerifier:
+    """Verifies GitHub repositories in batches through aliased GraphQL queries.
+
+    Each query checks up to ``batch_size`` repositories, so importing an
+    organisation costs dozens of requests instead of thousands. Repositories on
+    other providers are handed to the fallback verifier.
+    """
+
+    def __init__(
+        self,
+        client: ProviderHttpClient,
+        fallback: BatchRemoteRepositoryVerifier | None = None,
+        graphql_url: str = GITHUB_GRAPHQL_URL,
+        batch_size: int = 100,
+    ):
+        """Initialize the verifier.
+
+        Args:
+            client: HTTP client configured with GitHub headers
+            fallback: Verifier for other providers, reported as not found if None
+            graphql_url: URL of the GitHub GraphQL endpoint
+            batch_size: Maximum number of repositories per query
+        """
+        self._client = client
+        self._fallback = fallback
+        self._graphql_url = graphql_url
+        self._batch_size = batch_size
+
+    async def verify_many(
+        self, repositories: Sequence[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        """Check the existence of many repositories at once.
+
+        Raises:
+            ProviderRequestError: If GitHub answers with an unexpected status
+            ProviderQueryError: If GitHub reports errors other than not found
+        """
+        unique = list(dict.fromkeys(repositories))
+        github = [r for r in unique if r.provider.value is vo.ProviderType.GITHUB]
+        others = [r for r in unique if r.provider.value is not vo.ProviderType.GITHUB]
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._verify_batch(github[i : i + self._batch_size]))
+                    for i in range(0, len(github), self._batch_size)
+                ]
+                if others:
+                    tasks.append(tg.create_task(self._verify_others(others)))
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+
+        results: dict[RemoteRepository, bool] = {}
+        for task in tasks:
+            results.update(task.result())
+        return results
+
+    async def _verify_batch(
+        self, batch: list[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        response = await self._client.post_json(self._graphql_url, _build_query(batch))
+        if response.status != HTTPStatus.OK:
+            raise ProviderRequestError(self._graphql_url, response.status)
+
+        payload = response.json_body()
+        errors = [
+            error.get("message", "unknown error")
+            for error in payload.get("errors", [])
+            if error.get("type") != "NOT_FOUND"
+        ]
+        if errors:
+            raise ProviderQueryError(self._graphql_url, errors)
+
+        data = payload.get("data") or {}
+        return {
+            repository: data.get(f"r{index}") is not None
+            for index, repository in enumerate(batch)
+        }
+
+    async def _verify_others(
+        self, repositories: list[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        if self._fallback is None:
+            return dict.fromkeys(repositories, False)
+        return await self._fallback.verify_many(repositories)
+
+
+def _build_query(batch: list[RemoteRepository]) -> dict[str, Any]:
+    definitions: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, str] = {}
+    for index, repository in enumerate(batch):
+        definitions.append(f"$owner{index}: String!, $name{index}: String!")
+        fields.append(
+            f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{ id }}"
+        )
+        variables[f"owner{index}"] = str(repository.owner)
+        variables[f"name{index}"] = str(repository.repository_id)
+
+    query = f"query({', '.join(definitions)}) {{ {' '.join(fields)} }}"
+    return {"query": query, "variables": variables}
@@ -0,0 +1,17 @@
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+
+def github_headers(token: str | None = None) -> dict[str, str]:
+    """Return the default headers for GitHub REST and GraphQL requests.
+
+    Args:
+        token: Personal access or installation token, anonymous when None
+    """
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
@@ -0,0 +1,47 @@
+from http import HTTPStatus
+
+from domain.project import value_objects as vo
+
+from ..exceptions import ProviderRequestError
+from ..http_client import ProviderHttpClient
+from .client import GITHUB_API_URL
+
+
+class GitHubRepositoryVerifier:
+    """Verifies repository existence through the GitHub REST API.
+
+    Repositories on other providers are reported as not found, so the verifier
+    can be chained with verifiers for other providers.
+    """
+
+    def __init__(self, client: ProviderHttpClient, api_url: str = GITHUB_API_URL):
+        """Initialize the verifier.
+
+        Args:
+            client: HTTP client configured with GitHub headers
+            api_url: Base URL of the GitHub REST API
+        """
+        self._client = client
+        self._api_url = api_url.rstrip("/")
+
+    async def verify(
+        self,
+        repository_id: vo.RepositoryId,
+        provider: vo.Provider,
+        owner: vo.Owner,
+    ) -> bool:
+        """Check whether the repository exists on GitHub.
+
+        Raises:
+            ProviderRequestError: If GitHub answers with an unexpected status
+        """
+        if provider.value is not vo.ProviderType.GITHUB:
+            return False
+
+        url = f"{self._api_url}/repos/{owner}/{repository_id}"
+        response = await self._client.get(url)
+        if response.status == HTTPStatus.OK:
+            return True
+        if response.status == HTTPStatus.NOT_FOUND:
+            return False
+        raise ProviderRequestError(url, response.status)
@@ -0,0 +1,18 @@
+from .circuit_breaker import CircuitBreakerRegistry, CircuitState
+from .exceptions import ProviderError
+
+
+class CircuitBreakerProbe:
+    """Reports providers whose circuit is open, without calling them."""
+
+    def __init__(self, breakers: CircuitBreakerRegistry):
+        self._breakers = breakers
+
+    async def check(self) -> None:
+        open_circuits = sorted(
+            name
+            for name, state in self._breakers.states().items()
+            if state is CircuitState.OPEN
+        )
+        if open_circuits:
+            raise ProviderError(f"Circuit open for {', '.join(open_circuits)}")
@@ -0,0 +1,243 @@
+import json
+from collections.abc import Mapping
+from http import HTTPStatus
+from typing import Any
+
+import aiohttp
+from pydantic import BaseModel, ConfigDict
+
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimitScheduler, RequestPriority, is_rate_limited
+from .singleflight import SingleFlight
+from .validator_cache import CachedResponse, HttpValidatorCache
+
+_GetKey = tuple[str, frozenset[tuple[str, str]]]
+
+
+class ProviderResponse(BaseModel):
+    """Fully read provider response. Header names are lower-cased."""
+
+    model_config = ConfigDict(frozen=True)
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    from_cache: bool = False
+
+    def json_body(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body)
+
+
+class ProviderHttpClient:
+    """HTTP client shared by the provider adapters.
+
+    GET requests are revalidated against the validator cache: stored ETag and
+    Last-Modified values are sent as ``If-None-Match``/``If-Modified-Since`` and
+    a ``304 Not Modified`` answer is served from the cached body. On GitHub such
+    answers do not count against the rate limit.
+
+    With a scheduler, every request waits for its rate-limit bucket and requests
+    rejected by the provider's rate limiter are queued again. With a circuit
+    breaker, connection errors, timeouts and 5xx answers open the circuit and
+    further requests fail fast with ``CircuitOpenError``. With coalescing,
+    concurrent identical GET requests share one round trip.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        validator_cache: HttpValidatorCache | None = None,
+        headers: Mapping[str, str] | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        rate_limit_key: str = "default",
+        max_rate_limit_retries: int = 3,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_gets: bool = False,
+    ):
+        """Initialize the client.
+
+        Args:
+            session: Shared aiohttp session
+            validator_cache: Cache for conditional requests, disabled when None
+            headers: Headers sent with every request, e.g. authorization
+            scheduler: Rate-limit scheduler, disabled when None
+            rate_limit_key: Scheduler bucket of this client's provider and credential
+            max_rate_limit_retries: Attempts to resend a rate-limited request
+            circuit_breaker: Breaker of this client's provider, disabled when None
+            coalesce_gets: Share in-flight GET requests with the same URL and headers
+        """
+        self._session = session
+        self._validator_cache = validator_cache
+        self._headers = dict(headers or {})
+        self._scheduler = scheduler
+        self._rate_limit_key = rate_limit_key
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._circuit_breaker = circuit_breaker
+        self._get_flights: SingleFlight[_GetKey, ProviderResponse] | None = (
+            SingleFlight() if coalesce_gets else None
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> ProviderResponse:
+        """Send a conditional GET request.
+
+        Args:
+            url: Absolute URL of the resource
+            headers: Extra headers for this request
+            priority: Scheduling priority, defaults to the current context's
+
+        Returns:
+            Fresh response, or the cached one when the resource has not changed
+        """
+        if self._get_flights is None:
+            return await self._get(url, headers, priority)
+
+        key = (url, frozenset((headers or {}).items()))
+        return await self._get_flights.do(
+            key, lambda: self._get(url, headers, priority)
+        )
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: Mapping[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> ProviderResponse:
+        """Send a POST request with a JSON body, e.g. a GraphQL query.
+
+        Args:
+            url: Absolute URL of the endpoint
+            payload: JSON-serializable request body
+            headers: Extra headers for this request
+            priority: Scheduling priority, defaults to the current context's
+        """
+        request_headers = {
+            **self._headers,
+            **(headers or {}),
+            "Content-Type": "application/json",
+        }
+        return await self._send(
+            "POST", url, request_headers, priority, json.dumps(payload).encode()
+        )
+
+    async def _get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> ProviderResponse:
+        cached = await self._cached(url)
+        request_headers = {**self._headers, **(headers or {})}
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+
+        response = await self._send("GET", url, request_headers, priority)
+        if response.status == HTTPStatus.NOT_MODIFIED and cached is not None:
+            return ProviderResponse(
+                status=cached.status,
+                headers={**cached.headers, **response.headers},
+                body=cached.body,
+                from_cache=True,
+            )
+
+        await self._store(url, response)
+        return response
+
+    async def _cached(self, url: str) -> CachedResponse | None:
+        if self._validator_cache is None:
+            return None
+        return await self._validator_cache.get(url)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        priority: RequestPriority | None,
+        body: bytes | None = None,
+    ) -> ProviderResponse:
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._send_scheduled(method, url, headers, priority, body)
+
+        breaker.before_call()
+        try:
+            response = await self._send_scheduled(method, url, headers, priority, body)
+        except (aiohttp.ClientError, TimeoutError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+
+        if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _send_scheduled(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        priority: RequestPriority | None,
+        body: bytes | None,
+    ) -> ProviderResponse:
+        if self._scheduler is None:
+            return await self._request(method, url, headers, body)
+
+        for _ in range(self._max_rate_limit_retries + 1):
+            await self._scheduler.acquire(self._rate_limit_key, priority)
+            response = await self._request(method, url, headers, body)
+            self._scheduler.observe(
+                self._rate_limit_key, response.status, response.headers
+            )
+            if not is_rate_limited(response.status, response.headers):
+                break
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes | None,
+    ) -> ProviderResponse:
+        async with self._session.request(
+            method, url, headers=headers, data=body
+        ) as response:
+            body = await response.read()
+            return ProviderResponse(
+                status=response.status,
+                headers={
+                    name.lower(): value for name, value in response.headers.items()
+                },
+                body=body,
+            )
+
+    async def _store(self, url: str, response: ProviderResponse) -> None:
+        if self._validator_cache is None or response.status != HTTPStatus.OK:
+            return
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return
+
+        await self._validator_cache.set(
+            url,
+            CachedResponse(
+                status=response.status,
+                headers=response.headers,
+                body=response.body,
+                etag=etag,
+                last_modified=last_modified,
+            ),
+        )
@@ -0,0 +1,234 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import math
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from http import HTTPStatus
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued provider requests are released (lowest first)."""
+
+    INTERACTIVE = 0  # A user is waiting, e.g. project creation
+    BACKGROUND = 1  # Reconciliation, bulk imports and other batch work
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "provider_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run the provider requests made inside the block with the given priority.
+
+    Lets background work lower its priority without threading it through the
+    domain ports.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def is_rate_limited(status: int, headers: Mapping[str, str]) -> bool:
+    """Check whether a response was rejected by the provider's rate limiter.
+
+    GitHub answers primary limits with 403 and ``X-RateLimit-Remaining: 0``,
+    secondary limits with 403 or 429 and ``Retry-After``.
+    """
+    if status == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    return status == HTTPStatus.FORBIDDEN and (
+        headers.get("x-ratelimit-remaining") == "0" or "retry-after" in headers
+    )
+
+
+class RateLimitScheduler:
+    """Schedules provider requests with one token bucket per provider and credential.
+
+    Buckets start with the configured rate and burst, then follow the quota the
+    provider reports in ``X-RateLimit-Remaining``/``X-RateLimit-Reset``: the
+    remaining requests are spread evenly until the reset instead of being spent
+    in one burst. ``Retry-After`` and an exhausted quota pause the bucket.
+    Waiting requests are released by priority, then in arrival order.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 10, min_rate: float = 1 / 3600):
+        """Initialize the scheduler.
+
+        Args:
+            rate: Requests per second before the provider reports its quota
+            burst: Maximum number of requests released at once
+            min_rate: Lowest rate a reported quota may slow a bucket to, so a
+                far-off reset cannot stall it
+
+        Raises:
+            ValueError: If a rate is not positive or the burst is below one
+        """
+        if not (rate > 0 and min_rate > 0):
+            raise ValueError("Rates must be positive")
+        if burst < 1:
+            raise ValueError("Burst must be at least one request")
+        self._rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    @staticmethod
+    def bucket_key(provider: str, credential: str | None = None) -> str:
+        """Build a bucket key without keeping the credential itself in memory."""
+        digest = hashlib.sha256((credential or "").encode()).hexdigest()[:16]
+        return f"{provider}:{digest}"
+
+    async def acquire(self, key: str, priority: RequestPriority | None = None) -> None:
+        """Wait until a request may be sent.
+
+        Args:
+            key: Bucket key, see ``bucket_key``
+            priority: Priority of the request, defaults to the current context's
+        """
+        await self._bucket(key).acquire(
+            _current_priority.get() if priority is None else priority
+        )
+
+    def observe(self, key: str, status: int, headers: Mapping[str, str]) -> None:
+        """Update the bucket from the rate-limit headers of a response.
+
+        Args:
+            key: Bucket key the request was sent with
+            status: Response status
+            headers: Response headers with lower-cased names
+        """
+        self._bucket(key).observe(status, headers)
+
+    def _bucket(self, key: str) -> "_TokenBucket":
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(self._rate, self._burst, self._min_rate)
+            self._buckets[key] = bucket
+        return bucket
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int, min_rate: float):
+        self._default_rate = rate
+        self._min_rate = min_rate
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._quota_resets_at = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        if not self._waiters and self._delay() == 0:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._tokens += 1
+            raise
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        retry_after = _parse_retry_after(headers.get("retry-after"))
+        if retry_after is not None:
+            self._block_for(retry_after)
+        elif is_rate_limited(status, headers):
+            self._block_for(1.0 / self._rate)
+
+        quota = _parse_quota(headers)
+        if quota is None:
+            return
+
+        remaining, reset = quota
+        window = reset - time.time()
+        if window <= 0:
+            return
+        if remaining <= 0:
+            self._block_for(window)
+            return
+
+        self._refill()
+        self._rate = max(remaining / window, self._min_rate)
+        self._tokens = min(self._tokens, float(remaining))
+        self._quota_resets_at = time.monotonic() + window
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            delay = self._delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+    def _delay(self) -> float:
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._quota_resets_at and now >= self._quota_resets_at:
+            self._rate = self._default_rate
+            self._quota_resets_at = 0.0
+
+        elapsed = now - self._updated_at
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def _block_for(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _parse_quota(headers: Mapping[str, str]) -> tuple[int, float] | None:
+    # Malformed headers are ignored, the response itself succeeded
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        quota = int(remaining), float(reset)
+    except ValueError:
+        return None
+    return quota if math.isfinite(quota[1]) else None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,43 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent calls with the same key into one in-flight call.
+
+    The first caller starts the call as a task, later callers with the same key
+    await that task. Waiters are shielded from each other: cancelling one of
+    them does not cancel the shared call. The key is released once the call
+    finishes, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Task[V]] = {}
+
+    async def do(self, key: K, operation: Callable[[], Awaitable[V]]) -> V:
+        """Run the operation, or join the in-flight call for the same key.
+
+        Args:
+            key: Identity of the call
+            operation: Starts the call when none is in flight
+
+        Returns:
+            Result of the shared call, its exception is raised to every waiter
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    def _release(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Retrieve the exception so a call nobody awaits anymore stays quiet
+            task.exception()
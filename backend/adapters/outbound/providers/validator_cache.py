@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CachedResponse(BaseModel):
+    """Response body stored together with its HTTP validators."""
+
+    model_config = ConfigDict(frozen=True)
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers that turn a request into a conditional one."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpValidatorCache(ABC):
+    """Storage for responses that can be revalidated with conditional requests."""
+
+    @abstractmethod
+    async def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for the URL, if any."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, url: str, response: CachedResponse) -> None:
+        """Store the response for the URL."""
+        raise NotImplementedError
+
+
+class InMemoryHttpValidatorCache(HttpValidatorCache):
+    """Process-local validator cache bounded by the number of entries.
+
+    The least recently used URL is evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    async def get(self, url: str) -> CachedResponse | None:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    async def set(self, url: str, response: CachedResponse) -> None:
+        self._entries[url] = response
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
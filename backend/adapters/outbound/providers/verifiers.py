@@ -0,0 +1,162 @@
+import asyncio
+from collections.abc import Sequence
+from functools import partial
+
+from domain.project import value_objects as vo
+from domain.project.ports import (
+    BatchRemoteRepositoryVerifier,
+    RemoteRepository,
+    RemoteRepositoryVerifier,
+)
+
+from .circuit_breaker import CircuitBreakerRegistry
+from .singleflight import SingleFlight
+
+
+class CircuitBreakingVerifier:
+    """Guards a remote repository verifier with one circuit breaker per provider.
+
+    Use it for verifiers whose HTTP client is not guarded already, otherwise
+    every failure would be recorded twice.
+    """
+
+    def __init__(
+        self, verifier: RemoteRepositoryVerifier, breakers: CircuitBreakerRegistry
+    ):
+        """Initialize the verifier.
+
+        Args:
+            verifier: Verifier calling the provider
+            breakers: Registry providing the breaker of each provider
+        """
+        self._verifier = verifier
+        self._breakers = breakers
+
+    async def verify(
+        self,
+        repository_id: vo.RepositoryId,
+        provider: vo.Provider,
+        owner: vo.Owner,
+    ) -> bool:
+        """Verify the repository unless the provider's circuit is open.
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open
+        """
+        breaker = self._breakers.get(str(provider))
+        return await breaker.call(
+            lambda: self._verifier.verify(
+                repository_id=repository_id, provider=provider, owner=owner
+            )
+        )
+
+
+class CircuitBreakingBatchVerifier:
+    """Guards a batch verifier with one circuit breaker per provider.
+
+    The repositories of each provider are verified in one call through that
+    provider's breaker, so a failing batch counts as one failure.
+    """
+
+    def __init__(
+        self, verifier: BatchRemoteRepositoryVerifier, breakers: CircuitBreakerRegistry
+    ):
+        """Initialize the verifier.
+
+        Args:
+            verifier: Verifier calling the providers
+            breakers: Registry providing the breaker of each provider
+        """
+        self._verifier = verifier
+        self._breakers = breakers
+
+    async def verify_many(
+        self, repositories: Sequence[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        """Verify the repositories unless their provider's circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit of one of the providers is open
+        """
+        by_provider: dict[str, list[RemoteRepository]] = {}
+        for repository in dict.fromkeys(repositories):
+            by_provider.setdefault(str(repository.provider), []).append(repository)
+
+        results: dict[RemoteRepository, bool] = {}
+        for provider, batch in by_provider.items():
+            breaker = self._breakers.get(provider)
+            results.update(
+                await breaker.call(partial(self._verifier.verify_many, batch))
+            )
+        return results
+
+
+class ConcurrentBatchVerifier:
+    """Verifies a batch of repositories with concurrent single-repository calls.
+
+    Used for providers without a batch API.
+    """
+
+    def __init__(self, verifier: RemoteRepositoryVerifier, concurrency: int = 10):
+        """Initialize the verifier.
+
+        Args:
+            verifier: Verifier checking one repository per call
+            concurrency: Maximum number of calls in flight
+        """
+        self._verifier = verifier
+        self._concurrency = concurrency
+
+    async def verify_many(
+        self, repositories: Sequence[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        """Verify the repositories, failing with the first verifier error."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def verify(repository: RemoteRepository) -> bool:
+            async with semaphore:
+                return await self._verifier.verify(
+                    repository_id=repository.repository_id,
+                    provider=repository.provider,
+                    owner=repository.owner,
+                )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    repository: tg.create_task(verify(repository))
+                    for repository in dict.fromkeys(repositories)
+                }
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+        return {repository: task.result() for repository, task in tasks.items()}
+
+
+class CoalescingVerifier:
+    """Shares one in-flight verification between concurrent identical requests.
+
+    Double submissions, webhook bursts and parallel imports of the same
+    repository then cost a single provider call.
+    """
+
+    def __init__(self, verifier: RemoteRepositoryVerifier):
+        """Initialize the verifier.
+
+        Args:
+            verifier: Verifier calling the provider
+        """
+        self._verifier = verifier
+        self._flights: SingleFlight[RemoteRepository, bool] = SingleFlight()
+
+    async def verify(
+        self,
+        repository_id: vo.RepositoryId,
+        provider: vo.Provider,
+        owner: vo.Owner,
+    ) -> bool:
+        return await self._flights.do(
+            RemoteRepository(repository_id, provider, owner),
+            lambda: self._verifier.verify(
+                repository_id=repository_id, provider=provider, owner=owner
+            ),
+        )
@@ -0,0 +1,3 @@
+from .in_memory import InMemoryRateLimitStore
+
+__all__ = ["InMemoryRateLimitStore"]
@@ -0,0 +1,74 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from application.ports import RateLimit, RateLimitDecision, RateLimitStore
+
+
+class _Window:
+    __slots__ = ("current", "previous", "started_at")
+
+    def __init__(self, started_at: float) -> None:
+        self.started_at = started_at
+        self.current = 0
+        self.previous = 0
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Process-local sliding-window counters.
+
+    Each key keeps the counts of the current and the previous fixed window;
+    the previous count is weighted by how much of it still overlaps the
+    sliding window, which approximates a sliding log in constant memory per
+    key. Bounded by ``max_keys``; the least recently used key is evicted
+    first, which at worst forgets the usage of an idle client.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_keys = max_keys
+        self._clock = clock
+        self._windows: OrderedDict[str, _Window] = OrderedDict()
+
+    async def consume(self, key: str, rate_limit: RateLimit) -> RateLimitDecision:
+        now = self._clock()
+        size = rate_limit.window_seconds
+        window = self._windows.get(key)
+        if window is None:
+            window = _Window(now)
+            self._windows[key] = window
+            while len(self._windows) > self._max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+            periods = int((now - window.started_at) // size)
+            if periods > 0:
+                window.previous = window.current if periods == 1 else 0
+                window.current = 0
+                window.started_at += periods * size
+
+        elapsed = now - window.started_at
+        estimate = window.previous * (1 - elapsed / size) + window.current
+        if estimate + 1 <= rate_limit.limit:
+            window.current += 1
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(
+            allowed=False,
+            retry_after_seconds=_retry_after(window, rate_limit, elapsed),
+        )
+
+
+def _retry_after(window: _Window, rate_limit: RateLimit, elapsed: float) -> float:
+    size = rate_limit.window_seconds
+    room = rate_limit.limit - window.current - 1
+    if room >= 0 and window.previous > 0:
+        # Enough of the previous window slides out before this one ends
+        return size * (1 - room / window.previous) - elapsed
+    # Wait for the next window, where the current count becomes the previous
+    remaining = size - elapsed
+    if window.current == 0:
+        return remaining
+    return remaining + max(0.0, size * (1 - (rate_limit.limit - 1) / window.current))
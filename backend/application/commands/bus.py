@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Protocol
+
+from application.commands.commands import Command
+from application.commands.exceptions import CommandHandlerNotFoundError
+
+type NextStep = Callable[[Command], Awaitable[Any]]
+
+
+class CommandHandler[TCommand: Command, TResult](Protocol):
+    async def handle(self, command: TCommand) -> TResult: ...
+
+
+class Middleware(ABC):
+    """Step of the command pipeline wrapping everything after it."""
+
+    @abstractmethod
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        """Process the command, calling ``next_step`` to continue the pipeline."""
+        raise NotImplementedError
+
+
+class CommandBus:
+    """Dispatches commands to their handlers through a middleware pipeline.
+
+    Handlers are registered with a factory and built for every dispatch, so each
+    command, and each retry of it, gets its own unit of work.
+    """
+
+    def __init__(self, middlewares: Sequence[Middleware] = ()):
+        """Initialize the bus.
+
+        Args:
+            middlewares: Pipeline steps, the first one is the outermost
+        """
+        self._factories: dict[
+            type[Command], Callable[[], CommandHandler[Any, Any]]
+        ] = {}
+        self._pipeline: NextStep = self._handle
+        for middleware in reversed(middlewares):
+            self._pipeline = _chain(middleware, self._pipeline)
+
+    def register[TCommand: Command](
+        self,
+        command_type: type[TCommand],
+        handler_factory: Callable[[], CommandHandler[TCommand, Any]],
+    ) -> None:
+        """Register the handler factory for a command type.
+
+        Raises:
+            ValueError: If the command type already has a handler
+        """
+        if command_type in self._factories:
+            raise ValueError(
+                f"Handler for '{command_type.__name__}' already registered"
+            )
+        self._factories[command_type] = handler_factory
+
+    async def dispatch(self, command: Command) -> Any:
+        """Run the command through the pipeline and return the handler's result.
+
+        Raises:
+            CommandHandlerNotFoundError: If no handler is registered for the command
+        """
+        if type(command) not in self._factories:
+            raise CommandHandlerNotFoundError(type(command).__name__)
+        return await self._pipeline(command)
+
+    async def _handle(self, command: Command) -> Any:
+        handler = self._factories[type(command)]()
+        return await handler.handle(command)
+
+
+def _chain(middleware: Middleware, next_step: NextStep) -> NextStep:
+    async def step(command: Command) -> Any:
+        return await middleware(command, next_step)
+
+    return step
@@ -2,9 +2,16 @@ from pydantic import BaseModel
 
 
 class Command(BaseModel):
-    pass
+    idempotency_key: str | None = None
+    # Identifies the API client that sent the command, e.g. for rate limits
+    client_id: str | None = None
 
 
 class CreateProjectCommand(Command):
     rules: list[str]
     url: str
+
+
+class CreateProjectsCommand(Command):
+    rules: list[str]
+    urls: list[str]
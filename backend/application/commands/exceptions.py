@@ -0,0 +1,33 @@
+from domain.exception import DomainError
+
+
+class CommandHandlerNotFoundError(LookupError):
+    """Error raised when a command is dispatched without a registered handler."""
+
+    def __init__(self, command_type: str) -> None:
+        """Initialize command handler not found error."""
+        super().__init__(f"No handler registered for command '{command_type}'")
+        self.command_type = command_type
+
+
+class IdempotencyKeyReusedError(DomainError):
+    """Error raised when an idempotency key is reused for a different command."""
+
+    def __init__(self, key: str) -> None:
+        """Initialize idempotency key reused error."""
+        message = f"Idempotency key '{key}' was already used for a different command"
+        super().__init__(message)
+
+
+class RateLimitExceededError(DomainError):
+    """Error raised when a client or project sends commands faster than allowed."""
+
+    def __init__(self, subject: str, retry_after_seconds: float) -> None:
+        """Initialize rate limit exceeded error.
+
+        Args:
+            subject: What the limit applies to, e.g. the client or the project
+            retry_after_seconds: Seconds until the command would be accepted
+        """
+        super().__init__(f"Rate limit exceeded for {subject}")
+        self.retry_after_seconds = retry_after_seconds
@@ -1,8 +1,10 @@
+import asyncio
 from collections.abc import Callable
 
 from application.commands.commands import CreateProjectCommand
 from domain.ports import UnitOfWork
 from domain.ports.specifications import ProjectAlreadyExistsSpecification
+from domain.project.aggregate import Project
 from domain.project.exceptions import ProjectAlreadyExistsError
 from domain.project.services import CreateProjectService
 
@@ -15,21 +17,74 @@ class CreateProjectCommandHandler:
         specification_factory: Callable[
             [CreateProjectCommand], ProjectAlreadyExistsSpecification
         ],
+        optimistic: bool = False,
     ):
+        """Initialize the handler.
+
+        Args:
+            uow: Unit of work of this command
+            create_project_service: Domain service creating the project
+            specification_factory: Builds the existence query for the command
+            optimistic: Run remote verification alongside the existence query
+        """
         self._uow = uow
         self._create_project_service = create_project_service
         self._specification_factory = specification_factory
+        self._optimistic = optimistic
 
-    async def handle(self, command: CreateProjectCommand) -> None:
+    async def handle(self, command: CreateProjectCommand) -> str:
+        """Create the project and return its id."""
         async with self._uow as uow:
             spec = self._specification_factory(command)
-            is_project_already_exists = await uow.make_query(spec)
-            if is_project_already_exists:
-                raise ProjectAlreadyExistsError(command.url)
-
-            project = await self._create_project_service.create(
-                command.url,
-                command.rules,
-            )
+            if self._optimistic:
+                project = await self._create_optimistically(uow, spec, command)
+            else:
+                project = await self._create(uow, spec, command)
             await uow.save(project)
             await uow.commit()
+        return project.id()
+
+    async def _create(
+        self,
+        uow: UnitOfWork[bool],
+        spec: ProjectAlreadyExistsSpecification,
+        command: CreateProjectCommand,
+    ) -> Project:
+        is_project_already_exists = await uow.make_query(spec)
+        if is_project_already_exists:
+            raise ProjectAlreadyExistsError(command.url)
+
+        return await self._create_project_service.create(
+            command.url,
+            command.rules,
+        )
+
+    async def _create_optimistically(
+        self,
+        uow: UnitOfWork[bool],
+        spec: ProjectAlreadyExistsSpecification,
+        command: CreateProjectCommand,
+    ) -> Project:
+        # A TaskGroup would surface whichever error comes first; the existence
+        # check has to win, so the creation task is managed by hand.
+        creation = asyncio.create_task(
+            self._create_project_service.create(command.url, command.rules)
+        )
+        try:
+            is_project_already_exists = await uow.make_query(spec)
+        except BaseException:
+            await _discard(creation)
+            raise
+
+        if is_project_already_exists:
+            await _discard(creation)
+            raise ProjectAlreadyExistsError(command.url)
+
+        return await creation
+
+
+async def _discard(task: asyncio.Task[Project]) -> None:
+    task.cancel()
+    await asyncio.wait({task})
+    if not task.cancelled():
+        task.exception()
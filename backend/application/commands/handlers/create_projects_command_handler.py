@@ -0,0 +1,195 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from application.commands.commands import CreateProjectsCommand
+from domain.exception import DomainError
+from domain.ports import UnitOfWork
+from domain.ports.specifications import ExistingProjectsSpecification
+from domain.project import value_objects as vo
+from domain.project.aggregate import Project
+from domain.project.exceptions import (
+    ProjectAlreadyExistsError,
+    RemoteRepositoryDoesNotExistError,
+)
+from domain.project.factories import ValueObjectsFactory
+from domain.project.ports import BatchRemoteRepositoryVerifier, RemoteRepository
+from domain.project.services import CreateProjectService
+
+# Outcome of a URL whose repository could not be verified, e.g. provider down
+VERIFICATION_FAILED = "verification_failed"
+# Outcome of a URL naming a project that an earlier URL of the batch names
+DUPLICATE_IN_BATCH = "duplicate_in_batch"
+
+
+class ProjectCreationOutcome(BaseModel):
+    """Result of creating one project of a batch."""
+
+    url: str
+    project_id: str | None = None
+    error: str | None = None
+
+    @property
+    def created(self) -> bool:
+        return self.error is None
+
+
+class CreateProjectsCommandHandler:
+    """Creates the projects of a whole organisation as one batch.
+
+    Existence of the batch is checked with a single query, the repositories
+    are verified in batches, several in flight up to the configured limit, and
+    new projects are saved together. Every URL gets an outcome in submission
+    order, a URL repeating the project of an earlier one is reported as a
+    duplicate. Domain errors and the configured verification errors, e.g. a
+    provider that is down or timing out, are reported per URL of the failed
+    verification batch instead of failing the command. The unit of work is
+    entered once for the existence query and once for the save, a project
+    created concurrently in between fails the save with
+    ``ProjectAlreadyExistsError``.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork[set[str]],
+        create_project_service: CreateProjectService,
+        batch_verifier: BatchRemoteRepositoryVerifier,
+        value_objects_factory: ValueObjectsFactory,
+        specification_factory: Callable[[list[str]], ExistingProjectsSpecification],
+        max_concurrent_verifications: int = 20,
+        verification_batch_size: int = 100,
+        verification_errors: tuple[type[Exception], ...] = (TimeoutError,),
+    ):
+        """Initialize the handler.
+
+        Args:
+            uow: Unit of work of this command
+            create_project_service: Domain service creating verified projects
+            batch_verifier: Checks the existence of many repositories per call
+            value_objects_factory: Derives the project id of each URL
+            specification_factory: Builds the query selecting tracked project ids
+            max_concurrent_verifications: Verification batches in flight at once
+            verification_batch_size: Repositories verified per batch
+            verification_errors: Failures of a verification batch reported for
+                its URLs as ``verification_failed``, others fail the command
+        """
+        self._uow = uow
+        self._create_project_service = create_project_service
+        self._batch_verifier = batch_verifier
+        self._value_objects_factory = value_objects_factory
+        self._specification_factory = specification_factory
+        self._max_concurrent_verifications = max_concurrent_verifications
+        self._verification_batch_size = verification_batch_size
+        self._verification_errors = verification_errors
+        self._logger = logging.getLogger(__name__)
+
+    async def handle(
+        self, command: CreateProjectsCommand
+    ) -> list[ProjectCreationOutcome]:
+        # One outcome per submitted URL in submission order, repeats included
+        outcomes = [ProjectCreationOutcome(url=url) for url in command.urls]
+        identified = self._identify(outcomes)
+
+        # Verification waits on providers for seconds, so it runs before the
+        # transaction is opened and holds no connection while it does
+        project_ids = list(dict.fromkeys(entry.project_id for entry in identified))
+        async with self._uow as uow:
+            existing = await uow.make_query(self._specification_factory(project_ids))
+        seen: set[str] = set()
+        for entry in identified:
+            if entry.project_id in existing:
+                entry.outcome.error = ProjectAlreadyExistsError(
+                    entry.outcome.url
+                ).status
+            elif entry.project_id in seen:
+                entry.outcome.error = DUPLICATE_IN_BATCH
+            seen.add(entry.project_id)
+
+        pending = [entry for entry in identified if entry.outcome.created]
+        projects = await self._create_all(pending, command.rules)
+
+        async with self._uow as uow:
+            await uow.save_all(projects)
+            await uow.commit()
+
+        return outcomes
+
+    def _identify(self, outcomes: list[ProjectCreationOutcome]) -> list["_Identified"]:
+        identified: list[_Identified] = []
+        for outcome in outcomes:
+            try:
+                value_objects = self._value_objects_factory.create_from_url(
+                    vo.URL(outcome.url)
+                )
+            except DomainError as error:
+                outcome.error = error.status
+                continue
+            outcome.project_id = str(value_objects.project_id)
+            repository = RemoteRepository(
+                value_objects.repository_id, value_objects.provider, value_objects.owner
+            )
+            identified.append(_Identified(outcome, outcome.project_id, repository))
+        return identified
+
+    async def _create_all(
+        self, pending: list["_Identified"], rules: list[str]
+    ) -> list[Project]:
+        semaphore = asyncio.Semaphore(self._max_concurrent_verifications)
+        size = self._verification_batch_size
+
+        async def create(batch: list[_Identified]) -> list[Project]:
+            async with semaphore:
+                try:
+                    exists = await self._batch_verifier.verify_many(
+                        [entry.repository for entry in batch]
+                    )
+                except self._verification_errors:
+                    self._logger.warning(
+                        "Verifying %d repositories failed", len(batch), exc_info=True
+                    )
+                    for entry in batch:
+                        entry.outcome.error = VERIFICATION_FAILED
+                    return []
+            return [
+                project
+                for entry in batch
+                if (project := self._create_verified(entry, exists, rules)) is not None
+            ]
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(create(pending[i : i + size]))
+                    for i in range(0, len(pending), size)
+                ]
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+        return [project for task in tasks for project in task.result()]
+
+    def _create_verified(
+        self,
+        entry: "_Identified",
+        exists: dict[RemoteRepository, bool],
+        rules: list[str],
+    ) -> Project | None:
+        repository = entry.repository
+        try:
+            if not exists.get(repository, False):
+                raise RemoteRepositoryDoesNotExistError(
+                    str(repository.repository_id), str(repository.provider)
+                )
+            return self._create_project_service.create_verified(
+                entry.outcome.url, rules
+            )
+        except DomainError as error:
+            entry.outcome.error = error.status
+            return None
+
+
+class _Identified(NamedTuple):
+    outcome: ProjectCreationOutcome
+    project_id: str
+    repository: RemoteRepository
@@ -0,0 +1,16 @@
+from .idempotency import IdempotencyMiddleware
+from .logs import LoggingMiddleware
+from .rate_limit import CommandRateLimits, RateLimitMiddleware
+from .retry import RetryMiddleware
+from .timing import COMMAND_DURATION_SECONDS, COMMANDS_IN_FLIGHT, TimingMiddleware
+
+__all__ = [
+    "COMMANDS_IN_FLIGHT",
+    "COMMAND_DURATION_SECONDS",
+    "CommandRateLimits",
+    "IdempotencyMiddleware",
+    "LoggingMiddleware",
+    "RateLimitMiddleware",
+    "RetryMiddleware",
+    "TimingMiddleware",
+]
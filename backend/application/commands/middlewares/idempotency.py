@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+from typing import Any
+
+from application.commands.bus import Middleware, NextStep
+from application.commands.commands import Command
+from application.commands.exceptions import (
+    IdempotencyKeyReusedError,
+    RateLimitExceededError,
+)
+from application.ports import IdempotencyStore, StoredCommandOutcome
+from domain.exception import DomainError
+
+
+class IdempotencyMiddleware(Middleware):
+    """Replays the stored outcome of commands retried with the same idempotency key.
+
+    Results and domain errors are stored for ``ttl_seconds``; other errors are
+    transient and not stored, so a retry runs the handler again. Rate limit
+    rejections are transient too, a retry after the limit's window must run.
+    Concurrent duplicates wait for the in-flight command instead of running it
+    twice. Keys are scoped by client and command type, and bound to the
+    command's payload.
+    """
+
+    def __init__(self, store: IdempotencyStore, ttl_seconds: float = 24 * 3600):
+        """Initialize the middleware.
+
+        Args:
+            store: Storage of command outcomes
+            ttl_seconds: How long outcomes are replayed
+        """
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._in_flight: dict[str, asyncio.Future[None]] = {}
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        if command.idempotency_key is None:
+            return await next_step(command)
+
+        client_id = command.client_id or ""
+        key = f"{type(command).__name__}:{client_id}:{command.idempotency_key}"
+        while (in_flight := self._in_flight.get(key)) is not None:
+            await asyncio.shield(in_flight)
+
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = done
+        try:
+            return await self._run_once(key, command, next_step)
+        finally:
+            del self._in_flight[key]
+            done.set_result(None)
+
+    async def _run_once(self, key: str, command: Command, next_step: NextStep) -> Any:
+        fingerprint = _fingerprint(command)
+        stored = await self._store.get(key)
+        if stored is not None:
+            return _replay(stored, fingerprint, command)
+
+        try:
+            result = await next_step(command)
+        except RateLimitExceededError:
+            raise
+        except DomainError as error:
+            outcome = StoredCommandOutcome(
+                fingerprint=fingerprint,
+                error_type=type(error),
+                error_args=error.args,
+                error_attributes=vars(error),
+            )
+            await self._store.put(key, outcome, self._ttl_seconds)
+            raise
+
+        outcome = StoredCommandOutcome(fingerprint=fingerprint, result=result)
+        await self._store.put(key, outcome, self._ttl_seconds)
+        return result
+
+
+def _fingerprint(command: Command) -> str:
+    payload = command.model_dump_json(exclude={"idempotency_key"})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _replay(stored: StoredCommandOutcome, fingerprint: str, command: Command) -> Any:
+    if stored.fingerprint != fingerprint:
+        raise IdempotencyKeyReusedError(command.idempotency_key or "")
+    if stored.error_type is not None:
+        raise _rebuild_error(
+            stored.error_type, stored.error_args, stored.error_attributes
+        )
+    return stored.result
+
+
+def _rebuild_error(
+    error_type: type[DomainError], args: tuple[Any, ...], attributes: dict[str, Any]
+) -> DomainError:
+    # Built without __init__, whose parameters differ from the args it sets
+    error = error_type.__new__(error_type, *args)
+    error.__dict__.update(attributes)
+    return error
@@ -0,0 +1,36 @@
+import logging
+import time
+from typing import Any
+
+from application.commands.bus import Middleware, NextStep
+from application.commands.commands import Command
+from domain.exception import DomainError
+
+
+class LoggingMiddleware(Middleware):
+    """Logs the outcome and duration of every command.
+
+    Domain errors are expected outcomes and logged as warnings, anything else
+    is logged with its traceback.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None):
+        self._logger = logger or logging.getLogger(__name__)
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        name = type(command).__name__
+        started = time.perf_counter()
+        try:
+            result = await next_step(command)
+        except DomainError as error:
+            self._logger.warning("Command %s rejected: %s", name, error.status)
+            raise
+        except Exception:
+            self._logger.exception("Command %s failed", name)
+            raise
+        self._logger.info(
+            "Command %s handled in %.1f ms",
+            name,
+            (time.perf_counter() - started) * 1000,
+        )
+        return result
@@ -0,0 +1,78 @@
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from application.commands.bus import Middleware, NextStep
+from application.commands.commands import Command
+from application.commands.exceptions import RateLimitExceededError
+from application.ports import RateLimit, RateLimitStore
+
+# Clients that do not identify themselves share one limit
+_ANONYMOUS_CLIENT = "anonymous"
+
+
+class CommandRateLimits(BaseModel):
+    """Rate limits of one command type, None where it is not limited."""
+
+    model_config = ConfigDict(frozen=True)
+
+    per_client: RateLimit | None = None
+    per_project: RateLimit | None = None
+
+
+class RateLimitMiddleware(Middleware):
+    """Rejects commands sent faster than their type's per-client or per-project limit.
+
+    The client's limit is checked first, then the limit of every project the
+    command targets; a rejection raises ``RateLimitExceededError`` carrying
+    the time after which a retry is accepted. Client counters are kept per
+    command type, project counters are shared by all command types. Command
+    types without limits pass through untouched.
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        limits: Mapping[type[Command], CommandRateLimits],
+        project_ids: Callable[[Command], Iterable[str]],
+    ):
+        """Initialize the middleware.
+
+        Args:
+            store: Sliding-window counters
+            limits: Limits by command type
+            project_ids: Returns the ids of the projects a command targets
+        """
+        self._store = store
+        self._limits = dict(limits)
+        self._project_ids = project_ids
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        limits = self._limits.get(type(command))
+        if limits is None:
+            return await next_step(command)
+
+        command_type = type(command).__name__
+        if limits.per_client is not None:
+            client_id = command.client_id or _ANONYMOUS_CLIENT
+            await self._consume(
+                f"{command_type}:client:{client_id}",
+                limits.per_client,
+                f"client '{client_id}'",
+            )
+        if limits.per_project is not None:
+            # Shared by every command type, a project is limited however it
+            # is targeted, e.g. alone or as part of a batch
+            for project_id in self._project_ids(command):
+                await self._consume(
+                    f"project:{project_id}",
+                    limits.per_project,
+                    f"project '{project_id}'",
+                )
+        return await next_step(command)
+
+    async def _consume(self, key: str, rate_limit: RateLimit, subject: str) -> None:
+        decision = await self._store.consume(key, rate_limit)
+        if not decision.allowed:
+            raise RateLimitExceededError(subject, decision.retry_after_seconds)
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any
+
+from application.commands.bus import Middleware, NextStep
+from application.commands.commands import Command
+
+
+class RetryMiddleware(Middleware):
+    """Retries commands failing with transient errors, with exponential backoff.
+
+    The bus builds a new handler for every attempt, so each retry runs in a
+    fresh unit of work.
+    """
+
+    def __init__(
+        self,
+        retry_on: tuple[type[Exception], ...],
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.1,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            retry_on: Exception types worth retrying, e.g. connection errors
+            max_attempts: Attempts including the first one
+            backoff_seconds: Delay before the first retry, doubled for each next
+        """
+        self._retry_on = retry_on
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return await next_step(command)
+            except self._retry_on:
+                if attempt >= self._max_attempts:
+                    raise
+            await asyncio.sleep(self._backoff_seconds * 2 ** (attempt - 1))
+            attempt += 1
@@ -0,0 +1,37 @@
+import time
+from typing import Any
+
+from application.commands.bus import Middleware, NextStep
+from application.commands.commands import Command
+from application.ports import MetricsRecorder
+
+COMMAND_DURATION_SECONDS = "command_duration_seconds"
+COMMANDS_IN_FLIGHT = "commands_in_flight"
+
+
+class TimingMiddleware(Middleware):
+    """Records per-command latency histograms and in-flight gauges.
+
+    Latency is labelled with the command name and its outcome, success or
+    error, the gauge with the command name only.
+    """
+
+    def __init__(self, metrics: MetricsRecorder):
+        self._metrics = metrics
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        labels = {"command": type(command).__name__}
+        outcome = "error"
+        self._metrics.add_to_gauge(COMMANDS_IN_FLIGHT, 1, labels)
+        started = time.perf_counter()
+        try:
+            result = await next_step(command)
+            outcome = "success"
+            return result
+        finally:
+            self._metrics.observe(
+                COMMAND_DURATION_SECONDS,
+                time.perf_counter() - started,
+                {**labels, "outcome": outcome},
+            )
+            self._metrics.add_to_gauge(COMMANDS_IN_FLIGHT, -1, labels)
@@ -0,0 +1,3 @@
+from .monitor import HealthMonitor, HealthReport, HealthStatus, ProbeResult
+
+__all__ = ["HealthMonitor", "HealthReport", "HealthStatus", "ProbeResult"]
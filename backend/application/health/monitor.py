@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+from application.ports import HealthProbe
+
+
+class HealthStatus(StrEnum):
+    """Aggregated state of the service's dependencies."""
+
+    STARTING = "starting"  # Probes have not completed yet
+    READY = "ready"  # Every dependency is healthy
+    DEGRADED = "degraded"  # Only non-critical dependencies are failing
+    UNAVAILABLE = "unavailable"  # A critical dependency is failing
+
+
+class ProbeResult(BaseModel):
+    """Outcome of the latest run of one probe."""
+
+    model_config = ConfigDict(frozen=True)
+
+    healthy: bool
+    critical: bool
+    latency_ms: float
+    checked_at: datetime
+    error: str | None = None
+
+
+class HealthReport(BaseModel):
+    """Cached view of all probe results."""
+
+    model_config = ConfigDict(frozen=True)
+
+    status: HealthStatus
+    checks: dict[str, ProbeResult]
+
+    @property
+    def ready(self) -> bool:
+        return self.status in (HealthStatus.READY, HealthStatus.DEGRADED)
+
+
+class HealthMonitor:
+    """Runs dependency probes in the background and caches their results.
+
+    Readiness requests read the cached report, so orchestrators may probe as
+    often as they like without every request reaching the dependencies.
+    """
+
+    def __init__(
+        self,
+        probes: Mapping[str, HealthProbe],
+        critical: frozenset[str] | None = None,
+        interval_seconds: float = 5.0,
+        timeout_seconds: float = 2.0,
+        logger: logging.Logger | None = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            probes: Probe of each dependency, by name
+            critical: Names of the probes whose failure makes the service
+                unavailable, all probes if None
+            interval_seconds: Time between two probe runs
+            timeout_seconds: Time after which a probe counts as failed
+            logger: Logger for failing probes
+        """
+        self._probes = dict(probes)
+        self._critical = frozenset(probes) if critical is None else critical
+        self._interval_seconds = interval_seconds
+        self._timeout_seconds = timeout_seconds
+        self._logger = logger or logging.getLogger(__name__)
+        self._report = HealthReport(status=HealthStatus.STARTING, checks={})
+        self._task: asyncio.Task[None] | None = None
+
+    def report(self) -> HealthReport:
+        """Return the results of the latest probe run."""
+        return self._report
+
+    def start(self) -> None:
+        """Start probing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.wait({self._task})
+        self._task = None
+
+    async def refresh(self) -> HealthReport:
+        """Run every probe once and cache the report."""
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._probe(name) for name in names))
+        checks = dict(zip(names, results, strict=True))
+        self._report = HealthReport(status=_status(checks), checks=checks)
+        return self._report
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._interval_seconds)
+
+    async def _probe(self, name: str) -> ProbeResult:
+        critical = name in self._critical
+        started = time.perf_counter()
+        error = None
+        try:
+            async with asyncio.timeout(self._timeout_seconds):
+                await self._probes[name].check()
+        except Exception as exc:
+            error = repr(exc)
+            self._logger.warning("Health probe %s failed: %s", name, error)
+        return ProbeResult(
+            healthy=error is None,
+            critical=critical,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            checked_at=datetime.now(UTC),
+            error=error,
+        )
+
+
+def _status(checks: Mapping[str, ProbeResult]) -> HealthStatus:
+    failing = [result for result in checks.values() if not result.healthy]
+    if any(result.critical for result in failing):
+        return HealthStatus.UNAVAILABLE
+    if failing:
+        return HealthStatus.DEGRADED
+    return HealthStatus.READY
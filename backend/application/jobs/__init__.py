@@ -0,0 +1,11 @@
+from .commands import CommandJobHandler, command_job_type, enqueue_command
+from .worker import JobHandler, JobTypeOptions, JobWorkerPool
+
+__all__ = [
+    "CommandJobHandler",
+    "JobHandler",
+    "JobTypeOptions",
+    "JobWorkerPool",
+    "command_job_type",
+    "enqueue_command",
+]
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from application.commands.bus import CommandBus
+from application.commands.commands import Command
+from application.ports import Job, JobQueue
+
+
+class CommandJobHandler[TCommand: Command]:
+    """Runs a command stored in a job through the command bus."""
+
+    def __init__(self, bus: CommandBus, command_type: type[TCommand]):
+        self._bus = bus
+        self._command_type = command_type
+
+    async def handle(self, job: Job) -> None:
+        await self._bus.dispatch(self._command_type.model_validate(job.payload))
+
+
+async def enqueue_command(
+    queue: JobQueue,
+    command: Command,
+    run_at: datetime | None = None,
+    max_attempts: int = 5,
+) -> Job:
+    """Queue a long-running command for the worker instead of running it inline.
+
+    The job type is the command's class name, see ``command_job_type``.
+    """
+    return await queue.enqueue(
+        command_job_type(type(command)),
+        command.model_dump(mode="json"),
+        run_at=run_at,
+        max_attempts=max_attempts,
+    )
+
+
+def command_job_type(command_type: type[Command]) -> str:
+    """Return the job type commands of the given type are queued under."""
+    return command_type.__name__
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+from pydantic import BaseModel
+
+from application.commands.exceptions import RateLimitExceededError
+from application.ports import Job, JobQueue
+from domain.exception import DomainError
+
+
+class JobHandler(Protocol):
+    async def handle(self, job: Job) -> None: ...
+
+
+class JobTypeOptions(BaseModel):
+    """Worker settings of one job type."""
+
+    concurrency: int = 1
+    visibility_timeout: float = 300.0
+    retry_backoff: float = 5.0
+
+
+class JobWorkerPool:
+    """Runs queued jobs with a separate concurrency limit per job type.
+
+    Each job type is polled by its own loop that claims only as many jobs as it
+    has free slots. A job running longer than its visibility timeout is
+    cancelled, since other workers may claim it again. Failed jobs are retried
+    with exponential backoff until ``max_attempts``; domain errors are not
+    transient, so those jobs are buried right away. Rate-limited jobs are
+    deferred until their limit allows them, without holding a slot meanwhile.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Mapping[str, JobHandler],
+        options: Mapping[str, JobTypeOptions] | None = None,
+        poll_interval: float = 1.0,
+        logger: logging.Logger | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            queue: Queue to claim jobs from
+            handlers: Handler of each job type the pool runs
+            options: Settings per job type, defaults for types not listed
+            poll_interval: Seconds to wait when no job is due
+            logger: Logger for job failures
+        """
+        self._queue = queue
+        self._handlers = dict(handlers)
+        self._options = dict(options or {})
+        self._poll_interval = poll_interval
+        self._logger = logger or logging.getLogger(__name__)
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Run until ``stop`` is called, then wait for running jobs to finish."""
+        self._stopping.clear()
+        async with asyncio.TaskGroup() as tg:
+            for job_type, handler in self._handlers.items():
+                options = self._options.get(job_type, JobTypeOptions())
+                tg.create_task(self._run_type(job_type, handler, options))
+
+    def stop(self) -> None:
+        """Stop claiming new jobs."""
+        self._stopping.set()
+
+    async def _run_type(
+        self, job_type: str, handler: JobHandler, options: JobTypeOptions
+    ) -> None:
+        running: set[asyncio.Task[None]] = set()
+        while not self._stopping.is_set():
+            jobs = await self._claim(job_type, options, len(running))
+            for job in jobs:
+                task = asyncio.create_task(self._execute(job, handler, options))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+            if not jobs or len(running) >= options.concurrency:
+                await self._wait(running)
+
+        if running:
+            await asyncio.wait(running)
+
+    async def _claim(
+        self, job_type: str, options: JobTypeOptions, running: int
+    ) -> list[Job]:
+        free_slots = options.concurrency - running
+        if free_slots <= 0:
+            return []
+        try:
+            return await self._queue.claim(
+                job_type, free_slots, options.visibility_timeout
+            )
+        except Exception:
+            self._logger.exception("Claiming %s jobs failed", job_type)
+            return []
+
+    async def _wait(self, running: set[asyncio.Task[None]]) -> None:
+        stopping = asyncio.create_task(self._stopping.wait())
+        try:
+            await asyncio.wait(
+                {stopping, *running},
+                timeout=self._poll_interval,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            stopping.cancel()
+
+    async def _execute(
+        self, job: Job, handler: JobHandler, options: JobTypeOptions
+    ) -> None:
+        if job.attempts > job.max_attempts:
+            self._settled(job, await self._queue.bury(job, "Maximum attempts exceeded"))
+            return
+
+        try:
+            async with asyncio.timeout(options.visibility_timeout):
+                await handler.handle(job)
+        except RateLimitExceededError as error:
+            self._logger.info("Job %s deferred: %s", job.id, error.message)
+            await self._defer(job, error)
+        except DomainError as error:
+            self._logger.warning("Job %s rejected: %s", job.id, error.status)
+            self._settled(job, await self._queue.bury(job, error.message))
+        except Exception as error:
+            self._logger.exception("Job %s failed", job.id)
+            await self._fail(job, repr(error), options)
+        else:
+            self._settled(job, await self._queue.complete(job))
+
+    async def _defer(self, job: Job, error: RateLimitExceededError) -> None:
+        if job.attempts >= job.max_attempts:
+            self._settled(job, await self._queue.bury(job, error.message))
+            return
+
+        run_at = datetime.now(UTC) + timedelta(seconds=error.retry_after_seconds)
+        self._settled(job, await self._queue.retry(job, run_at, error.message))
+
+    async def _fail(self, job: Job, error: str, options: JobTypeOptions) -> None:
+        if job.attempts >= job.max_attempts:
+            self._settled(job, await self._queue.bury(job, error))
+            return
+
+        delay = options.retry_backoff * 2 ** (job.attempts - 1)
+        run_at = datetime.now(UTC) + timedelta(seconds=delay)
+        self._settled(job, await self._queue.retry(job, run_at, error))
+
+    def _settled(self, job: Job, settled: bool) -> None:
+        # Past the visibility timeout another worker may have claimed the job
+        # again, its outcome is then left to that worker.
+        if not settled:
+            self._logger.warning("Job %s lease lost, outcome dropped", job.id)
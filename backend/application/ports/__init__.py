@@ -0,0 +1,24 @@
+from .events import EventPublisher, EventSubscriber, EventSubscription
+from .health import HealthProbe
+from .idempotency import IdempotencyStore, StoredCommandOutcome
+from .jobs import Job, JobQueue, JobStatus
+from .metrics import MetricsRecorder
+from .providers import ProviderUnavailableError
+from .rate_limit import RateLimit, RateLimitDecision, RateLimitStore
+
+__all__ = [
+    "EventPublisher",
+    "EventSubscriber",
+    "EventSubscription",
+    "HealthProbe",
+    "IdempotencyStore",
+    "Job",
+    "JobQueue",
+    "JobStatus",
+    "MetricsRecorder",
+    "ProviderUnavailableError",
+    "RateLimit",
+    "RateLimitDecision",
+    "RateLimitStore",
+    "StoredCommandOutcome",
+]
@@ -0,0 +1,41 @@
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+from domain.event import DomainEvent
+
+
+class EventPublisher(Protocol):
+    """Delivers committed domain events to interested parties."""
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        """Publish events in the order they were recorded."""
+        ...
+
+
+class EventSubscription(Protocol):
+    """Live feed of the events published while it is open."""
+
+    evicted: bool
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription is closed and every event was consumed."""
+        ...
+
+    async def get(self, timeout: float | None = None) -> DomainEvent | None:
+        """Wait for the next event, None on timeout or once closed."""
+        ...
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        ...
+
+
+class EventSubscriber(Protocol):
+    """Source of live domain events, e.g. for push channels to clients."""
+
+    def subscribe(
+        self, accepts: Callable[[DomainEvent], bool] = ...
+    ) -> EventSubscription:
+        """Subscribe to the events matching the filter."""
+        ...
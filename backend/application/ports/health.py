@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class HealthProbe(Protocol):
+    """Checks that a dependency is usable, e.g. the database or a provider."""
+
+    async def check(self) -> None:
+        """Return when the dependency is healthy, raise otherwise."""
+        ...
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from domain.exception import DomainError
+
+
+class StoredCommandOutcome(BaseModel):
+    """Outcome of a command stored under its idempotency key."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    fingerprint: str
+    result: Any = None
+    # Errors are kept as their parts, so every replay raises a fresh instance
+    error_type: type[DomainError] | None = None
+    error_args: tuple[Any, ...] = ()
+    error_attributes: dict[str, Any] = {}
+
+
+class IdempotencyStore(ABC):
+    """Storage of command outcomes keyed by client-supplied idempotency keys."""
+
+    @abstractmethod
+    async def get(self, key: str) -> StoredCommandOutcome | None:
+        """Return the outcome stored under the key, None if absent or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put(
+        self, key: str, outcome: StoredCommandOutcome, ttl_seconds: float
+    ) -> None:
+        """Store the outcome under the key for the given time."""
+        raise NotImplementedError
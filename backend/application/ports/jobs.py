@@ -0,0 +1,78 @@
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobStatus(StrEnum):
+    """Lifecycle state of a stored job."""
+
+    PENDING = "pending"  # Waiting for its run time or claimed by a worker
+    DONE = "done"  # Completed successfully
+    DEAD = "dead"  # Buried after a permanent failure, kept for inspection
+
+
+class Job(BaseModel):
+    """Unit of background work claimed from the job queue."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: uuid.UUID
+    job_type: str
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+
+
+class JobQueue(ABC):
+    """Durable queue of background jobs shared by API and worker processes.
+
+    A claimed job is hidden from other workers for the visibility timeout.
+    If it is neither completed, retried nor buried by then, e.g. because the
+    worker died, it becomes claimable again. Every claim counts an attempt, so
+    the attempts of a claimed job identify its lease: once another worker has
+    claimed the job again, the previous holder can no longer change it.
+    """
+
+    # Whether jobs outlive the process and are seen by other processes
+    durable: bool = True
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: dict[str, Any],
+        run_at: datetime | None = None,
+        max_attempts: int = 5,
+    ) -> Job:
+        """Add a job, due immediately unless scheduled with ``run_at``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(
+        self, job_type: str, limit: int, visibility_timeout: float
+    ) -> list[Job]:
+        """Claim up to ``limit`` due jobs of the type, counting an attempt for each."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, job: Job) -> bool:
+        """Mark a claimed job as done, False if its lease was lost."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retry(self, job: Job, run_at: datetime, error: str) -> bool:
+        """Release a claimed job to run at ``run_at``, False if its lease was lost."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bury(self, job: Job, error: str) -> bool:
+        """Move a claimed job to the dead letter state, False if its lease was lost.
+
+        A buried job is not run again.
+        """
+        raise NotImplementedError
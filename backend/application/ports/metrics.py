@@ -0,0 +1,24 @@
+from collections.abc import Mapping
+from typing import Protocol
+
+
+class MetricsRecorder(Protocol):
+    """Sink for application metrics, implemented by the metrics adapter."""
+
+    def observe(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Record a sample of a histogram, e.g. a latency in seconds."""
+        ...
+
+    def increment(
+        self, name: str, amount: float = 1.0, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Increase a counter."""
+        ...
+
+    def add_to_gauge(
+        self, name: str, amount: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """Move a gauge up or down, e.g. the number of calls in flight."""
+        ...
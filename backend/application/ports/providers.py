@@ -0,0 +1,9 @@
+class ProviderUnavailableError(Exception):
+    """Error raised by provider adapters when a provider cannot answer.
+
+    Lets inbound adapters answer "service unavailable" without importing the
+    provider adapters.
+    """
+
+    # Seconds until the provider is expected to answer again, None if unknown
+    retry_after_seconds: float | None = None
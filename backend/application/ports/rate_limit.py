@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RateLimit(BaseModel):
+    """Number of requests allowed within a sliding window."""
+
+    model_config = ConfigDict(frozen=True)
+
+    limit: int
+    window_seconds: float
+
+
+class RateLimitDecision(BaseModel):
+    """Outcome of consuming from a rate limit."""
+
+    model_config = ConfigDict(frozen=True)
+
+    allowed: bool
+    # Seconds until the request would be allowed, 0 when it was
+    retry_after_seconds: float = 0.0
+
+
+class RateLimitStore(ABC):
+    """Sliding-window counters keyed by client, project or any other subject.
+
+    Consuming must be atomic per key, so that a shared backend enforces one
+    limit across every process.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, rate_limit: RateLimit) -> RateLimitDecision:
+        """Count one request against the key's limit, unless it is exhausted."""
+        raise NotImplementedError
@@ -0,0 +1,9 @@
+from domain.exception import DomainError
+
+
+class InvalidCursorError(DomainError):
+    """Error raised when a page cursor was not issued by a previous page."""
+
+    def __init__(self) -> None:
+        """Initialize invalid cursor error."""
+        super().__init__("Invalid page cursor")
@@ -0,0 +1,26 @@
+from collections.abc import Callable
+
+from application.queries.queries import GetProjectQuery
+from domain.ports import ReadRepository
+from domain.ports.specifications import ProjectByIdSpecification
+from domain.project.aggregate import Project
+
+
+class GetProjectQueryHandler:
+    def __init__(
+        self,
+        repository: ReadRepository[Project],
+        specification_factory: Callable[[str], ProjectByIdSpecification],
+    ):
+        self._repository = repository
+        self._specification_factory = specification_factory
+
+    async def handle(self, query: GetProjectQuery) -> Project:
+        """Return the project.
+
+        Raises:
+            EntityNotFoundError: If the project is not tracked
+        """
+        return await self._repository.find_one(
+            self._specification_factory(query.project_id)
+        )
@@ -0,0 +1,47 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Protocol
+
+from application.queries.pagination import Page, decode_cursor, encode_cursor
+from application.queries.queries import ListProjectsQuery
+from domain.ports import ReadRepository
+from domain.ports.specifications import AllProjectsSpecification
+from domain.project.aggregate import Project
+
+
+class AllProjectsSpecificationFactory(Protocol):
+    def __call__(
+        self, after: tuple[datetime, str] | None = None, limit: int | None = None
+    ) -> AllProjectsSpecification: ...
+
+
+class ListProjectsQueryHandler:
+    def __init__(
+        self,
+        repository: ReadRepository[Project],
+        specification_factory: AllProjectsSpecificationFactory,
+    ):
+        self._repository = repository
+        self._specification_factory = specification_factory
+
+    async def handle(self, query: ListProjectsQuery) -> Page[Project]:
+        """Read one page of projects, or all of them when the query has no limit.
+
+        One project more than the limit is read to tell whether another page
+        follows, without counting the remaining projects.
+        """
+        after = None if query.cursor is None else decode_cursor(query.cursor)
+        limit = None if query.limit is None else query.limit + 1
+        projects = await self._repository.find_all(
+            self._specification_factory(after=after, limit=limit)
+        )
+        if query.limit is None or len(projects) <= query.limit:
+            return Page(items=projects)
+
+        items = projects[: query.limit]
+        last = items[-1]
+        return Page(items=items, next_cursor=encode_cursor(last.created_at, last.id()))
+
+    def stream(self, _query: ListProjectsQuery) -> AsyncIterator[Project]:
+        """Iterate over the projects without loading them all at once."""
+        return self._repository.stream(self._specification_factory())
@@ -0,0 +1,37 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from application.queries.exceptions import InvalidCursorError
+
+
+class Page[TItem](BaseModel):
+    """Items of one page, with the cursor of the next page if there is one."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    items: list[TItem]
+    next_cursor: str | None = None
+
+
+def encode_cursor(created_at: datetime, entity_id: str) -> str:
+    """Encode the sort key of the last item of a page into an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), entity_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor issued by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, entity_id = json.loads(payload)
+        return datetime.fromisoformat(created_at), str(entity_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise InvalidCursorError() from error
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class Query(BaseModel):
+    pass
+
+
+class GetProjectQuery(Query):
+    project_id: str
+
+
+class ListProjectsQuery(Query):
+    # Every project when None, otherwise one page of at most ``limit``
+    limit: int | None = None
+    # Opaque cursor of the page to read, the first page when None
+    cursor: str | None = None
@@ -0,0 +1,117 @@
+"""Parse benchmark of the Diff value object.
+
+Measures the throughput and the peak memory of walking a large diff: only
+its files and hunks, and every line of it, next to decoding and splitting
+the whole diff up front. The input buffer itself is excluded from the peak.
+
+By default the diff of this repository's whole history is repeated up to
+the requested size; pass ``--diff`` to use a pull request diff instead, e.g.
+one downloaded from ``https://github.com/<owner>/<repo>/pull/<n>.diff``.
+
+Run from the backend directory::
+
+    python -m benchmarks.diff_parse [--diff PATH] [--size-mb 32] [--rounds 5]
+"""
+
+import argparse
+import gc
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from domain.analysis.value_objects import Diff
+
+BACKEND_DIRECTORY = Path(__file__).resolve().parent.parent
+
+
+def repository_diff(size_bytes: int) -> bytes:
+    """Return the diff of the repository's history, repeated up to the size."""
+    root = subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"],
+        cwd=BACKEND_DIRECTORY,
+        capture_output=True,
+        check=True,
+    ).stdout.split()[0]
+    diff = subprocess.run(
+        ["git", "diff", "--no-color", root.decode(), "HEAD"],
+        cwd=BACKEND_DIRECTORY,
+        capture_output=True,
+        check=True,
+    ).stdout
+    return diff * max(1, size_bytes // len(diff))
+
+
+def walk_hunks(content: bytes) -> int:
+    """Find every file and hunk without decoding their lines."""
+    return sum(1 for file in Diff(content).files() for _ in file.hunks())
+
+
+def walk_lines(content: bytes) -> int:
+    """Decode and number every line of every hunk."""
+    return sum(
+        1
+        for file in Diff(content).files()
+        for hunk in file.hunks()
+        for _ in hunk.lines()
+    )
+
+
+def split_lines(content: bytes) -> int:
+    """Baseline: decode the whole diff and split it into lines up front."""
+    return len(content.decode("utf-8", "replace").split("\n"))
+
+
+def measure(
+    parse: Callable[[bytes], int], content: bytes, rounds: int
+) -> tuple[float, int]:
+    """Return the median seconds of a parse and its peak of allocated bytes."""
+    timings = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        parse(content)
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    parser.add_argument("--diff", type=Path, help="unified diff to parse")
+    parser.add_argument("--size-mb", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.diff is not None:
+        content = args.diff.read_bytes()
+    else:
+        content = repository_diff(args.size_mb * 1024 * 1024)
+    megabytes = len(content) / (1024 * 1024)
+    files = sum(1 for _ in Diff(content).files())
+    print(f"diff: {megabytes:.1f} MiB, {files} files")
+
+    scenarios: dict[str, Callable[[bytes], int]] = {
+        "files and hunks": walk_hunks,
+        "every line": walk_lines,
+        "decode and split": split_lines,
+    }
+    for name, parse in scenarios.items():
+        seconds, peak = measure(parse, content, args.rounds)
+        print(
+            f"  {name:<18} {megabytes / seconds:8.1f} MiB/s"
+            f"  peak {peak / (1024 * 1024):8.1f} MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Overhead benchmark of the request metrics middleware.
+
+Measures the time per request of a small FastAPI app called through ASGI,
+without a server or sockets in between, with and without
+``RequestMetricsMiddleware``, and the cost of the recorder calls the
+middleware makes for one request on their own.
+
+Run from the backend directory::
+
+    python -m benchmarks.metrics_overhead [--requests 20000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from adapters.inbound.api.middlewares import RequestMetricsMiddleware
+from adapters.inbound.api.middlewares.metrics import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_REQUESTS_TOTAL,
+)
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+
+PATH = "/items/42"
+
+
+def build_app(with_metrics: bool) -> ASGIApp:
+    """Build an app with one templated route, wrapped in the middleware if asked."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    if with_metrics:
+        app.add_middleware(RequestMetricsMiddleware, metrics=InMemoryMetricsRegistry())
+    return app
+
+
+async def serve(app: ASGIApp, requests: int) -> None:
+    """Send the requests to the app one after another."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+
+
+def record(requests: int) -> None:
+    """Make the recorder calls of the middleware, without any request."""
+    metrics = InMemoryMetricsRegistry()
+    in_flight = {"method": "GET"}
+    for _ in range(requests):
+        metrics.add_to_gauge(HTTP_REQUESTS_IN_FLIGHT, 1, in_flight)
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        metrics.observe(HTTP_REQUEST_DURATION_SECONDS, 0.001, labels)
+        metrics.increment(HTTP_REQUESTS_TOTAL, labels=labels)
+        metrics.add_to_gauge(HTTP_REQUESTS_IN_FLIGHT, -1, in_flight)
+
+
+def measure(run: Callable[[], None], requests: int, rounds: int) -> float:
+    """Return the median microseconds per request over the rounds."""
+    timings = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) / requests * 1_000_000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    bare, measured = build_app(with_metrics=False), build_app(with_metrics=True)
+    without_metrics = measure(
+        lambda: asyncio.run(serve(bare, args.requests)), args.requests, args.rounds
+    )
+    with_metrics = measure(
+        lambda: asyncio.run(serve(measured, args.requests)), args.requests, args.rounds
+    )
+    recording = measure(lambda: record(args.requests), args.requests, args.rounds)
+
+    overhead = with_metrics - without_metrics
+    print(f"requests: {args.requests} x {args.rounds} rounds")
+    print(f"  without metrics  {without_metrics:8.2f} us/request")
+    print(
+        f"  with metrics     {with_metrics:8.2f} us/request"
+        f"  (+{overhead:.2f} us, {overhead / without_metrics:+.1%})"
+    )
+    print(f"  recording only   {recording:8.2f} us/request")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Startup benchmark of the web API.
+
+Measures, in fresh interpreters, the time to import the application module,
+the time from process start to the first served request, and which modules
+the import spends its time on. Fails when a measurement exceeds the budget
+in ``startup_budget.json`` or when a deferred module is loaded on import.
+
+Run from the backend directory::
+
+    python -m benchmarks.startup
+"""
+
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+from pydantic import BaseModel
+
+APP_MODULE = "bootstrap.web_app"
+READY_PATH = "/api/v1/health/live"
+BUDGET_FILE = Path(__file__).with_name("startup_budget.json")
+BACKEND_DIRECTORY = Path(__file__).resolve().parent.parent
+
+
+class Budget(BaseModel):
+    import_seconds: float
+    first_request_seconds: float
+    # Modules that must load on startup or first use, never on import
+    deferred_modules: list[str]
+
+
+class ImportProfile(BaseModel):
+    seconds: float
+    # Microseconds spent in each imported module itself, without its imports
+    modules: dict[str, int]
+
+
+def profile_import(module: str = APP_MODULE) -> ImportProfile:
+    """Import the module in a fresh interpreter with ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, total, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(own)
+        cumulative[name.strip()] = int(total)
+    return ImportProfile(seconds=cumulative[module] / 1_000_000, modules=modules)
+
+
+def time_to_first_request(timeout_seconds: float = 30.0) -> float:
+    """Start a server process and return the seconds until it answers."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{READY_PATH}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            f"{APP_MODULE}:bootstrap_web_api",
+            "--factory",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIRECTORY,
+    )
+    try:
+        while time.perf_counter() - started < timeout_seconds:
+            try:
+                with urllib.request.urlopen(url, timeout=1.0) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError(f"server did not answer {url} in {timeout_seconds}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def package_breakdown(profile: ImportProfile) -> dict[str, int]:
+    """Sum the import time of the modules of each top-level package."""
+    packages: dict[str, int] = defaultdict(int)
+    for name, microseconds in profile.modules.items():
+        packages[name.partition(".")[0]] += microseconds
+    return dict(sorted(packages.items(), key=lambda item: -item[1]))
+
+
+def main(rounds: int = 5) -> int:
+    budget = Budget.model_validate_json(BUDGET_FILE.read_text())
+    profiles = [profile_import() for _ in range(rounds)]
+    import_seconds = statistics.median(profile.seconds for profile in profiles)
+    first_request_seconds = statistics.median(
+        time_to_first_request() for _ in range(rounds)
+    )
+
+    print(f"import {APP_MODULE}: {import_seconds * 1000:.0f} ms")
+    print(f"first served request: {first_request_seconds * 1000:.0f} ms")
+    print("import time by top-level package:")
+    for package, microseconds in list(package_breakdown(profiles[-1]).items())[:15]:
+        print(f"  {package:<30} {microseconds / 1000:8.1f} ms")
+
+    failures = [
+        f"{module} is imported eagerly"
+        for module in budget.deferred_modules
+        if module in profiles[-1].modules
+    ]
+    if import_seconds > budget.import_seconds:
+        failures.append(f"import exceeds {budget.import_seconds}s budget")
+    if first_request_seconds > budget.first_request_seconds:
+        failures.append(f"first request exceeds {budget.first_request_seconds}s budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port: int = probe.getsockname()[1]
+        return port
+
+
+if __name__ == "__main__":
+    sys.exit(main())
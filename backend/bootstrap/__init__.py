@@ -1,3 +1,42 @@
-from .web_app import bootstrap_web_api
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["bootstrap_web_api"]
+if TYPE_CHECKING:
+    from .container import Container, open_container
+    from .server import run_server, server_config
+    from .settings import Settings
+    from .web_app import bootstrap_web_api
+    from .worker import bootstrap_worker, run_worker
+
+# Submodules are imported on first access, so that a process only loads the
+# adapters it runs, e.g. the web server does not import the job worker and
+# defers the container to its lifespan startup
+_EXPORTS = {
+    "Container": ".container",
+    "Settings": ".settings",
+    "bootstrap_web_api": ".web_app",
+    "bootstrap_worker": ".worker",
+    "open_container": ".container",
+    "run_server": ".server",
+    "run_worker": ".worker",
+    "server_config": ".server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
+
+
+__all__ = [
+    "Container",
+    "Settings",
+    "bootstrap_web_api",
+    "bootstrap_worker",
+    "open_container",
+    "run_server",
+    "run_worker",
+    "server_config",
+]
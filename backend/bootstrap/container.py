@@ -0,0 +1,309 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from adapters.outbound.events import FanOutEventPublisher, InMemoryEventHub
+from adapters.outbound.idempotency import InMemoryIdempotencyStore
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+from adapters.outbound.providers import (
+    CircuitBreakerProbe,
+    CircuitBreakerRegistry,
+    CircuitBreakingBatchVerifier,
+    CircuitBreakingVerifier,
+    CoalescingVerifier,
+    InMemoryHttpValidatorCache,
+    ProviderError,
+    ProviderHttpClient,
+    RateLimitScheduler,
+)
+from adapters.outbound.providers.github import (
+    GITHUB_API_URL,
+    GitHubBatchRepositoryVerifier,
+    GitHubRepositoryVerifier,
+    github_headers,
+)
+from adapters.outbound.rate_limit import InMemoryRateLimitStore
+from application.commands.bus import CommandBus
+from application.commands.commands import (
+    Command,
+    CreateProjectCommand,
+    CreateProjectsCommand,
+)
+from application.commands.handlers.create_project_command_handler import (
+    CreateProjectCommandHandler,
+)
+from application.commands.handlers.create_projects_command_handler import (
+    CreateProjectsCommandHandler,
+)
+from application.commands.middlewares import (
+    CommandRateLimits,
+    IdempotencyMiddleware,
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    TimingMiddleware,
+)
+from application.health import HealthMonitor
+from application.ports import EventPublisher, HealthProbe, JobQueue, RateLimit
+from application.queries.handlers.get_project_query_handler import (
+    GetProjectQueryHandler,
+)
+from application.queries.handlers.list_projects_query_handler import (
+    ListProjectsQueryHandler,
+)
+from domain.exception import DomainError
+from domain.ports import ReadRepository, UnitOfWork
+from domain.ports.specifications import (
+    AllProjectsSpecification,
+    ExistingProjectsSpecification,
+    ProjectAlreadyExistsSpecification,
+    ProjectByIdSpecification,
+)
+from domain.project import value_objects as vo
+from domain.project.aggregate import Project
+from domain.project.factories import (
+    DefaultPoliciesFactory,
+    ProjectFactory,
+    URLBasedValueObjectsFactory,
+)
+from domain.project.services import CreateProjectService
+
+from .settings import Settings
+from .storage import InMemoryStorage, Storage
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class Container:
+    """Composition root holding the application's singletons.
+
+    Stateless services, factories, the provider HTTP session and the database
+    pool are built once per process. Only units of work are created per
+    command, by the handler factories registered on the command bus.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        session: aiohttp.ClientSession,
+        engine: "AsyncEngine | None" = None,
+        metrics: InMemoryMetricsRegistry | None = None,
+        event_listeners: Sequence[EventPublisher] = (),
+    ):
+        """Build the object graph.
+
+        Args:
+            settings: Runtime configuration
+            session: HTTP session shared by all provider clients
+            engine: Database engine, projects and jobs are kept in memory if None
+            metrics: Registry shared with components built before the container
+            event_listeners: Receive committed events before live subscribers
+        """
+        self.settings = settings
+        self.engine = engine
+        self.metrics = metrics or InMemoryMetricsRegistry()
+        self.event_hub = InMemoryEventHub()
+        self.event_publisher = FanOutEventPublisher([*event_listeners, self.event_hub])
+        self.storage = _storage(engine)
+        self.job_queue: JobQueue = self.storage.job_queue
+        self.project_repository: ReadRepository[Project] = (
+            self.storage.project_repository
+        )
+
+        self.value_objects_factory = URLBasedValueObjectsFactory()
+        self.project_factory = ProjectFactory(
+            DefaultPoliciesFactory(), self.value_objects_factory
+        )
+        self.provider_client = ProviderHttpClient(
+            session,
+            validator_cache=InMemoryHttpValidatorCache(),
+            headers=github_headers(settings.github_token),
+            scheduler=RateLimitScheduler(
+                settings.provider_rate, settings.provider_burst
+            ),
+            rate_limit_key=RateLimitScheduler.bucket_key(
+                "github", settings.github_token
+            ),
+        )
+        self.circuit_breakers = CircuitBreakerRegistry()
+        self.create_project_service = CreateProjectService(
+            self.project_factory,
+            self.value_objects_factory,
+            [
+                CoalescingVerifier(
+                    CircuitBreakingVerifier(
+                        GitHubRepositoryVerifier(
+                            self.provider_client,
+                            settings.github_api_url or GITHUB_API_URL,
+                        ),
+                        self.circuit_breakers,
+                    )
+                )
+            ],
+        )
+        self.batch_verifier = CircuitBreakingBatchVerifier(
+            GitHubBatchRepositoryVerifier(
+                self.provider_client,
+                graphql_url=f"{settings.github_api_url or GITHUB_API_URL}/graphql",
+            ),
+            self.circuit_breakers,
+        )
+        self.bus = self._build_bus()
+        self.get_project_handler = GetProjectQueryHandler(
+            self.project_repository, self.project_by_id_specification
+        )
+        self.list_projects_handler = ListProjectsQueryHandler(
+            self.project_repository, self.all_projects_specification
+        )
+        self.health_monitor = self._build_health_monitor()
+
+    def unit_of_work[TQueryResult](self) -> UnitOfWork[TQueryResult]:
+        """Create the unit of work of one command or request."""
+        return self.storage.unit_of_work(self.event_publisher)
+
+    def project_exists_specification(
+        self, command: CreateProjectCommand
+    ) -> ProjectAlreadyExistsSpecification:
+        """Build the query checking whether the command's project is tracked."""
+        project_id = str(
+            self.value_objects_factory.create_from_url(vo.URL(command.url)).project_id
+        )
+        return self.storage.project_exists_specification(project_id)
+
+    def existing_projects_specification(
+        self, project_ids: list[str]
+    ) -> ExistingProjectsSpecification:
+        """Build the query selecting which of the project ids are tracked."""
+        return self.storage.existing_projects_specification(project_ids)
+
+    def project_by_id_specification(self, project_id: str) -> ProjectByIdSpecification:
+        """Build the query selecting one project."""
+        return self.storage.project_by_id_specification(project_id)
+
+    def all_projects_specification(
+        self, after: tuple[datetime, str] | None = None, limit: int | None = None
+    ) -> AllProjectsSpecification:
+        """Build the query selecting the projects after ``after``, at most ``limit``."""
+        return self.storage.all_projects_specification(after, limit)
+
+    def command_project_ids(self, command: Command) -> Iterable[str]:
+        """Return the ids of the projects a command targets, for rate limits."""
+        if isinstance(command, CreateProjectCommand):
+            urls = [command.url]
+        elif isinstance(command, CreateProjectsCommand):
+            urls = command.urls
+        else:
+            return []
+        project_ids: dict[str, None] = {}
+        for url in urls:
+            try:
+                value_objects = self.value_objects_factory.create_from_url(vo.URL(url))
+            except DomainError:
+                # Invalid URLs are rejected by the handler, not counted
+                continue
+            project_ids[str(value_objects.project_id)] = None
+        return list(project_ids)
+
+    def _build_health_monitor(self) -> HealthMonitor:
+        probes: dict[str, HealthProbe] = {
+            "providers": CircuitBreakerProbe(self.circuit_breakers),
+            **self.storage.probes(),
+        }
+        # Reads keep working while a provider is down, so it only degrades
+        return HealthMonitor(
+            probes,
+            critical=frozenset({"database", "job_queue"}),
+            interval_seconds=self.settings.health_check_interval_seconds,
+        )
+
+    def _build_bus(self) -> CommandBus:
+        bus = CommandBus(
+            [
+                LoggingMiddleware(),
+                TimingMiddleware(self.metrics),
+                IdempotencyMiddleware(InMemoryIdempotencyStore()),
+                self._build_rate_limits(),
+            ]
+        )
+        bus.register(
+            CreateProjectCommand,
+            lambda: CreateProjectCommandHandler(
+                self.unit_of_work(),
+                self.create_project_service,
+                self.project_exists_specification,
+                optimistic=self.settings.optimistic_project_creation,
+            ),
+        )
+        bus.register(
+            CreateProjectsCommand,
+            lambda: CreateProjectsCommandHandler(
+                self.unit_of_work(),
+                self.create_project_service,
+                self.batch_verifier,
+                self.value_objects_factory,
+                self.existing_projects_specification,
+                max_concurrent_verifications=self.settings.max_concurrent_verifications,
+                verification_errors=(ProviderError, aiohttp.ClientError, TimeoutError),
+            ),
+        )
+        return bus
+
+    def _build_rate_limits(self) -> RateLimitMiddleware:
+        window = self.settings.rate_limit_window_seconds
+
+        def per_window(limit: int) -> RateLimit:
+            return RateLimit(limit=limit, window_seconds=window)
+
+        limits: dict[type[Command], CommandRateLimits] = {
+            CreateProjectCommand: CommandRateLimits(
+                per_client=per_window(self.settings.create_project_rate_per_client),
+                per_project=per_window(self.settings.create_project_rate_per_project),
+            ),
+            CreateProjectsCommand: CommandRateLimits(
+                per_client=per_window(self.settings.create_projects_rate_per_client),
+                per_project=per_window(self.settings.create_project_rate_per_project),
+            ),
+        }
+        return RateLimitMiddleware(
+            InMemoryRateLimitStore(), limits, self.command_project_ids
+        )
+
+
+@asynccontextmanager
+async def open_container(
+    settings: Settings,
+    metrics: InMemoryMetricsRegistry | None = None,
+    event_listeners: Sequence[EventPublisher] = (),
+) -> AsyncIterator[Container]:
+    """Build the container and release its session and pool on exit."""
+    session = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=settings.provider_timeout_seconds)
+    )
+    engine = None
+    if settings.database_url is not None:
+        from .postgres_storage import create_engine
+
+        engine = create_engine(settings.database_url, settings)
+    try:
+        container = Container(settings, session, engine, metrics, event_listeners)
+        container.health_monitor.start()
+        try:
+            yield container
+        finally:
+            await container.health_monitor.stop()
+    finally:
+        await session.close()
+        if engine is not None:
+            await engine.dispose()
+
+
+def _storage(engine: "AsyncEngine | None") -> Storage:
+    if engine is None:
+        return InMemoryStorage()
+    # Imported here so that SQLAlchemy is only loaded when a database is configured
+    from .postgres_storage import PostgresStorage
+
+    return PostgresStorage(engine)
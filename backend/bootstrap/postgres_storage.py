@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from adapters.outbound.postgres import (
+    PostgresAllProjectsSpecification,
+    PostgresExistingProjectsSpecification,
+    PostgresJobQueue,
+    PostgresProbe,
+    PostgresProjectAlreadyExistsSpecification,
+    PostgresProjectByIdSpecification,
+    PostgresProjectReadRepository,
+    PostgresUnitOfWork,
+    jobs_table,
+)
+from application.ports import EventPublisher, HealthProbe
+from domain.ports import UnitOfWork
+from domain.ports.specifications import (
+    AllProjectsSpecification,
+    ExistingProjectsSpecification,
+    ProjectAlreadyExistsSpecification,
+    ProjectByIdSpecification,
+)
+
+from .settings import Settings
+from .storage import Storage
+
+
+def create_engine(database_url: str, settings: Settings) -> AsyncEngine:
+    """Create the pooled database engine."""
+    return create_async_engine(
+        database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+class PostgresStorage(Storage):
+    """Keeps projects and jobs in PostgreSQL.
+
+    Lives in its own module so that SQLAlchemy is only imported when a
+    database is configured.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+        self.job_queue = PostgresJobQueue(engine)
+        self.project_repository = PostgresProjectReadRepository(engine)
+
+    def unit_of_work[TQueryResult](
+        self, publisher: EventPublisher
+    ) -> UnitOfWork[TQueryResult]:
+        return PostgresUnitOfWork(self._engine, publisher)
+
+    def project_exists_specification(
+        self, project_id: str
+    ) -> ProjectAlreadyExistsSpecification:
+        return PostgresProjectAlreadyExistsSpecification(repo_id=project_id)
+
+    def existing_projects_specification(
+        self, project_ids: list[str]
+    ) -> ExistingProjectsSpecification:
+        return PostgresExistingProjectsSpecification(project_ids=project_ids)
+
+    def project_by_id_specification(self, project_id: str) -> ProjectByIdSpecification:
+        return PostgresProjectByIdSpecification(project_id=project_id)
+
+    def all_projects_specification(
+        self, after: tuple[datetime, str] | None = None, limit: int | None = None
+    ) -> AllProjectsSpecification:
+        return PostgresAllProjectsSpecification(after=after, limit=limit)
+
+    def probes(self) -> dict[str, HealthProbe]:
+        return {
+            "database": PostgresProbe(self._engine),
+            "job_queue": PostgresProbe(self._engine, select(jobs_table.c.id).limit(1)),
+        }
@@ -0,0 +1,70 @@
+import os
+
+import uvicorn
+
+from .settings import Settings
+
+WEB_APP_FACTORY = "bootstrap.web_app:bootstrap_web_api"
+
+# Options set by server_config; run_server reads them back from its config
+_OPTIONS = (
+    "factory",
+    "host",
+    "port",
+    "workers",
+    "loop",
+    "http",
+    "lifespan",
+    "backlog",
+    "timeout_keep_alive",
+    "timeout_graceful_shutdown",
+    "proxy_headers",
+    "log_level",
+)
+
+
+def server_config(settings: Settings) -> uvicorn.Config:
+    """Build the production server configuration.
+
+    Workers are separate processes, each running the application factory and
+    its lifespan, so every worker has its container, pools and health probes
+    ready before it accepts a connection. ``web_workers`` set to 0 starts one
+    worker per CPU available to the process.
+
+    Args:
+        settings: Runtime configuration
+
+    Returns:
+        uvicorn.Config: Configuration using uvloop and httptools
+    """
+    return uvicorn.Config(
+        WEB_APP_FACTORY,
+        factory=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.web_workers or os.process_cpu_count() or 1,
+        loop="uvloop",
+        http="httptools",
+        # A failing startup must stop the worker instead of serving without singletons
+        lifespan="on",
+        backlog=settings.web_backlog,
+        # Longer than the idle timeout of load balancers, so they close first
+        timeout_keep_alive=settings.web_keep_alive_seconds,
+        timeout_graceful_shutdown=settings.web_graceful_shutdown_seconds,
+        proxy_headers=True,
+        log_level="info",
+    )
+
+
+def run_server(settings: Settings) -> None:
+    """Serve the web API until SIGTERM or SIGINT.
+
+    On either signal every worker stops accepting connections, closes idle
+    keep-alive connections and waits up to ``web_graceful_shutdown_seconds``
+    for in-flight requests and their background tasks before the container
+    is shut down.
+    """
+    config = server_config(settings)
+    # uvicorn.run is the public entry point that supervises workers, and it
+    # takes options rather than a config
+    uvicorn.run(config.app, **{option: getattr(config, option) for option in _OPTIONS})
@@ -0,0 +1,62 @@
+import os
+from collections.abc import Mapping
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Settings(BaseModel):
+    """Runtime configuration, read from upper-cased environment variables."""
+
+    model_config = ConfigDict(frozen=True)
+
+    host: str = "0.0.0.0"
+    port: int = 8000
+    # Web server processes, 0 starts one per CPU
+    web_workers: int = 1
+    web_backlog: int = 2048
+    web_keep_alive_seconds: int = 75
+    web_graceful_shutdown_seconds: int = 30
+    # SQLAlchemy URL, e.g. postgresql+asyncpg://...; in-memory storage when unset
+    database_url: str | None = None
+    database_pool_size: int = 10
+    database_max_overflow: int = 5
+    github_token: str | None = None
+    # Public GitHub API when unset
+    github_api_url: str | None = None
+    provider_timeout_seconds: float = 10.0
+    provider_rate: float = 1.0
+    provider_burst: int = 10
+    max_concurrent_verifications: int = 20
+    optimistic_project_creation: bool = False
+    health_check_interval_seconds: float = 5.0
+    response_cache_max_entries: int = 1024
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+    response_cache_ttl_seconds: float = 60.0
+    # Adaptive concurrency limit of each route, see AimdLimit
+    admission_initial_limit: int = 20
+    admission_max_limit: int = 200
+    admission_latency_target_seconds: float = 0.5
+    # Commands accepted per sliding window, see RateLimitMiddleware
+    rate_limit_window_seconds: float = 60.0
+    create_project_rate_per_client: int = 30
+    create_project_rate_per_project: int = 5
+    create_projects_rate_per_client: int = 2
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    # Request profiling is off unless a directory for the profiles is set
+    profiling_directory: str | None = None
+    profiling_token: str | None = None
+    profiling_sample_rate: float = 0.0
+    profiling_interval_seconds: float = 0.005
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> Self:
+        """Read the settings from the environment, keeping defaults for unset ones."""
+        return cls.model_validate(
+            {
+                name: environ[name.upper()]
+                for name in cls.model_fields
+                if name.upper() in environ
+            }
+        )
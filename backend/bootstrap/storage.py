@@ -0,0 +1,98 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from adapters.outbound.jobs import InMemoryJobQueue
+from adapters.outbound.projects import (
+    InMemoryAllProjectsSpecification,
+    InMemoryExistingProjectsSpecification,
+    InMemoryProjectAlreadyExistsSpecification,
+    InMemoryProjectByIdSpecification,
+    InMemoryProjectReadRepository,
+    InMemoryProjectStore,
+    InMemoryUnitOfWork,
+)
+from application.ports import EventPublisher, HealthProbe, JobQueue
+from domain.ports import ReadRepository, UnitOfWork
+from domain.ports.specifications import (
+    AllProjectsSpecification,
+    ExistingProjectsSpecification,
+    ProjectAlreadyExistsSpecification,
+    ProjectByIdSpecification,
+)
+from domain.project.aggregate import Project
+
+
+class Storage(ABC):
+    """Persistence adapters of one storage backend, built together."""
+
+    job_queue: JobQueue
+    project_repository: ReadRepository[Project]
+
+    @abstractmethod
+    def unit_of_work[TQueryResult](
+        self, publisher: EventPublisher
+    ) -> UnitOfWork[TQueryResult]:
+        """Create a unit of work publishing its events after commit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def project_exists_specification(
+        self, project_id: str
+    ) -> ProjectAlreadyExistsSpecification:
+        """Build the query checking whether the project is tracked."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def existing_projects_specification(
+        self, project_ids: list[str]
+    ) -> ExistingProjectsSpecification:
+        """Build the query selecting which of the project ids are tracked."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def project_by_id_specification(self, project_id: str) -> ProjectByIdSpecification:
+        """Build the query selecting one project."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def all_projects_specification(
+        self, after: tuple[datetime, str] | None = None, limit: int | None = None
+    ) -> AllProjectsSpecification:
+        """Build the query selecting the projects after ``after``, at most ``limit``."""
+        raise NotImplementedError
+
+    def probes(self) -> dict[str, HealthProbe]:
+        """Return the health probes of the backend's critical dependencies."""
+        return {}
+
+
+class InMemoryStorage(Storage):
+    """Keeps projects and jobs in process memory."""
+
+    def __init__(self) -> None:
+        self._store = InMemoryProjectStore()
+        self.job_queue = InMemoryJobQueue()
+        self.project_repository = InMemoryProjectReadRepository(self._store)
+
+    def unit_of_work[TQueryResult](
+        self, publisher: EventPublisher
+    ) -> UnitOfWork[TQueryResult]:
+        return InMemoryUnitOfWork(self._store, publisher)
+
+    def project_exists_specification(
+        self, project_id: str
+    ) -> ProjectAlreadyExistsSpecification:
+        return InMemoryProjectAlreadyExistsSpecification(repo_id=project_id)
+
+    def existing_projects_specification(
+        self, project_ids: list[str]
+    ) -> ExistingProjectsSpecification:
+        return InMemoryExistingProjectsSpecification(project_ids=project_ids)
+
+    def project_by_id_specification(self, project_id: str) -> ProjectByIdSpecification:
+        return InMemoryProjectByIdSpecification(project_id=project_id)
+
+    def all_projects_specification(
+        self, after: tuple[datetime, str] | None = None, limit: int | None = None
+    ) -> AllProjectsSpecification:
+        return InMemoryAllProjectsSpecification(after=after, limit=limit)
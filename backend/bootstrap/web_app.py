@@ -1,35 +1,105 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from adapters.inbound.api.routers import health_router
+from adapters.inbound.api import (
+    AdmissionControlMiddleware,
+    AimdLimit,
+    CompressionMiddleware,
+    ProfilingMiddleware,
+    RequestMetricsMiddleware,
+    ResponseCache,
+    events_router,
+    health_router,
+    metrics_router,
+    projects_router,
+    register_error_handlers,
+)
+from adapters.outbound.metrics import InMemoryMetricsRegistry, render_prometheus
+
+from .settings import Settings
 
 
-def _create_web_api() -> FastAPI:
+def _create_web_api(settings: Settings) -> FastAPI:
     """Create and configure the FastAPI web application."""
+    # Built ahead of the container, since middleware is set up before startup
+    metrics = InMemoryMetricsRegistry()
+    response_cache = ResponseCache(
+        max_entries=settings.response_cache_max_entries,
+        max_bytes=settings.response_cache_max_bytes,
+        ttl_seconds=settings.response_cache_ttl_seconds,
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Provider and database adapters load on startup, not on import
+        from .container import open_container
+
+        async with open_container(settings, metrics, [response_cache]) as container:
+            app.state.container = container
+            app.state.command_bus = container.bus
+            app.state.unit_of_work_factory = container.unit_of_work
+            app.state.get_project_handler = container.get_project_handler
+            app.state.list_projects_handler = container.list_projects_handler
+            app.state.event_subscriber = container.event_hub
+            app.state.health_monitor = container.health_monitor
+            yield
+
     app = FastAPI(
         title="Review Genie API",
         description="A web API for Review Genie application",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    app.state.metrics_exposition = lambda: render_prometheus(metrics)
+    app.state.response_cache = response_cache
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+    )
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limit_factory=lambda: AimdLimit(
+            initial_limit=settings.admission_initial_limit,
+            max_limit=settings.admission_max_limit,
+            latency_target=settings.admission_latency_target_seconds,
+        ),
+        metrics=metrics,
+    )
+    app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+    if settings.profiling_directory is not None:
+        app.add_middleware(
+            ProfilingMiddleware,
+            directory=settings.profiling_directory,
+            token=settings.profiling_token,
+            sample_rate=settings.profiling_sample_rate,
+            interval_seconds=settings.profiling_interval_seconds,
+        )
+
     # Include routers
     app.include_router(health_router, prefix="/api/v1")
+    app.include_router(projects_router, prefix="/api/v1")
+    app.include_router(events_router, prefix="/api/v1")
+    app.include_router(metrics_router)
+    register_error_handlers(app, metrics)
 
     return app
 
 
-def bootstrap_web_api() -> FastAPI:
+def bootstrap_web_api(settings: Settings | None = None) -> FastAPI:
     """Bootstrap the web application.
 
     This factory method creates and configures the FastAPI application
-    with all necessary components.
+    with all necessary components. Singletons are built by the container
+    on startup and released on shutdown.
+
+    Args:
+        settings: Runtime configuration, read from the environment if None
 
     Returns:
         FastAPI: Configured FastAPI application instance.
     """
-    # Create the web API adapter
-    app = _create_web_api()
-
-    # Add any additional configuration here
-    # For example: middleware, exception handlers, startup/shutdown events
-
-    return app
+    return _create_web_api(settings or Settings.from_env())
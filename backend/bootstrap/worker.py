@@ -0,0 +1,64 @@
+import asyncio
+import signal
+from collections.abc import Iterable, Mapping
+
+from application.commands.bus import CommandBus
+from application.commands.commands import Command
+from application.jobs import (
+    CommandJobHandler,
+    JobTypeOptions,
+    JobWorkerPool,
+    command_job_type,
+)
+from application.ports import JobQueue
+
+
+def bootstrap_worker(
+    queue: JobQueue,
+    bus: CommandBus,
+    command_types: Iterable[type[Command]],
+    options: Mapping[type[Command], JobTypeOptions] | None = None,
+) -> JobWorkerPool:
+    """Bootstrap the worker pool running queued commands.
+
+    Args:
+        queue: Queue shared with the web API
+        bus: Command bus the queued commands are dispatched through
+        command_types: Commands the worker runs, each is its own job type
+        options: Concurrency and timeouts per command type
+
+    Returns:
+        JobWorkerPool: Pool running one loop per command type
+
+    Raises:
+        ValueError: If the queue is not durable, the worker would not see the
+            jobs enqueued by the web API
+    """
+    if not queue.durable:
+        raise ValueError(
+            "The worker needs a durable job queue, set DATABASE_URL to run it"
+        )
+    options = options or {}
+    return JobWorkerPool(
+        queue,
+        handlers={
+            command_job_type(command_type): CommandJobHandler(bus, command_type)
+            for command_type in command_types
+        },
+        options={
+            command_job_type(command_type): type_options
+            for command_type, type_options in options.items()
+        },
+    )
+
+
+async def run_worker(pool: JobWorkerPool) -> None:
+    """Run the pool until SIGTERM or SIGINT, then let running jobs finish."""
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, pool.stop)
+    try:
+        await pool.run()
+    finally:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(signum)
@@ -0,0 +1,3 @@
+from .malformed_diff import MalformedDiffError
+
+__all__ = ["MalformedDiffError"]
@@ -0,0 +1,13 @@
+from domain.exception import DomainError
+
+
+class MalformedDiffError(DomainError):
+    """Error raised when a diff is not in unified diff format."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialize malformed diff error.
+
+        Args:
+            reason: What part of the diff could not be parsed
+        """
+        super().__init__(f"Malformed diff: {reason}")
@@ -0,0 +1,12 @@
+"""Value objects for analysis domain."""
+
+from .diff import Diff, DiffLine, FileDiff, FileStatus, Hunk, LineKind
+
+__all__ = [
+    "Diff",
+    "DiffLine",
+    "FileDiff",
+    "FileStatus",
+    "Hunk",
+    "LineKind",
+]
@@ -0,0 +1,372 @@
+import re
+from collections.abc import Buffer, Iterator
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from ..exceptions import MalformedDiffError
+
+
+class _LinePattern:
+    """Finds the lines starting with a pattern.
+
+    Searching for the newline ending the previous line lets the regex engine
+    skip ahead with a literal scan, unlike anchoring with ``^`` in multiline
+    mode, which tries the pattern at every position.
+    """
+
+    def __init__(self, pattern: bytes):
+        self._first_line = re.compile(pattern)
+        self._next_lines = re.compile(b"\n" + pattern)
+
+    def spans(
+        self, buffer: memoryview, start: int = 0, end: int | None = None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield the start and end of every match between the offsets."""
+        end = len(buffer) if end is None else end
+        if start == 0 or buffer[start - 1] == ord("\n"):
+            first = self._first_line.match(buffer, start, end)
+            if first is not None:
+                yield first.span()
+        for match in self._next_lines.finditer(buffer, start, end):
+            yield match.start() + 1, match.end()
+
+    def first(
+        self, buffer: memoryview, start: int = 0, end: int | None = None
+    ) -> tuple[int, int] | None:
+        """Return the span of the first match between the offsets, if any."""
+        return next(self.spans(buffer, start, end), None)
+
+
+# Hunk lines always start with " ", "+", "-" or "\", so these headers can only
+# open a file or a hunk and are found without walking the lines in between.
+# Plain file headers are the exception: a removed "-- " line followed by an
+# added "++ " line looks like one, so they are only searched outside hunks.
+_GIT_FILE_HEADER = _LinePattern(rb"diff --git ")
+_PLAIN_FILE_HEADER = _LinePattern(rb"--- [^\n]*\n\+\+\+ ")
+_HUNK_HEADER = _LinePattern(rb"@@[^\n]*")
+_NON_WHITESPACE = re.compile(rb"\S")
+_NEWLINE = re.compile(rb"\n")
+_HUNK_RANGES = re.compile(rb"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)")
+# Git escapes the bytes of quoted paths as three octal digits
+_QUOTED_ESCAPE = re.compile(r"\\([0-3][0-7]{2}|.)", re.DOTALL)
+_QUOTED_ESCAPES = {
+    "a": "\a",
+    "b": "\b",
+    "t": "\t",
+    "n": "\n",
+    "v": "\v",
+    "f": "\f",
+    "r": "\r",
+}
+
+_DEV_NULL = "/dev/null"
+_NO_NEWLINE_MARKER = "\\"
+
+
+class FileStatus(StrEnum):
+    """How a pull request changed a file."""
+
+    ADDED = "added"
+    DELETED = "deleted"
+    MODIFIED = "modified"
+    RENAMED = "renamed"
+
+
+class LineKind(StrEnum):
+    """Kind of a line of a hunk, by its prefix."""
+
+    ADDED = "+"
+    REMOVED = "-"
+    CONTEXT = " "
+
+
+@dataclass(frozen=True)
+class DiffLine:
+    """Line of a hunk with its number in the old and the new file.
+
+    ``old_number`` is None for added lines, ``new_number`` for removed ones.
+    """
+
+    kind: LineKind
+    content: str
+    old_number: int | None
+    new_number: int | None
+
+
+@dataclass(frozen=True)
+class Hunk:
+    """Contiguous change of a file, a view over the diff it was parsed from.
+
+    Its text is only decoded when ``text`` or ``lines`` is called.
+    """
+
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+    # Text after the ranges, usually the enclosing function
+    section: str
+    start: int
+    end: int
+    buffer: memoryview = field(repr=False, compare=False)
+
+    @property
+    def raw(self) -> memoryview:
+        """Return the lines of the hunk, without its header and without copying."""
+        return self.buffer[self.start : self.end]
+
+    @property
+    def text(self) -> str:
+        """Decode the lines of the hunk, undecodable bytes are replaced."""
+        return str(self.raw, "utf-8", "replace")
+
+    def lines(self) -> Iterator[DiffLine]:
+        """Iterate over the lines of the hunk, numbered as in the old and new file.
+
+        Stops after the line counts of the header, so trailing text that is not
+        part of the hunk is ignored.
+        """
+        old_number, new_number = self.old_start, self.new_start
+        old_left, new_left = self.old_count, self.new_count
+        for line in self.text.split("\n"):
+            if old_left <= 0 and new_left <= 0:
+                return
+            prefix, content = line[:1], line[1:]
+            if prefix == LineKind.ADDED:
+                yield DiffLine(LineKind.ADDED, content, None, new_number)
+                new_number += 1
+                new_left -= 1
+            elif prefix == LineKind.REMOVED:
+                yield DiffLine(LineKind.REMOVED, content, old_number, None)
+                old_number += 1
+                old_left -= 1
+            elif prefix == _NO_NEWLINE_MARKER:
+                continue
+            else:
+                # Some tools strip the space of empty context lines
+                yield DiffLine(LineKind.CONTEXT, content, old_number, new_number)
+                old_number += 1
+                new_number += 1
+                old_left -= 1
+                new_left -= 1
+
+
+@dataclass(frozen=True)
+class FileDiff:
+    """Changes of one file, a view over the diff it was parsed from.
+
+    Only the file's header is parsed up front; its hunks are found when
+    ``hunks`` is iterated.
+    """
+
+    old_path: str | None
+    new_path: str | None
+    status: FileStatus
+    is_binary: bool
+    start: int
+    end: int
+    buffer: memoryview = field(repr=False, compare=False)
+
+    @property
+    def path(self) -> str:
+        """Return the path of the file after the change, or before if deleted."""
+        # Parsing guarantees that at least one of the paths is set
+        return self.new_path or self.old_path or ""
+
+    def hunks(self) -> Iterator[Hunk]:
+        """Iterate over the hunks of the file, in order."""
+        headers = list(_HUNK_HEADER.spans(self.buffer, self.start, self.end))
+        for index, (header_start, header_end) in enumerate(headers):
+            ranges = _HUNK_RANGES.fullmatch(self.buffer[header_start:header_end])
+            if ranges is None:
+                raise MalformedDiffError(f"invalid hunk header in {self.path}")
+            old_start, old_count, new_start, new_count, section = ranges.groups()
+            end = headers[index + 1][0] if index + 1 < len(headers) else self.end
+            yield Hunk(
+                old_start=int(old_start),
+                old_count=1 if old_count is None else int(old_count),
+                new_start=int(new_start),
+                new_count=1 if new_count is None else int(new_count),
+                section=section.decode("utf-8", "replace").rstrip("\r"),
+                start=min(header_end + 1, end),
+                end=end,
+                buffer=self.buffer,
+            )
+
+
+@dataclass(frozen=True)
+class Diff:
+    """Code differences of a pull request, in unified diff format.
+
+    Wraps the diff as received, without copying it: files are found lazily
+    with their offsets into the buffer, and the text of a hunk is decoded
+    only once it is read, so a diff of tens of megabytes costs little more
+    than its own bytes. Git diffs, as every supported provider returns them,
+    are split on their ``diff --git`` headers; other unified diffs on their
+    ``---``/``+++`` headers.
+    """
+
+    content: Buffer = field(repr=False)
+    _view: memoryview = field(init=False, repr=False, compare=False)
+    _is_git: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate that the diff starts a file, unless it is empty."""
+        view = memoryview(self.content).cast("B")
+        is_git = _GIT_FILE_HEADER.first(view) is not None
+        object.__setattr__(self, "_view", view)
+        object.__setattr__(self, "_is_git", is_git)
+        if (
+            not is_git
+            and _PLAIN_FILE_HEADER.first(view) is None
+            and _NON_WHITESPACE.search(view) is not None
+        ):
+            raise MalformedDiffError("no file header found")
+
+    @property
+    def size(self) -> int:
+        """Return the size of the diff in bytes."""
+        return self._view.nbytes
+
+    def files(self) -> Iterator[FileDiff]:
+        """Iterate over the changed files, in order."""
+        if self._is_git:
+            starts = [start for start, _ in _GIT_FILE_HEADER.spans(self._view)]
+        else:
+            starts = list(_plain_file_starts(self._view))
+        for index, start in enumerate(starts):
+            end = starts[index + 1] if index + 1 < len(starts) else self.size
+            yield _parse_file(self._view, start, end)
+
+
+def _plain_file_starts(buffer: memoryview) -> Iterator[int]:
+    """Yield the offsets of the ``---``/``+++`` headers outside hunk bodies.
+
+    Hunks are skipped by the line counts of their headers; the text between a
+    hunk and the next hunk header is the only place a file header can be.
+    """
+    position = 0
+    while True:
+        hunk = _HUNK_HEADER.first(buffer, position)
+        file_end = len(buffer) if hunk is None else hunk[0]
+        file_header = _PLAIN_FILE_HEADER.first(buffer, position, file_end)
+        if file_header is not None:
+            yield file_header[0]
+        if hunk is None:
+            return
+        position = _hunk_end(buffer, *hunk)
+
+
+def _hunk_end(buffer: memoryview, header_start: int, header_end: int) -> int:
+    """Return the offset of the line after the lines counted by a hunk header."""
+    size = len(buffer)
+    position = min(header_end + 1, size)
+    ranges = _HUNK_RANGES.fullmatch(buffer[header_start:header_end])
+    if ranges is None:
+        # Reported when the file's hunks are read
+        return position
+    _, old_count, _, new_count, _ = ranges.groups()
+    old_left = 1 if old_count is None else int(old_count)
+    new_left = 1 if new_count is None else int(new_count)
+    while position < size and (
+        old_left > 0 or new_left > 0 or buffer[position] == ord(_NO_NEWLINE_MARKER)
+    ):
+        prefix = buffer[position]
+        if prefix == ord(LineKind.ADDED):
+            new_left -= 1
+        elif prefix == ord(LineKind.REMOVED):
+            old_left -= 1
+        elif prefix != ord(_NO_NEWLINE_MARKER):
+            old_left -= 1
+            new_left -= 1
+        newline = _NEWLINE.search(buffer, position)
+        position = size if newline is None else newline.end()
+    return position
+
+
+def _parse_file(buffer: memoryview, start: int, end: int) -> FileDiff:
+    first_hunk = _HUNK_HEADER.first(buffer, start, end)
+    header_end = end if first_hunk is None else first_hunk[0]
+    header = str(buffer[start:header_end], "utf-8", "replace").split("\n")
+
+    old_path = new_path = None
+    renamed = is_binary = False
+    for line in header:
+        line = line.rstrip("\r")
+        if line.startswith("diff --git "):
+            old_path, new_path = _git_paths(line.removeprefix("diff --git "))
+        elif line.startswith("--- "):
+            old_path = _path(line.removeprefix("--- "))
+        elif line.startswith("+++ "):
+            new_path = _path(line.removeprefix("+++ "))
+        elif line.startswith("rename from "):
+            old_path, renamed = _unquote(line.removeprefix("rename from ")), True
+        elif line.startswith("rename to "):
+            new_path, renamed = _unquote(line.removeprefix("rename to ")), True
+        elif line.startswith("new file mode"):
+            old_path = None
+        elif line.startswith("deleted file mode"):
+            new_path = None
+        elif line.startswith(("Binary files ", "GIT binary patch")):
+            is_binary = True
+
+    if old_path is None and new_path is None:
+        raise MalformedDiffError(f"file without path at offset {start}")
+    return FileDiff(
+        old_path=old_path,
+        new_path=new_path,
+        status=_status(old_path, new_path, renamed),
+        is_binary=is_binary,
+        start=header_end,
+        end=end,
+        buffer=buffer,
+    )
+
+
+def _status(old_path: str | None, new_path: str | None, renamed: bool) -> FileStatus:
+    if old_path is None:
+        return FileStatus.ADDED
+    if new_path is None:
+        return FileStatus.DELETED
+    if renamed or old_path != new_path:
+        return FileStatus.RENAMED
+    return FileStatus.MODIFIED
+
+
+def _git_paths(paths: str) -> tuple[str | None, str | None]:
+    # Both paths are equal unless renamed, in which case later headers tell them
+    if paths.startswith('"'):
+        old, _, new = paths.partition('" ')
+        return _path(old + '"'), _path(new)
+    half = (len(paths) - 1) // 2
+    if paths[half] == " " and paths[2:half] == paths[half + 3 :]:
+        return _path(paths[:half]), _path(paths[half + 1 :])
+    old, _, new = paths.partition(" b/")
+    return _path(old), _path("b/" + new)
+
+
+def _path(path: str) -> str | None:
+    # Unified diffs may follow the path with a tab and a timestamp
+    path = _unquote(path.partition("\t")[0])
+    if path == _DEV_NULL:
+        return None
+    return path[2:] if path.startswith(("a/", "b/")) else path
+
+
+def _unquote(path: str) -> str:
+    # Git quotes paths with special characters, C-style with octal escapes
+    if len(path) < 2 or not path.startswith('"') or not path.endswith('"'):
+        return path
+    quoted = path[1:-1]
+    unquoted = bytearray()
+    position = 0
+    for escape in _QUOTED_ESCAPE.finditer(quoted):
+        unquoted += quoted[position : escape.start()].encode()
+        code = escape[1]
+        if len(code) == 3:
+            unquoted.append(int(code, 8))
+        else:
+            unquoted += _QUOTED_ESCAPES.get(code, code).encode()
+        position = escape.end()
+    unquoted += quoted[position:].encode()
+    return unquoted.decode("utf-8", "replace")
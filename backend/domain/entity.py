@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from domain.event import DomainEvent
+
 
 class Entity(ABC):
     """Base class for all entities."""
@@ -14,3 +16,7 @@ class Entity(ABC):
         if not isinstance(other, Entity):
             return False
         return self.id() == other.id()
+
+    def pull_events(self) -> list[DomainEvent]:
+        """Return and clear the events recorded since the last call."""
+        return []
@@ -1,18 +1,17 @@
 import datetime
 import uuid
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DomainEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     occurred_at: datetime.datetime = Field(
         default_factory=lambda: datetime.datetime.now(datetime.UTC)
     )
 
-    class Config:
-        frozen = True
-
     def serialize(self) -> dict:
         return self.model_dump()
 
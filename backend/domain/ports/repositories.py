@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from types import TracebackType
 from typing import Self
 
@@ -17,6 +18,11 @@ class ReadRepository[TQueryResult](ABC):
         """Find all repositories."""
         raise NotImplementedError
 
+    async def stream(self, specification: Specification) -> AsyncIterator[TQueryResult]:
+        """Iterate over matches, overridden by adapters that can stream rows."""
+        for result in await self.find_all(specification):
+            yield result
+
 
 class SaveRepository[TEntity: Entity](ABC):
     @abstractmethod
@@ -54,6 +60,11 @@ class UnitOfWork[TQueryResult](ABC):
         """Save an entity to the database."""
         raise NotImplementedError
 
+    async def save_all(self, entities: Sequence[Entity]) -> None:
+        """Save many entities, overridden by adapters that can batch writes."""
+        for entity in entities:
+            await self.save(entity)
+
     @abstractmethod
     async def make_query(self, specification: Specification) -> TQueryResult:
         """Make a query to the database."""
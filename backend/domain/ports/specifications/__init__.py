@@ -1,7 +1,13 @@
+from .all_projects import AllProjectsSpecification
+from .existing_projects import ExistingProjectsSpecification
 from .project_already_exists import ProjectAlreadyExistsSpecification
+from .project_by_id import ProjectByIdSpecification
 from .specification import Specification
 
 __all__ = [
+    "AllProjectsSpecification",
+    "ExistingProjectsSpecification",
     "ProjectAlreadyExistsSpecification",
+    "ProjectByIdSpecification",
     "Specification",
 ]
@@ -0,0 +1,17 @@
+from abc import ABC
+from datetime import datetime
+
+from .specification import Specification
+
+
+class AllProjectsSpecification[TQueryResult](Specification[TQueryResult], ABC):
+    """Selects tracked projects, oldest first.
+
+    Pages are read by keyset: only projects sorting after ``after``, the
+    ``(created_at, id)`` of the last project already read, are selected, at
+    most ``limit`` of them. Adapters back this order with an index, so every
+    page costs the same however deep it is.
+    """
+
+    after: tuple[datetime, str] | None = None
+    limit: int | None = None
@@ -0,0 +1,9 @@
+from abc import ABC
+
+from .specification import Specification
+
+
+class ExistingProjectsSpecification[TQueryResult](Specification[TQueryResult], ABC):
+    """Selects which of the given project ids are already tracked."""
+
+    project_ids: list[str]
@@ -0,0 +1,9 @@
+from abc import ABC
+
+from .specification import Specification
+
+
+class ProjectByIdSpecification[TQueryResult](Specification[TQueryResult], ABC):
+    """Selects the project with the given id."""
+
+    project_id: str
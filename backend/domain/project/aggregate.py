@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from domain.entity import Entity
+from domain.event import DomainEvent
 from domain.project import value_objects as vo
 
 
@@ -36,7 +37,49 @@ class Project(Entity):
         self._owner = owner
         self._created_at = created_at
         self._updated_at = updated_at
+        self._events: list[DomainEvent] = []
 
     def id(self) -> str:
         """Return the id of the project."""
         return str(self._id)
+
+    def record_event(self, event: DomainEvent) -> None:
+        """Record an event, published once the project is committed."""
+        self._events.append(event)
+
+    def pull_events(self) -> list[DomainEvent]:
+        """Return and clear the events recorded since the last call."""
+        events, self._events = self._events, []
+        return events
+
+    @property
+    def repo_id(self) -> vo.RepositoryId:
+        return self._repo_id
+
+    @property
+    def provider(self) -> vo.Provider:
+        return self._provider
+
+    @property
+    def policies(self) -> vo.Policies:
+        return self._policies
+
+    @property
+    def rules(self) -> vo.Rules:
+        return self._rules
+
+    @property
+    def url(self) -> vo.URL:
+        return self._url
+
+    @property
+    def owner(self) -> vo.Owner:
+        return self._owner
+
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
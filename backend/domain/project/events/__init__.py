@@ -0,0 +1,3 @@
+from .project_created import ProjectCreated
+
+__all__ = ["ProjectCreated"]
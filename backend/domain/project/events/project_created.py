@@ -0,0 +1,8 @@
+from domain.event import DomainEvent
+
+
+class ProjectCreated(DomainEvent):
+    """A repository started being tracked."""
+
+    project_id: str
+    url: str
@@ -3,6 +3,7 @@ from datetime import datetime
 from domain.project import factories
 from domain.project import value_objects as vo
 from domain.project.aggregate import Project
+from domain.project.events import ProjectCreated
 
 from .value_objects_factory import ValueObjectsFactory
 
@@ -44,14 +45,14 @@ class ProjectFactory:
             updated_at: Optional last update timestamp
 
         Returns:
-            A new Project aggregate instance
+            A new Project aggregate instance, with a ProjectCreated event recorded
         """
         url_vo = vo.URL(url)
         project_value_objects = self._value_objects_factory.create_from_url(url_vo)
         policies = self._policies_factory.create_policies()
         rules_vo = vo.Rules(rules)
 
-        return Project(
+        project = Project(
             project_id=project_value_objects.project_id,
             repo_id=project_value_objects.repository_id,
             provider=project_value_objects.provider,
@@ -62,3 +63,5 @@ class ProjectFactory:
             created_at=created_at or datetime.now(),
             updated_at=updated_at or datetime.now(),
         )
+        project.record_event(ProjectCreated(project_id=project.id(), url=url))
+        return project
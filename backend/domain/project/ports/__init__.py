@@ -1,3 +1,8 @@
+from .verify_remote_repositories import BatchRemoteRepositoryVerifier, RemoteRepository
 from .verify_remote_repository_existence import RemoteRepositoryVerifier
 
-__all__ = ["RemoteRepositoryVerifier"]
+__all__ = [
+    "BatchRemoteRepositoryVerifier",
+    "RemoteRepository",
+    "RemoteRepositoryVerifier",
+]
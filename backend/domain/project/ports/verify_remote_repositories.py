@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from domain.project import value_objects as vo
+
+
+@dataclass(frozen=True)
+class RemoteRepository:
+    """Coordinates of a repository on a provider."""
+
+    repository_id: vo.RepositoryId
+    provider: vo.Provider
+    owner: vo.Owner
+
+
+class BatchRemoteRepositoryVerifier(Protocol):
+    async def verify_many(
+        self, repositories: Sequence[RemoteRepository]
+    ) -> dict[RemoteRepository, bool]:
+        """Check the existence of many repositories at once.
+
+        Returns:
+            Mapping of every requested repository to whether it exists
+        """
+        ...
@@ -5,5 +5,8 @@ from domain.project import value_objects as vo
 
 class RemoteRepositoryVerifier(Protocol):
     async def verify(
-        self, repository_id: vo.RepositoryId, provider: vo.Provider
+        self,
+        repository_id: vo.RepositoryId,
+        provider: vo.Provider,
+        owner: vo.Owner,
     ) -> bool: ...
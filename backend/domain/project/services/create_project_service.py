@@ -56,15 +56,30 @@ class CreateProjectService:
 
         repo_id = project_value_objects.repository_id
         provider = project_value_objects.provider
+        owner = project_value_objects.owner
 
         is_verified = False
         for verifier in self._remote_repository_verifiers:
             is_verified = await verifier.verify(
-                repository_id=repo_id, provider=provider
+                repository_id=repo_id, provider=provider, owner=owner
             )
             if is_verified:
                 break
         if not is_verified:
-            raise RemoteRepositoryDoesNotExistError(repo_id, provider)
+            raise RemoteRepositoryDoesNotExistError(str(repo_id), str(provider))
 
         return self._project_factory.create(url, rules)
+
+    def create_verified(self, url: str, rules: list[str]) -> Project:
+        """Create a Project aggregate whose repository was verified beforehand.
+
+        Used when the repositories of many projects are verified in one batch.
+
+        Args:
+            url: URL of the repository
+            rules: List of rules to apply to the project
+
+        Returns:
+            A new Project aggregate
+        """
+        return self._project_factory.create(url, rules)
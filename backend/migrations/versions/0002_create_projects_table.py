@@ -0,0 +1,41 @@
+"""Create the projects table.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.String(255), primary_key=True),
+        sa.Column("provider", sa.String(20), nullable=False),
+        sa.Column("owner", sa.String(100), nullable=False),
+        sa.Column("repository_id", sa.String(100), nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("rules", postgresql.JSONB(), nullable=False),
+        sa.Column("pull_request_policy", sa.String(30), nullable=False),
+        sa.Column("retry_limit_type", sa.String(20), nullable=False),
+        sa.Column("retry_limit_value", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    # Keyset pagination of the listings seeks through this index
+    op.create_index("ix_projects_created_at_id", "projects", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_created_at_id", table_name="projects")
+    op.drop_table("projects")
@@ -0,0 +1,4 @@
+from bootstrap import Settings, run_server
+
+if __name__ == "__main__":
+    run_server(Settings.from_env())
@@ -0,0 +1,18 @@
+import asyncio
+import logging
+
+from application.commands.commands import CreateProjectsCommand
+from bootstrap import Settings, bootstrap_worker, open_container, run_worker
+
+
+async def main() -> None:
+    async with open_container(Settings.from_env()) as container:
+        pool = bootstrap_worker(
+            container.job_queue, container.bus, command_types=[CreateProjectsCommand]
+        )
+        await run_worker(pool)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
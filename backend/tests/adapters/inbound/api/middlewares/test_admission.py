@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from adapters.inbound.api import AdmissionControlMiddleware, AimdLimit
+from adapters.inbound.api.middlewares import HTTP_REQUESTS_SHED_TOTAL
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAimdLimit:
+    """Test suite for AimdLimit."""
+
+    def test_rejects_requests_above_the_limit(self):
+        limit = AimdLimit(initial_limit=2)
+
+        assert limit.try_acquire()
+        assert limit.try_acquire()
+        assert not limit.try_acquire()
+
+    def test_slow_requests_shrink_the_limit_once_per_target(self):
+        clock = _FakeClock()
+        limit = AimdLimit(initial_limit=10, latency_target=0.5, clock=clock)
+        for _ in range(3):
+            limit.try_acquire()
+
+        limit.release(1.0)
+        limit.release(1.0)
+        shrunk = limit.limit
+        clock.now = 0.5
+        limit.release(1.0)
+
+        assert shrunk == 9
+        assert limit.limit == 8
+
+    def test_never_shrinks_below_the_minimum(self):
+        clock = _FakeClock()
+        limit = AimdLimit(initial_limit=2, min_limit=2, clock=clock)
+
+        for step in range(5):
+            clock.now = float(step)
+            limit.try_acquire()
+            limit.release(10.0)
+
+        assert limit.limit == 2
+
+    def test_fast_requests_grow_a_limit_in_use(self):
+        limit = AimdLimit(initial_limit=2, latency_target=0.5)
+
+        for _ in range(4):
+            limit.try_acquire()
+            limit.try_acquire()
+            limit.release(0.01)
+            limit.release(0.01)
+
+        assert limit.limit == 3
+
+    def test_idle_limit_does_not_grow(self):
+        limit = AimdLimit(initial_limit=10)
+
+        for _ in range(100):
+            limit.try_acquire()
+            limit.release(0.01)
+
+        assert limit.limit == 10
+
+
+def _app(release: asyncio.Event, metrics: InMemoryMetricsRegistry) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/projects/{project_id}")
+    async def get_project(project_id: str) -> dict:
+        await release.wait()
+        return {"id": project_id}
+
+    @app.get("/projects")
+    async def list_projects() -> list:
+        return []
+
+    @app.get("/internal/{name}", include_in_schema=False)
+    async def internal(name: str) -> dict:
+        await release.wait()
+        return {"name": name}
+
+    @app.get("/api/v1/health/live")
+    async def live() -> dict:
+        return {"status": "alive"}
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limit_factory=lambda: AimdLimit(initial_limit=1),
+        retry_after_seconds=2,
+        metrics=metrics,
+    )
+    return app
+
+
+class TestAdmissionControlMiddleware:
+    """Test suite for AdmissionControlMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_sheds_requests_over_the_route_limit(self):
+        release = asyncio.Event()
+        metrics = InMemoryMetricsRegistry()
+        transport = httpx.ASGITransport(app=_app(release, metrics))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            admitted = asyncio.create_task(client.get("/projects/a"))
+            await asyncio.sleep(0.01)
+
+            shed = await client.get("/projects/b")
+            other_route = await client.get("/projects")
+            health = await client.get("/api/v1/health/live")
+            release.set()
+            await admitted
+            after = await client.get("/projects/c")
+
+        assert shed.status_code == 503
+        assert shed.headers["retry-after"] == "2"
+        assert shed.json()["error"] == "overloaded"
+        assert other_route.status_code == 200
+        assert health.status_code == 200
+        assert admitted.result().status_code == 200
+        assert after.status_code == 200
+        route = {"route": "GET /projects/{project_id}"}
+        assert metrics.counter(HTTP_REQUESTS_SHED_TOTAL, route) == 1
+
+    @pytest.mark.asyncio
+    async def test_routes_outside_the_schema_have_their_own_limit(self):
+        release = asyncio.Event()
+        metrics = InMemoryMetricsRegistry()
+        app = _app(release, metrics)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            admitted = asyncio.create_task(client.get("/internal/a"))
+            await asyncio.sleep(0.01)
+
+            shed = await client.get("/internal/b")
+            release.set()
+            await admitted
+
+        assert shed.status_code == 503
+        route = {"route": "GET /internal/{name}"}
+        assert metrics.counter(HTTP_REQUESTS_SHED_TOTAL, route) == 1
+        assert app.openapi_schema is None
@@ -0,0 +1,147 @@
+import zlib
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from starlette.types import Message, Receive, Scope, Send
+
+from adapters.inbound.api import CompressionMiddleware
+from adapters.inbound.api.middlewares import negotiate_encoding
+from adapters.inbound.api.sse import SSE_MEDIA_TYPE
+from adapters.inbound.api.streaming import NDJSON_MEDIA_TYPE
+
+LARGE_BODY = b'{"comments": [' + b'"looks good",' * 200 + b'"ship it"]}'
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> Response:
+        return Response(LARGE_BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small() -> Response:
+        return Response(b'{"id": "a"}', media_type="application/json")
+
+    @app.get("/binary")
+    async def binary() -> Response:
+        return Response(LARGE_BODY, media_type="application/octet-stream")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    return app
+
+
+async def _get(path: str, accept_encoding: str = "gzip") -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+def _streaming_app(media_type: str, chunks: list[bytes]):
+    async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", media_type.encode())],
+            }
+        )
+        for index, chunk in enumerate(chunks):
+            more_body = index < len(chunks) - 1
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    return app
+
+
+class TestCompressionMiddleware:
+    """Test suite for CompressionMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_compresses_large_json_with_gzip(self):
+        response = await _get("/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+        assert response.content == LARGE_BODY
+
+    @pytest.mark.asyncio
+    async def test_leaves_bodies_below_threshold_uncompressed(self):
+        response = await _get("/small")
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b'{"id": "a"}'
+
+    @pytest.mark.asyncio
+    async def test_leaves_media_types_outside_allowlist_uncompressed(self):
+        response = await _get("/binary")
+
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_respects_clients_without_supported_encoding(self):
+        response = await _get("/large", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_negotiates_gzip_among_other_encodings(self):
+        response = await _get("/large", accept_encoding="br, gzip;q=0.5")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == LARGE_BODY
+
+    @pytest.mark.asyncio
+    async def test_leaves_bodies_uncompressed_for_unsupported_encodings(self):
+        response = await _get("/large", accept_encoding="br, zstd")
+
+        assert "content-encoding" not in response.headers
+        assert response.content == LARGE_BODY
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("media_type", [NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE])
+    async def test_every_streamed_chunk_is_decodable_on_arrival(self, media_type):
+        chunks = [b'{"id": "a"}\n', b'{"id": "b"}\n', b'{"id": "c"}\n']
+        middleware = CompressionMiddleware(_streaming_app(media_type, chunks))
+        sent: list[Message] = []
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        async def receive() -> Message:
+            return {"type": "http.request"}
+
+        scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip")]}
+        await middleware(scope, receive, send)
+
+        start, *bodies = sent
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert [decoder.decompress(body["body"]) for body in bodies] == chunks
+        assert decoder.eof
+
+
+class TestNegotiateEncoding:
+    """Test suite for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            ("gzip, br", "br"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("*", "br"),
+            ("*;q=0, gzip;q=0", None),
+            ("deflate", None),
+            ("", None),
+        ],
+    )
+    def test_picks_highest_rated_supported_coding(self, accept_encoding, expected):
+        supported = {"br": object(), "gzip": object()}
+
+        assert negotiate_encoding(accept_encoding, supported) == expected
@@ -0,0 +1,59 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from adapters.inbound.api import DOMAIN_ERRORS_TOTAL, RequestMetricsMiddleware, register_error_handlers
+from adapters.inbound.api.middlewares import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_REQUESTS_TOTAL,
+)
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+from domain.exception import EntityNotFoundError
+
+
+def _app(metrics: InMemoryMetricsRegistry) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/projects/{project_id}")
+    async def get_project(project_id: str) -> dict:
+        if project_id == "missing":
+            raise EntityNotFoundError()
+        return {"id": project_id}
+
+    app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+    register_error_handlers(app, metrics)
+    return app
+
+
+class TestRequestMetricsMiddleware:
+    """Test suite for RequestMetricsMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_records_latency_and_status_by_route_template(self):
+        metrics = InMemoryMetricsRegistry()
+        transport = httpx.ASGITransport(app=_app(metrics))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/projects/a")
+            await client.get("/projects/b")
+            await client.get("/projects/missing")
+            await client.get("/unknown")
+
+        ok = {"method": "GET", "route": "/projects/{project_id}", "status": "200"}
+        assert metrics.counter(HTTP_REQUESTS_TOTAL, ok) == 2
+        assert metrics.counter(HTTP_REQUESTS_TOTAL, {**ok, "status": "404"}) == 1
+        assert metrics.counter(
+            HTTP_REQUESTS_TOTAL, {"method": "GET", "route": "unmatched", "status": "404"}
+        ) == 1
+        histogram = metrics.histogram(HTTP_REQUEST_DURATION_SECONDS, ok)
+        assert histogram is not None and histogram.count == 2
+        assert metrics.gauge(HTTP_REQUESTS_IN_FLIGHT, {"method": "GET"}) == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_domain_errors_by_status(self):
+        metrics = InMemoryMetricsRegistry()
+        transport = httpx.ASGITransport(app=_app(metrics))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/projects/missing")
+
+        assert metrics.counter(DOMAIN_ERRORS_TOTAL, {"status": "entity_not_found"}) == 1
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from adapters.inbound.api import ProfilingMiddleware
+from adapters.inbound.api.middlewares import StackSampler
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _app(directory: Path, **options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/projects/{project_id}")
+    async def get_project(project_id: str) -> dict:
+        # Yields to the loop, so other tasks run while the request is profiled
+        await asyncio.sleep(0.02)
+        _busy(0.05)
+        return {"id": project_id}
+
+    app.add_middleware(ProfilingMiddleware, directory=directory, interval_seconds=0.001, **options)
+    return app
+
+
+async def _get(app: FastAPI, headers: dict[str, str] | None = None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/projects/a", headers=headers)
+
+
+class TestStackSampler:
+    """Test suite for StackSampler."""
+
+    def test_collects_collapsed_stacks_of_the_sampled_thread(self):
+        sampler = StackSampler(threading.get_ident(), interval_seconds=0.001)
+
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        lines = sampler.collapsed().splitlines()
+        assert lines
+        assert any("_busy (test_profiling.py:" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_drops_stacks_not_running_through_the_given_frame(self):
+        suspended = (value for value in [1])
+        sampler = StackSampler(
+            threading.get_ident(), interval_seconds=0.001, within=suspended.gi_frame
+        )
+
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        assert sampler.collapsed() == ""
+
+
+class TestProfilingMiddleware:
+    """Test suite for ProfilingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_writes_profile_for_request_with_admin_token(self, tmp_path):
+        app = _app(tmp_path, token="secret")
+
+        response = await _get(app, {"X-Profile-Token": "secret"})
+
+        assert response.status_code == 200
+        [profile] = tmp_path.iterdir()
+        assert profile.name.endswith("-GET_projects_a.collapsed")
+        assert "get_project" in profile.read_text()
+
+    @pytest.mark.asyncio
+    async def test_leaves_out_other_tasks_on_the_loop(self, tmp_path):
+        app = _app(tmp_path, token="secret")
+
+        async def other_work() -> None:
+            await asyncio.sleep(0.01)
+            _busy(0.05)
+
+        other = asyncio.create_task(other_work())
+        await _get(app, {"X-Profile-Token": "secret"})
+        await other
+
+        [profile] = tmp_path.iterdir()
+        assert "get_project" in profile.read_text()
+        assert "other_work" not in profile.read_text()
+
+    @pytest.mark.asyncio
+    async def test_ignores_requests_without_valid_token(self, tmp_path):
+        app = _app(tmp_path, token="secret")
+
+        await _get(app)
+        await _get(app, {"X-Profile-Token": "guess"})
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_profiles_sampled_requests(self, tmp_path):
+        draws = iter([0.05, 0.5])
+        app = _app(tmp_path, sample_rate=0.1, random_source=lambda: next(draws))
+
+        await _get(app)
+        await _get(app)
+
+        assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,52 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from adapters.inbound.api import health_router
+from application.health import HealthMonitor
+
+
+class _FailingProbe:
+    async def check(self) -> None:
+        raise ConnectionError("refused")
+
+
+def _client(monitor: HealthMonitor) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(health_router, prefix="/api/v1")
+    app.state.health_monitor = monitor
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestHealthRouter:
+    """Test suite for the liveness and readiness endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_liveness_does_not_depend_on_probes(self):
+        async with _client(HealthMonitor({"database": _FailingProbe()})) as client:
+            response = await client.get("/api/v1/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    @pytest.mark.asyncio
+    async def test_readiness_reports_failing_dependency(self):
+        monitor = HealthMonitor({"database": _FailingProbe()})
+        await monitor.refresh()
+        async with _client(monitor) as client:
+            response = await client.get("/api/v1/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "unavailable"
+        assert response.json()["checks"]["database"]["healthy"] is False
+        assert "latency_ms" in response.json()["checks"]["database"]
+
+    @pytest.mark.asyncio
+    async def test_readiness_is_ok_once_probes_pass(self):
+        monitor = HealthMonitor({})
+        await monitor.refresh()
+        async with _client(monitor) as client:
+            response = await client.get("/api/v1/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
@@ -0,0 +1,329 @@
+import json
+from collections.abc import Sequence
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from starlette.authentication import BaseUser, UnauthenticatedUser
+
+from adapters.inbound.api import (
+    ResponseCache,
+    events_router,
+    projects_router,
+    register_error_handlers,
+)
+from adapters.inbound.api.routers.events import stream_events
+from adapters.inbound.api.sse import encode_event
+from adapters.outbound.events import InMemoryEventHub
+from adapters.outbound.providers import CircuitOpenError, ProviderRequestError
+from adapters.outbound.projects import (
+    InMemoryAllProjectsSpecification,
+    InMemoryProjectAlreadyExistsSpecification,
+    InMemoryProjectByIdSpecification,
+    InMemoryProjectReadRepository,
+    InMemoryProjectStore,
+    InMemoryUnitOfWork,
+)
+from adapters.outbound.rate_limit import InMemoryRateLimitStore
+from application.commands.bus import CommandBus, Middleware
+from application.commands.commands import CreateProjectCommand
+from application.commands.handlers.create_project_command_handler import (
+    CreateProjectCommandHandler,
+)
+from application.commands.middlewares import CommandRateLimits, RateLimitMiddleware
+from application.ports import RateLimit
+from application.queries.handlers.get_project_query_handler import (
+    GetProjectQueryHandler,
+)
+from application.queries.handlers.list_projects_query_handler import (
+    ListProjectsQueryHandler,
+)
+from domain.project import value_objects as vo
+from domain.project.events import ProjectCreated
+from domain.project.factories import (
+    DefaultPoliciesFactory,
+    ProjectFactory,
+    URLBasedValueObjectsFactory,
+)
+from domain.project.ports import RemoteRepositoryVerifier
+from domain.project.services import CreateProjectService
+
+URL = "https://github.com/owner/repo"
+
+
+def _app(
+    verified: bool = True,
+    cache: ResponseCache | None = None,
+    middlewares: Sequence[Middleware] = (),
+    verifier_error: Exception | None = None,
+) -> FastAPI:
+    store = InMemoryProjectStore()
+    cache = ResponseCache() if cache is None else cache
+    value_objects_factory = URLBasedValueObjectsFactory()
+    verifier = AsyncMock(spec=RemoteRepositoryVerifier)
+    verifier.verify.return_value = verified
+    verifier.verify.side_effect = verifier_error
+    service = CreateProjectService(
+        ProjectFactory(DefaultPoliciesFactory(), value_objects_factory),
+        value_objects_factory,
+        [verifier],
+    )
+    bus = CommandBus(middlewares)
+    bus.register(
+        CreateProjectCommand,
+        lambda: CreateProjectCommandHandler(
+            InMemoryUnitOfWork(store, cache),
+            service,
+            lambda command: InMemoryProjectAlreadyExistsSpecification(
+                repo_id=str(value_objects_factory.create_from_url(vo.URL(command.url)).project_id)
+            ),
+        ),
+    )
+    repository = InMemoryProjectReadRepository(store)
+
+    app = FastAPI()
+    app.include_router(projects_router, prefix="/api/v1")
+    register_error_handlers(app)
+    app.state.command_bus = bus
+    app.state.response_cache = cache
+    app.state.get_project_handler = GetProjectQueryHandler(
+        repository, lambda project_id: InMemoryProjectByIdSpecification(project_id=project_id)
+    )
+    app.state.list_projects_handler = ListProjectsQueryHandler(
+        repository, InMemoryAllProjectsSpecification
+    )
+    return app
+
+
+class _User(BaseUser):
+    def __init__(self, identity: str):
+        self._identity = identity
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    @property
+    def identity(self) -> str:
+        return self._identity
+
+
+def _client(app: FastAPI, address: str = "127.0.0.1") -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=app, client=(address, 123))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+class TestProjectsRouter:
+    """Test suite for the project endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_create_project(self):
+        async with _client(_app()) as client:
+            response = await client.post("/api/v1/projects/", json={"url": URL, "rules": ["rule"]})
+
+        assert response.status_code == 201
+        assert response.headers["location"] == "/api/v1/projects/github:owner:repo"
+        assert response.headers["etag"].startswith('"')
+        assert response.json()["id"] == "github:owner:repo"
+        assert response.json()["rules"] == ["rule"]
+
+    @pytest.mark.asyncio
+    async def test_create_existing_project_conflicts(self):
+        async with _client(_app()) as client:
+            await client.post("/api/v1/projects/", json={"url": URL})
+            response = await client.post("/api/v1/projects/", json={"url": URL})
+
+        assert response.status_code == 409
+        assert response.json()["error"] == "project_already_exists"
+
+    @pytest.mark.asyncio
+    async def test_create_missing_remote_repository_is_unprocessable(self):
+        async with _client(_app(verified=False)) as client:
+            response = await client.post("/api/v1/projects/", json={"url": URL})
+
+        assert response.status_code == 422
+        assert response.json()["error"] == "remote_repository_does_not_exist"
+
+    @pytest.mark.asyncio
+    async def test_open_provider_circuit_is_unavailable_until_it_may_close(self):
+        async with _client(_app(verifier_error=CircuitOpenError("github", 12.3))) as client:
+            response = await client.post("/api/v1/projects/", json={"url": URL})
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "13"
+        assert response.json()["error"] == "provider_unavailable"
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_is_unavailable(self):
+        error = ProviderRequestError("https://api.github.com/repos/owner/repo", 502)
+        async with _client(_app(verifier_error=error)) as client:
+            response = await client.post("/api/v1/projects/", json={"url": URL})
+
+        assert response.status_code == 503
+        assert "retry-after" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_client_over_its_rate_limit_is_told_when_to_retry(self):
+        limits = {
+            CreateProjectCommand: CommandRateLimits(
+                per_client=RateLimit(limit=1, window_seconds=60)
+            )
+        }
+        rate_limit = RateLimitMiddleware(InMemoryRateLimitStore(), limits, lambda _: [])
+        app = _app(middlewares=[rate_limit])
+        async with _client(app, "10.0.0.1") as noisy, _client(app, "10.0.0.2") as quiet:
+            await noisy.post("/api/v1/projects/", json={"url": URL})
+            limited = await noisy.post(
+                "/api/v1/projects/",
+                json={"url": f"{URL}-2"},
+                headers={"Authorization": "Bearer rotated"},
+            )
+            other = await quiet.post("/api/v1/projects/", json={"url": f"{URL}-2"})
+
+        assert limited.status_code == 429
+        assert limited.json()["error"] == "rate_limit_exceeded"
+        assert int(limited.headers["retry-after"]) >= 60
+        assert "rotated" not in limited.json()["message"]
+        assert other.status_code == 201
+
+    @pytest.mark.asyncio
+    async def test_authenticated_users_are_limited_apart_from_their_address(self):
+        limits = {
+            CreateProjectCommand: CommandRateLimits(
+                per_client=RateLimit(limit=1, window_seconds=60)
+            )
+        }
+        rate_limit = RateLimitMiddleware(InMemoryRateLimitStore(), limits, lambda _: [])
+        app = _app(middlewares=[rate_limit])
+
+        @app.middleware("http")
+        async def authenticate(request, call_next):
+            name = request.headers.get("x-test-user")
+            request.scope["user"] = _User(name) if name else UnauthenticatedUser()
+            return await call_next(request)
+
+        async with _client(app) as client:
+            first = await client.post("/api/v1/projects/", json={"url": URL}, headers={"x-test-user": "ada"})
+            second = await client.post("/api/v1/projects/", json={"url": f"{URL}-2"}, headers={"x-test-user": "bob"})
+            anonymous = await client.post("/api/v1/projects/", json={"url": f"{URL}-3"})
+
+        assert [first.status_code, second.status_code, anonymous.status_code] == [201, 201, 201]
+
+    @pytest.mark.asyncio
+    async def test_get_project_answers_304_for_matching_etag(self):
+        async with _client(_app()) as client:
+            created = await client.post("/api/v1/projects/", json={"url": URL})
+            etag = created.headers["etag"]
+
+            fresh = await client.get("/api/v1/projects/github:owner:repo")
+            cached = await client.get(
+                "/api/v1/projects/github:owner:repo", headers={"If-None-Match": f'"other", {etag}'}
+            )
+
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] == etag
+        assert fresh.headers["content-type"] == "application/json"
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+    @pytest.mark.asyncio
+    async def test_get_unknown_project_is_not_found(self):
+        async with _client(_app()) as client:
+            response = await client.get("/api/v1/projects/github:owner:missing")
+
+        assert response.status_code == 404
+        assert response.json()["error"] == "entity_not_found"
+
+    @pytest.mark.asyncio
+    async def test_list_pages_through_projects_by_cursor(self):
+        async with _client(_app()) as client:
+            for name in "abc":
+                await client.post("/api/v1/projects/", json={"url": f"{URL}-{name}"})
+
+            first = await client.get("/api/v1/projects/", params={"limit": 2})
+            next_url = first.links["next"]["url"]
+            last = await client.get(next_url)
+
+        assert [project["id"] for project in first.json()] == [
+            "github:owner:repo-a",
+            "github:owner:repo-b",
+        ]
+        assert next_url.startswith("/api/v1/projects/?limit=2&cursor=")
+        assert [project["id"] for project in last.json()] == ["github:owner:repo-c"]
+        assert "link" not in last.headers
+
+    @pytest.mark.asyncio
+    async def test_list_rejects_forged_cursor(self):
+        async with _client(_app()) as client:
+            response = await client.get("/api/v1/projects/", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "invalid_cursor"
+
+    @pytest.mark.asyncio
+    async def test_list_etag_changes_when_projects_change(self):
+        async with _client(_app()) as client:
+            empty = await client.get("/api/v1/projects/")
+            await client.post("/api/v1/projects/", json={"url": URL})
+            listed = await client.get(
+                "/api/v1/projects/", headers={"If-None-Match": empty.headers["etag"]}
+            )
+            cached = await client.get(
+                "/api/v1/projects/", headers={"If-None-Match": listed.headers["etag"]}
+            )
+
+        assert empty.json() == []
+        assert listed.status_code == 200
+        assert [project["id"] for project in listed.json()] == ["github:owner:repo"]
+        assert cached.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_served_from_cache_until_a_write(self):
+        cache = ResponseCache()
+        async with _client(_app(cache=cache)) as client:
+            await client.get("/api/v1/projects/")
+            await client.get("/api/v1/projects/")
+            hits = cache.hits
+            await client.post("/api/v1/projects/", json={"url": URL})
+            listed = await client.get("/api/v1/projects/")
+
+        assert hits == 1
+        assert [project["id"] for project in listed.json()] == ["github:owner:repo"]
+
+    @pytest.mark.asyncio
+    async def test_stream_projects_as_ndjson(self):
+        async with _client(_app()) as client:
+            await client.post("/api/v1/projects/", json={"url": URL})
+            await client.post("/api/v1/projects/", json={"url": "https://github.com/owner/other"})
+            response = await client.get("/api/v1/projects/stream")
+
+        lines = response.content.splitlines()
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["id"] for line in lines] == [
+            "github:owner:repo",
+            "github:owner:other",
+        ]
+
+
+class TestEventsRouter:
+    """Test suite for the domain event stream endpoint."""
+
+    def test_is_served_outside_the_project_routes(self):
+        app = _app()
+        app.include_router(events_router, prefix="/api/v1")
+
+        assert app.url_path_for("stream_events") == "/api/v1/events"
+
+    @pytest.mark.asyncio
+    async def test_streams_events_committed_after_subscribing(self):
+        hub = InMemoryEventHub()
+        response = await stream_events(hub)
+        await anext(response.body_iterator)
+        event = ProjectCreated(project_id="github:owner:repo", url=URL)
+
+        await hub.publish([event])
+
+        assert await anext(response.body_iterator) == encode_event(event)
+        await response.body_iterator.aclose()
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import Request
+
+from adapters.inbound.api.cache import (
+    PROJECTS_TAG,
+    CachedResponse,
+    ResponseCache,
+    project_tag,
+    request_cache_key,
+)
+from domain.project.events import ProjectCreated
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(body: bytes = b"{}") -> CachedResponse:
+    return CachedResponse(body=body, etag='"v1"')
+
+
+def _request(path: str, query: bytes = b"", authorization: bytes | None = None) -> Request:
+    headers = [] if authorization is None else [(b"authorization", authorization)]
+    return Request(
+        {"type": "http", "method": "GET", "path": path, "query_string": query, "headers": headers}
+    )
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", _response(), [])
+        cache.put("b", _response(), [])
+        cache.get("a")
+
+        cache.put("c", _response(), [])
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_bounds_total_body_size(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put("a", _response(b"x" * 6), [])
+        cache.put("b", _response(b"x" * 6), [])
+        cache.put("too-large", _response(b"x" * 11), [])
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("too-large") is None
+
+    def test_entries_expire_after_ttl(self):
+        clock = _FakeClock()
+        cache = ResponseCache(ttl_seconds=5.0, clock=clock)
+        cache.put("a", _response(), [])
+
+        clock.now = 5.0
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_project_event_invalidates_its_responses_and_listings(self):
+        cache = ResponseCache()
+        cache.put("project", _response(), [project_tag("github:owner:repo")])
+        cache.put("other", _response(), [project_tag("github:owner:other")])
+        cache.put("list", _response(), [PROJECTS_TAG])
+
+        await cache.publish([ProjectCreated(project_id="github:owner:repo", url="url")])
+
+        assert cache.get("project") is None
+        assert cache.get("list") is None
+        assert cache.get("other") is not None
+
+    @pytest.mark.asyncio
+    async def test_loads_once_then_serves_from_cache(self):
+        cache = ResponseCache()
+        loads = 0
+
+        async def load() -> CachedResponse:
+            nonlocal loads
+            loads += 1
+            return _response()
+
+        await cache.get_or_load("a", [PROJECTS_TAG], load)
+        await cache.get_or_load("a", [PROJECTS_TAG], load)
+
+        assert loads == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_response_loaded_during_invalidation_is_not_cached(self):
+        cache = ResponseCache()
+
+        async def load() -> CachedResponse:
+            cache.invalidate([PROJECTS_TAG])
+            return _response()
+
+        await cache.get_or_load("a", [PROJECTS_TAG], load)
+
+        assert cache.get("a") is None
+
+
+class TestRequestCacheKey:
+    """Test suite for keying requests."""
+
+    def test_query_order_does_not_matter(self):
+        first = _request("/projects", b"a=1&b=2")
+        second = _request("/projects", b"b=2&a=1")
+
+        assert request_cache_key(first) == request_cache_key(second)
+
+    def test_credentials_separate_entries(self):
+        alice = _request("/projects", authorization=b"Bearer alice")
+        bob = _request("/projects", authorization=b"Bearer bob")
+
+        assert request_cache_key(alice) != request_cache_key(bob)
+        assert "alice" not in request_cache_key(alice)
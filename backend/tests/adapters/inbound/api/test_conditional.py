@@ -0,0 +1,31 @@
+from starlette.requests import Request
+
+from adapters.inbound.api.conditional import is_not_modified, strong_etag
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+class TestConditionalRequests:
+    """Test suite for entity tags and If-None-Match handling."""
+
+    def test_strong_etag_is_quoted_and_stable(self):
+        etag = strong_etag("github:owner:repo", "2025-01-01T00:00:00")
+
+        assert etag == strong_etag("github:owner:repo", "2025-01-01T00:00:00")
+        assert etag != strong_etag("github:owner:repo", "2025-01-02T00:00:00")
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_parts_are_not_ambiguous(self):
+        assert strong_etag("ab", "c") != strong_etag("a", "bc")
+
+    def test_if_none_match(self):
+        etag = strong_etag("project")
+
+        assert is_not_modified(_request(etag), etag)
+        assert is_not_modified(_request(f"W/{etag}"), etag)
+        assert is_not_modified(_request("*"), etag)
+        assert not is_not_modified(_request('"other"'), etag)
+        assert not is_not_modified(_request(None), etag)
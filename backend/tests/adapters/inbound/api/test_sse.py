@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from adapters.inbound.api.sse import SSE_MEDIA_TYPE, encode_event, sse_response
+from adapters.outbound.events import InMemoryEventHub
+from domain.project.events import ProjectCreated
+
+
+class TestServerSentEvents:
+    """Test suite for streaming domain events as server-sent events."""
+
+    def test_encode_event(self):
+        event = ProjectCreated(project_id="github:owner:repo", url="https://github.com/owner/repo")
+
+        lines = encode_event(event).decode().split("\n")
+
+        assert lines[0] == f"id: {event.id}"
+        assert lines[1] == "event: ProjectCreated"
+        assert json.loads(lines[2].removeprefix("data: "))["project_id"] == "github:owner:repo"
+        assert lines[3:] == ["", ""]
+
+    @pytest.mark.asyncio
+    async def test_streams_events_and_heartbeats(self):
+        hub = InMemoryEventHub()
+        response = sse_response(hub.subscribe(), heartbeat_seconds=0.01)
+        event = ProjectCreated(project_id="a", url="https://github.com/o/a")
+
+        assert response.media_type == SSE_MEDIA_TYPE
+        assert await anext(response.body_iterator) == b"retry: 3000\n\n"
+        assert await anext(response.body_iterator) == b": keep-alive\n\n"
+        await hub.publish([event])
+        assert await anext(response.body_iterator) == encode_event(event)
+
+        await response.body_iterator.aclose()
+        assert hub.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_evicted_subscriber_is_told_and_stream_ends(self):
+        hub = InMemoryEventHub(max_pending=1)
+        response = sse_response(hub.subscribe(), heartbeat_seconds=1)
+        await anext(response.body_iterator)
+
+        await hub.publish(
+            [ProjectCreated(project_id=str(n), url="https://github.com/o/r") for n in range(2)]
+        )
+
+        assert [chunk async for chunk in response.body_iterator] == [
+            b"event: evicted\ndata: {}\n\n"
+        ]
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from adapters.inbound.api.streaming import NDJSON_MEDIA_TYPE, ndjson_response
+
+
+async def _numbers(count: int, produced: list[int]):
+    for number in range(count):
+        produced.append(number)
+        yield {"n": number}
+
+
+def _encode(item: dict) -> bytes:
+    return json.dumps(item).encode()
+
+
+class TestNdjsonResponse:
+    """Test suite for newline-delimited JSON streaming."""
+
+    @pytest.mark.asyncio
+    async def test_writes_one_document_per_line(self):
+        response = ndjson_response(_numbers(3, []), _encode)
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert [json.loads(line) for line in body.splitlines()] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_first_line_is_flushed_immediately(self):
+        produced: list[int] = []
+        response = ndjson_response(_numbers(1000, produced), _encode, flush_bytes=1 << 20)
+
+        first = await anext(response.body_iterator)
+
+        assert first == b'{"n": 0}\n'
+        assert produced == [0]
+
+    @pytest.mark.asyncio
+    async def test_items_are_pulled_only_as_chunks_are_consumed(self):
+        produced: list[int] = []
+        response = ndjson_response(_numbers(1000, produced), _encode, flush_bytes=27)
+
+        await anext(response.body_iterator)
+        second = await anext(response.body_iterator)
+
+        assert second == b'{"n": 1}\n{"n": 2}\n{"n": 3}\n'
+        assert produced == [0, 1, 2, 3]
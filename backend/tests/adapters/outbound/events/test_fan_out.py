@@ -0,0 +1,30 @@
+import pytest
+
+from adapters.outbound.events import FanOutEventPublisher
+from domain.event import DomainEvent
+from domain.project.events import ProjectCreated
+
+
+class _RecordingPublisher:
+    def __init__(self, name: str, log: list[tuple[str, DomainEvent]]) -> None:
+        self._name = name
+        self._log = log
+
+    async def publish(self, events):
+        self._log.extend((self._name, event) for event in events)
+
+
+class TestFanOutEventPublisher:
+    """Test suite for FanOutEventPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_to_every_publisher_in_order(self):
+        log: list[tuple[str, DomainEvent]] = []
+        event = ProjectCreated(project_id="github:owner:repo", url="url")
+        publisher = FanOutEventPublisher(
+            [_RecordingPublisher("cache", log), _RecordingPublisher("hub", log)]
+        )
+
+        await publisher.publish([event])
+
+        assert log == [("cache", event), ("hub", event)]
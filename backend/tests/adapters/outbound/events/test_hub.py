@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from adapters.outbound.events import InMemoryEventHub
+from domain.project.events import ProjectCreated
+
+
+def _created(project_id: str) -> ProjectCreated:
+    return ProjectCreated(project_id=project_id, url=f"https://github.com/{project_id}")
+
+
+class TestInMemoryEventHub:
+    """Test suite for InMemoryEventHub."""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_to_every_subscriber(self):
+        hub = InMemoryEventHub()
+        first, second = hub.subscribe(), hub.subscribe()
+        event = _created("a")
+
+        await hub.publish([event])
+
+        assert await first.get(timeout=0.1) == event
+        assert await second.get(timeout=0.1) == event
+
+    @pytest.mark.asyncio
+    async def test_delivers_only_accepted_events(self):
+        hub = InMemoryEventHub()
+        subscription = hub.subscribe(lambda event: event.project_id == "b")
+
+        await hub.publish([_created("a"), _created("b")])
+
+        received = await subscription.get(timeout=0.1)
+        assert received is not None and received.project_id == "b"
+        assert await subscription.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_slow_subscriber_without_affecting_others(self):
+        hub = InMemoryEventHub(max_pending=2)
+        slow, fast = hub.subscribe(), hub.subscribe()
+
+        for n in range(3):
+            await hub.publish([_created(str(n))])
+            await fast.get(timeout=0.1)
+
+        assert slow.evicted
+        assert await slow.get(timeout=0.1) is None
+        assert slow.closed
+        assert not fast.evicted
+        assert hub.subscriber_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_close_ends_iteration(self):
+        hub = InMemoryEventHub()
+        subscription = hub.subscribe()
+        received = []
+
+        async def consume() -> None:
+            async for event in subscription:
+                received.append(event)
+
+        consumer = asyncio.create_task(consume())
+        await hub.publish([_created("a")])
+        await asyncio.sleep(0)
+        subscription.close()
+        await asyncio.wait_for(consumer, timeout=0.1)
+
+        assert [event.project_id for event in received] == ["a"]
+        assert hub.subscriber_count() == 0
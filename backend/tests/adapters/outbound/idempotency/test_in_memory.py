@@ -0,0 +1,40 @@
+import pytest
+
+from adapters.outbound.idempotency import InMemoryIdempotencyStore
+from application.ports import StoredCommandOutcome
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryIdempotencyStore:
+    """Test suite for InMemoryIdempotencyStore."""
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        clock = _FakeClock()
+        store = InMemoryIdempotencyStore(clock=clock)
+        outcome = StoredCommandOutcome(fingerprint="abc", result=1)
+
+        await store.put("key", outcome, ttl_seconds=10)
+        clock.now = 9.9
+        assert await store.get("key") == outcome
+
+        clock.now = 10.0
+        assert await store.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_is_evicted_when_full(self):
+        store = InMemoryIdempotencyStore(max_entries=2)
+        outcome = StoredCommandOutcome(fingerprint="abc")
+
+        for key in ("a", "b", "c"):
+            await store.put(key, outcome, ttl_seconds=60)
+
+        assert await store.get("a") is None
+        assert await store.get("c") == outcome
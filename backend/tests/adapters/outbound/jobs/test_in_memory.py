@@ -0,0 +1,95 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from adapters.outbound.jobs import InMemoryJobQueue
+from application.ports import JobStatus
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestInMemoryJobQueue:
+    """Test suite for InMemoryJobQueue."""
+
+    @pytest.mark.asyncio
+    async def test_claim_counts_attempt_and_hides_job(self):
+        queue = InMemoryJobQueue(clock=_FakeClock())
+        job = await queue.enqueue("analysis", {"id": 1})
+
+        claimed = await queue.claim("analysis", 10, visibility_timeout=30)
+
+        assert [(c.id, c.attempts) for c in claimed] == [(job.id, 1)]
+        assert await queue.claim("analysis", 10, visibility_timeout=30) == []
+
+    @pytest.mark.asyncio
+    async def test_job_is_claimable_again_after_visibility_timeout(self):
+        clock = _FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        await queue.enqueue("analysis", {})
+        await queue.claim("analysis", 1, visibility_timeout=30)
+
+        clock.now += timedelta(seconds=30)
+        claimed = await queue.claim("analysis", 1, visibility_timeout=30)
+
+        assert [c.attempts for c in claimed] == [2]
+
+    @pytest.mark.asyncio
+    async def test_claims_only_due_jobs_of_the_type(self):
+        clock = _FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        due = await queue.enqueue("analysis", {})
+        await queue.enqueue("analysis", {}, run_at=clock.now + timedelta(minutes=5))
+        await queue.enqueue("publishing", {})
+
+        claimed = await queue.claim("analysis", 10, visibility_timeout=30)
+
+        assert [c.id for c in claimed] == [due.id]
+
+    @pytest.mark.asyncio
+    async def test_retry_reschedules_job(self):
+        clock = _FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        await queue.enqueue("analysis", {})
+        (job,) = await queue.claim("analysis", 1, visibility_timeout=30)
+
+        await queue.retry(job, clock.now + timedelta(seconds=10), "boom")
+
+        assert await queue.claim("analysis", 1, visibility_timeout=30) == []
+        clock.now += timedelta(seconds=10)
+        assert len(await queue.claim("analysis", 1, visibility_timeout=30)) == 1
+        assert queue.last_error(job.id) == "boom"
+
+    @pytest.mark.asyncio
+    async def test_completed_and_buried_jobs_are_not_claimed(self):
+        queue = InMemoryJobQueue(clock=_FakeClock())
+        await queue.enqueue("analysis", {})
+        await queue.enqueue("analysis", {})
+        done, dead = await queue.claim("analysis", 2, visibility_timeout=0)
+
+        await queue.complete(done)
+        await queue.bury(dead, "invalid payload")
+
+        assert await queue.claim("analysis", 2, visibility_timeout=30) == []
+        assert queue.status(done.id) is JobStatus.DONE
+        assert queue.status(dead.id) is JobStatus.DEAD
+
+    @pytest.mark.asyncio
+    async def test_stale_lease_cannot_settle_reclaimed_job(self):
+        clock = _FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        await queue.enqueue("analysis", {})
+        (stale,) = await queue.claim("analysis", 1, visibility_timeout=30)
+        clock.now += timedelta(seconds=30)
+        (current,) = await queue.claim("analysis", 1, visibility_timeout=30)
+
+        assert await queue.complete(stale) is False
+        assert await queue.bury(stale, "late") is False
+        assert queue.status(current.id) is JobStatus.PENDING
+        assert await queue.complete(current) is True
+        assert queue.status(current.id) is JobStatus.DONE
@@ -0,0 +1,32 @@
+from adapters.outbound.metrics import InMemoryMetricsRegistry, render_prometheus
+
+
+class TestRenderPrometheus:
+    """Test suite for the Prometheus text exposition."""
+
+    def test_renders_counters_gauges_and_histograms(self):
+        registry = InMemoryMetricsRegistry(buckets=(0.1, 1.0))
+        registry.increment("http_requests_total", labels={"route": "/a", "status": "200"})
+        registry.add_to_gauge("http_requests_in_flight", 2)
+        registry.observe("http_request_duration_seconds", 0.5, {"route": "/a"})
+
+        text = render_prometheus(registry).decode()
+
+        assert text.splitlines() == [
+            "# TYPE http_requests_total counter",
+            'http_requests_total{route="/a",status="200"} 1.0',
+            "# TYPE http_requests_in_flight gauge",
+            "http_requests_in_flight 2.0",
+            "# TYPE http_request_duration_seconds histogram",
+            'http_request_duration_seconds_bucket{route="/a",le="0.1"} 0',
+            'http_request_duration_seconds_bucket{route="/a",le="1.0"} 1',
+            'http_request_duration_seconds_bucket{route="/a",le="+Inf"} 1',
+            'http_request_duration_seconds_sum{route="/a"} 0.5',
+            'http_request_duration_seconds_count{route="/a"} 1',
+        ]
+
+    def test_escapes_label_values(self):
+        registry = InMemoryMetricsRegistry()
+        registry.increment("errors_total", labels={"message": 'say "hi"\n'})
+
+        assert 'errors_total{message="say \\"hi\\"\\n"} 1.0' in render_prometheus(registry).decode()
@@ -0,0 +1,35 @@
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+
+
+class TestInMemoryMetricsRegistry:
+    """Test suite for InMemoryMetricsRegistry."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = InMemoryMetricsRegistry(buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            registry.observe("latency", value, {"route": "/projects"})
+
+        snapshot = registry.histogram("latency", {"route": "/projects"})
+        assert snapshot.buckets == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+        assert snapshot.count == 4
+        assert snapshot.sum == 3.65
+
+    def test_series_are_keyed_by_labels_in_any_order(self):
+        registry = InMemoryMetricsRegistry()
+
+        registry.increment("requests", labels={"method": "GET", "status": "200"})
+        registry.increment("requests", 2, labels={"status": "200", "method": "GET"})
+        registry.increment("requests", labels={"method": "GET", "status": "500"})
+
+        assert registry.counter("requests", {"method": "GET", "status": "200"}) == 3
+        assert registry.counter("requests", {"method": "GET", "status": "500"}) == 1
+
+    def test_gauge_moves_both_ways(self):
+        registry = InMemoryMetricsRegistry()
+
+        registry.add_to_gauge("in_flight", 2)
+        registry.add_to_gauge("in_flight", -1)
+
+        assert registry.gauge("in_flight") == 1
+        assert registry.histogram("missing") is None
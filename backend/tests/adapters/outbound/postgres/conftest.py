@@ -0,0 +1,41 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import create_async_engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[4] / "alembic.ini"
+
+
+@pytest.fixture
+def database_url():
+    """URL of a scratch PostgreSQL database, e.g. postgresql+asyncpg://..."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    return url
+
+
+@pytest.fixture
+def alembic_config(database_url):
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+@pytest_asyncio.fixture
+async def engine(alembic_config, database_url):
+    """Engine on a database migrated to the latest revision, emptied afterwards."""
+    # Alembic runs its own event loop, so it cannot run on the test's
+    await asyncio.to_thread(command.upgrade, alembic_config, "head")
+    engine = create_async_engine(database_url)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        await asyncio.to_thread(command.downgrade, alembic_config, "base")
@@ -0,0 +1,109 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from adapters.outbound.postgres import PostgresJobQueue, PostgresProbe, jobs_table
+from adapters.outbound.postgres.jobs import claim_statement, lease_update_statement
+from application.ports import Job
+
+
+class TestClaimStatement:
+    """Test suite for the SQL claiming jobs from PostgreSQL."""
+
+    def test_skips_rows_locked_by_other_workers(self):
+        sql = str(claim_statement("analysis", 5, 30).compile(dialect=postgresql.dialect()))
+
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        assert "attempts=(jobs.attempts + " in sql
+
+
+class TestLeaseUpdateStatement:
+    """Test suite for the SQL settling a claimed job."""
+
+    def test_matches_only_the_claimed_attempt(self):
+        job = Job(
+            id=uuid.uuid4(),
+            job_type="analysis",
+            payload={},
+            attempts=2,
+            max_attempts=5,
+            run_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+
+        statement = lease_update_statement(job, status="done")
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "jobs.attempts = %(attempts_1)s" in sql
+        assert "jobs.status = %(status_1)s" in sql
+
+
+class TestPostgresJobQueue:
+    """Test suite for PostgresJobQueue on a migrated database."""
+
+    @pytest.mark.asyncio
+    async def test_claim_counts_attempt_and_hides_job(self, engine):
+        queue = PostgresJobQueue(engine)
+        job = await queue.enqueue("analysis", {"id": 1})
+
+        claimed = await queue.claim("analysis", 10, visibility_timeout=30)
+
+        assert [(c.id, c.attempts, c.payload) for c in claimed] == [(job.id, 1, {"id": 1})]
+        assert await queue.claim("analysis", 10, visibility_timeout=30) == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_claims_never_share_a_job(self, engine):
+        queue = PostgresJobQueue(engine)
+        jobs = [await queue.enqueue("analysis", {}) for _ in range(6)]
+
+        claims = await asyncio.gather(
+            *(queue.claim("analysis", 2, visibility_timeout=30) for _ in range(4))
+        )
+
+        claimed = [job.id for claim in claims for job in claim]
+        assert sorted(claimed) == sorted(job.id for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_job_is_claimable_again_after_visibility_timeout(self, engine):
+        queue = PostgresJobQueue(engine)
+        await queue.enqueue("analysis", {})
+        await queue.claim("analysis", 1, visibility_timeout=0)
+
+        claimed = await queue.claim("analysis", 1, visibility_timeout=30)
+
+        assert [c.attempts for c in claimed] == [2]
+
+    @pytest.mark.asyncio
+    async def test_completed_job_is_not_claimed_again(self, engine):
+        queue = PostgresJobQueue(engine)
+        await queue.enqueue("analysis", {})
+        (job,) = await queue.claim("analysis", 1, visibility_timeout=0)
+
+        assert await queue.complete(job) is True
+
+        assert await queue.claim("analysis", 1, visibility_timeout=30) == []
+        async with engine.connect() as connection:
+            status = await connection.scalar(select(jobs_table.c.status))
+        assert status == "done"
+
+    @pytest.mark.asyncio
+    async def test_stale_lease_cannot_settle_reclaimed_job(self, engine):
+        queue = PostgresJobQueue(engine)
+        await queue.enqueue("analysis", {})
+        (stale,) = await queue.claim("analysis", 1, visibility_timeout=0)
+        (current,) = await queue.claim("analysis", 1, visibility_timeout=30)
+
+        assert await queue.complete(stale) is False
+        assert await queue.retry(stale, stale.run_at, "late") is False
+        async with engine.connect() as connection:
+            row = (await connection.execute(select(jobs_table))).one()
+        assert (row.status, row.last_error) == ("pending", None)
+        assert await queue.bury(current, "invalid payload") is True
+
+    @pytest.mark.asyncio
+    async def test_job_queue_probe_passes(self, engine):
+        await PostgresProbe(engine, select(jobs_table.c.id).limit(1)).check()
@@ -0,0 +1,17 @@
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+
+from adapters.outbound.postgres import metadata
+
+
+class TestMigrations:
+    """Test suite for the Alembic migrations of the PostgreSQL storage."""
+
+    @pytest.mark.asyncio
+    async def test_head_matches_the_table_definitions(self, engine):
+        def differences(connection):
+            return compare_metadata(MigrationContext.configure(connection), metadata)
+
+        async with engine.connect() as connection:
+            assert await connection.run_sync(differences) == []
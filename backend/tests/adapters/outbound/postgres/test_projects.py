@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from adapters.outbound.postgres import (
+    PostgresAllProjectsSpecification,
+    PostgresProjectReadRepository,
+    PostgresUnitOfWork,
+    project_from_row,
+    project_to_row,
+)
+from adapters.outbound.postgres.projects import insert_projects_statement
+from domain.project.exceptions import ProjectAlreadyExistsError
+from domain.project.factories import (
+    DefaultPoliciesFactory,
+    ProjectFactory,
+    URLBasedValueObjectsFactory,
+)
+
+
+class TestProjectMapping:
+    """Test suite for mapping projects to rows of the projects table."""
+
+    def test_round_trip(self):
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+        created_at = datetime(2025, 1, 1, tzinfo=UTC)
+        project = factory.create(
+            "https://github.com/owner/repo", ["rule"], created_at=created_at, updated_at=created_at
+        )
+
+        row = project_to_row(project)
+        restored = project_from_row(row)
+
+        assert row["id"] == "github:owner:repo"
+        assert project_to_row(restored) == row
+
+    def test_insert_skips_taken_ids_and_returns_inserted_ones(self):
+        sql = str(insert_projects_statement().compile(dialect=postgresql.dialect()))
+
+        assert "ON CONFLICT (id) DO NOTHING" in sql
+        assert "RETURNING projects.id" in sql
+
+
+class TestPostgresUnitOfWork:
+    """Test suite for saving projects in a PostgreSQL transaction."""
+
+    @pytest.mark.asyncio
+    async def test_saving_a_project_created_concurrently_is_rejected(self):
+        connection = AsyncMock()
+        connection.execute.return_value = MagicMock(scalars=MagicMock(return_value=[]))
+        engine = MagicMock(connect=AsyncMock(return_value=connection))
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+
+        async with PostgresUnitOfWork[bool](engine) as uow:
+            with pytest.raises(ProjectAlreadyExistsError):
+                await uow.save(factory.create("https://github.com/owner/repo", []))
+
+
+class TestPostgresAllProjectsSpecification:
+    """Test suite for paging through the projects table."""
+
+    def test_page_seeks_past_the_sort_key(self):
+        specification = PostgresAllProjectsSpecification(
+            after=(datetime(2025, 1, 1, tzinfo=UTC), "github:owner:repo"), limit=10
+        )
+
+        sql = str(specification.to_query().statement.compile(dialect=postgresql.dialect()))
+
+        assert "(projects.created_at, projects.id) >" in sql
+        assert "ORDER BY projects.created_at, projects.id" in sql
+        assert "LIMIT" in sql
+
+
+class TestPostgresProjectStorage:
+    """Test suite for storing and reading projects on a migrated database."""
+
+    @staticmethod
+    def _projects(*names):
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+        created_at = datetime(2025, 1, 1, tzinfo=UTC)
+        return [
+            factory.create(
+                f"https://github.com/owner/{name}", [], created_at=created_at, updated_at=created_at
+            )
+            for name in names
+        ]
+
+    @pytest.mark.asyncio
+    async def test_saving_a_taken_id_is_rejected(self, engine):
+        (project,) = self._projects("repo")
+        async with PostgresUnitOfWork[bool](engine) as uow:
+            await uow.save(project)
+            await uow.commit()
+
+        async with PostgresUnitOfWork[bool](engine) as uow:
+            with pytest.raises(ProjectAlreadyExistsError):
+                await uow.save(self._projects("repo")[0])
+
+    @pytest.mark.asyncio
+    async def test_pages_and_streams_in_creation_order(self, engine):
+        projects = self._projects("a", "b", "c", "d")
+        async with PostgresUnitOfWork[bool](engine) as uow:
+            await uow.save_all(projects)
+            await uow.commit()
+        repository = PostgresProjectReadRepository(engine, stream_batch_size=2)
+
+        page = await repository.find_all(
+            PostgresAllProjectsSpecification(
+                after=(projects[1].created_at, projects[1].id()), limit=1
+            )
+        )
+        streamed = [
+            project.id()
+            async for project in repository.stream(PostgresAllProjectsSpecification())
+        ]
+
+        assert [project.id() for project in page] == [projects[2].id()]
+        assert streamed == [project.id() for project in projects]
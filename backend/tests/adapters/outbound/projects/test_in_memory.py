@@ -0,0 +1,170 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adapters.outbound.projects import (
+    InMemoryAllProjectsSpecification,
+    InMemoryExistingProjectsSpecification,
+    InMemoryProjectAlreadyExistsSpecification,
+    InMemoryProjectByIdSpecification,
+    InMemoryProjectReadRepository,
+    InMemoryProjectStore,
+    InMemoryUnitOfWork,
+)
+from domain.exception import EntityNotFoundError
+from domain.project.events import ProjectCreated
+from domain.project.exceptions import ProjectAlreadyExistsError
+from domain.project.factories import (
+    DefaultPoliciesFactory,
+    ProjectFactory,
+    URLBasedValueObjectsFactory,
+)
+
+
+def _project(url: str = "https://github.com/owner/repo"):
+    factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+    return factory.create(url, ["rule"], created_at=datetime(2025, 1, 1))
+
+
+class TestInMemoryUnitOfWork:
+    """Test suite for InMemoryUnitOfWork."""
+
+    @pytest.mark.asyncio
+    async def test_saved_projects_are_visible_after_commit(self):
+        store = InMemoryProjectStore()
+        spec = InMemoryProjectAlreadyExistsSpecification(repo_id="github:owner:repo")
+
+        async with InMemoryUnitOfWork[bool](store) as uow:
+            await uow.save(_project())
+            assert await uow.make_query(spec) is False
+            await uow.commit()
+
+        async with InMemoryUnitOfWork[bool](store) as uow:
+            assert await uow.make_query(spec) is True
+
+    @pytest.mark.asyncio
+    async def test_publishes_recorded_events_after_commit(self):
+        publisher = AsyncMock()
+        project = _project()
+
+        async with InMemoryUnitOfWork[bool](InMemoryProjectStore(), publisher) as uow:
+            await uow.save(project)
+            publisher.publish.assert_not_called()
+            await uow.commit()
+
+        (events,) = publisher.publish.await_args.args
+        assert [type(event) for event in events] == [ProjectCreated]
+        assert project.pull_events() == []
+
+    @pytest.mark.asyncio
+    async def test_exiting_without_commit_discards_changes(self):
+        store = InMemoryProjectStore()
+
+        async with InMemoryUnitOfWork[bool](store) as uow:
+            await uow.save(_project())
+
+        assert store.projects == {}
+
+    @pytest.mark.asyncio
+    async def test_committing_a_project_created_concurrently_is_rejected(self):
+        store = InMemoryProjectStore()
+
+        async with (
+            InMemoryUnitOfWork[bool](store) as first,
+            InMemoryUnitOfWork[bool](store) as second,
+        ):
+            await first.save(_project())
+            await second.save(_project())
+            await first.commit()
+
+            with pytest.raises(ProjectAlreadyExistsError):
+                await second.commit()
+
+        assert list(store.projects) == ["github:owner:repo"]
+
+    @pytest.mark.asyncio
+    async def test_existing_projects_specification(self):
+        store = InMemoryProjectStore()
+        async with InMemoryUnitOfWork[set[str]](store) as uow:
+            await uow.save_all([_project(), _project("https://github.com/owner/other")])
+            await uow.commit()
+
+            existing = await uow.make_query(
+                InMemoryExistingProjectsSpecification(
+                    project_ids=["github:owner:repo", "github:owner:missing"]
+                )
+            )
+
+        assert existing == {"github:owner:repo"}
+
+
+class TestInMemoryProjectReadRepository:
+    """Test suite for InMemoryProjectReadRepository."""
+
+    @pytest.mark.asyncio
+    async def test_find_one_by_id(self):
+        store = InMemoryProjectStore()
+        project = _project()
+        store.projects[project.id()] = project
+        repository = InMemoryProjectReadRepository(store)
+
+        found = await repository.find_one(
+            InMemoryProjectByIdSpecification(project_id="github:owner:repo")
+        )
+
+        assert found is project
+
+    @pytest.mark.asyncio
+    async def test_find_one_raises_when_missing(self):
+        repository = InMemoryProjectReadRepository(InMemoryProjectStore())
+
+        with pytest.raises(EntityNotFoundError):
+            await repository.find_one(
+                InMemoryProjectByIdSpecification(project_id="github:owner:repo")
+            )
+
+    @pytest.mark.asyncio
+    async def test_find_all_orders_by_creation(self):
+        store = InMemoryProjectStore()
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+        newer = factory.create("https://github.com/owner/a", [], created_at=datetime(2025, 2, 1))
+        older = factory.create("https://github.com/owner/b", [], created_at=datetime(2025, 1, 1))
+        store.projects = {newer.id(): newer, older.id(): older}
+
+        projects = await InMemoryProjectReadRepository(store).find_all(
+            InMemoryAllProjectsSpecification()
+        )
+
+        assert [project.id() for project in projects] == [older.id(), newer.id()]
+
+    @pytest.mark.asyncio
+    async def test_find_all_reads_the_page_after_a_sort_key(self):
+        store = InMemoryProjectStore()
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+        created_at = datetime(2025, 1, 1)
+        projects = [
+            factory.create(f"https://github.com/owner/{name}", [], created_at=created_at)
+            for name in "abcd"
+        ]
+        store.projects = {project.id(): project for project in projects}
+
+        page = await InMemoryProjectReadRepository(store).find_all(
+            InMemoryAllProjectsSpecification(after=(created_at, projects[1].id()), limit=1)
+        )
+
+        assert [project.id() for project in page] == [projects[2].id()]
+
+    @pytest.mark.asyncio
+    async def test_find_all_compares_aware_sort_keys_with_naive_creation_times(self):
+        store = InMemoryProjectStore()
+        factory = ProjectFactory(DefaultPoliciesFactory(), URLBasedValueObjectsFactory())
+        older = factory.create("https://github.com/owner/a", [], created_at=datetime(2025, 1, 1))
+        newer = factory.create("https://github.com/owner/b", [], created_at=datetime(2025, 2, 1))
+        store.projects = {older.id(): older, newer.id(): newer}
+
+        page = await InMemoryProjectReadRepository(store).find_all(
+            InMemoryAllProjectsSpecification(after=(datetime(2025, 1, 15, tzinfo=UTC), ""))
+        )
+
+        assert [project.id() for project in page] == [newer.id()]
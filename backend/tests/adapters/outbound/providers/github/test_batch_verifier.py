@@ -0,0 +1,121 @@
+import re
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from adapters.outbound.providers import (
+    ConcurrentBatchVerifier,
+    ProviderHttpClient,
+    ProviderQueryError,
+)
+from adapters.outbound.providers.github import GitHubBatchRepositoryVerifier
+from domain.project.ports import RemoteRepository, RemoteRepositoryVerifier
+from domain.project.value_objects import Owner, Provider, ProviderType, RepositoryId
+
+
+class _GraphQLStub:
+    """Local stub of the GitHub GraphQL endpoint answering aliased repository lookups."""
+
+    def __init__(self, existing: set[tuple[str, str]], extra_errors: list[dict] | None = None):
+        self.existing = existing
+        self.extra_errors = extra_errors or []
+        self.queries: list[dict] = []
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/graphql", self._handle)
+        return app
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.queries.append(payload)
+        variables = payload["variables"]
+        data: dict[str, dict | None] = {}
+        errors: list[dict] = list(self.extra_errors)
+        for alias, index in re.findall(r"(r(\d+)): repository", payload["query"]):
+            key = (variables[f"owner{index}"], variables[f"name{index}"])
+            if key in self.existing:
+                data[alias] = {"id": f"R_{index}"}
+            else:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": "not found"})
+        return web.json_response({"data": data, "errors": errors})
+
+
+def _github(owner: str, name: str) -> RemoteRepository:
+    return RemoteRepository(RepositoryId(name), Provider(ProviderType.GITHUB), Owner(owner))
+
+
+class TestGitHubBatchRepositoryVerifier:
+    """Test suite for GitHubBatchRepositoryVerifier against a local GraphQL stub."""
+
+    @pytest.mark.asyncio
+    async def test_packs_repositories_into_aliased_queries(self):
+        repositories = [_github("org", f"repo-{i}") for i in range(250)]
+        stub = _GraphQLStub({("org", f"repo-{i}") for i in range(0, 250, 2)})
+        async with TestServer(stub.app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubBatchRepositoryVerifier(
+                ProviderHttpClient(session), graphql_url=str(server.make_url("/graphql"))
+            )
+            results = await verifier.verify_many(repositories)
+
+        assert len(stub.queries) == 3
+        assert len(results) == 250
+        assert all(results[repositories[i]] is (i % 2 == 0) for i in range(250))
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_checked_once(self):
+        repository = _github("org", "repo")
+        stub = _GraphQLStub({("org", "repo")})
+        async with TestServer(stub.app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubBatchRepositoryVerifier(
+                ProviderHttpClient(session), graphql_url=str(server.make_url("/graphql"))
+            )
+            results = await verifier.verify_many([repository, repository])
+
+        assert results == {repository: True}
+        assert len(stub.queries[0]["variables"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_other_providers_use_fallback(self):
+        github = _github("org", "repo")
+        gitlab = RemoteRepository(RepositoryId("repo"), Provider(ProviderType.GITLAB), Owner("org"))
+        single = AsyncMock(spec=RemoteRepositoryVerifier)
+        single.verify.return_value = True
+        stub = _GraphQLStub(set())
+        async with TestServer(stub.app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubBatchRepositoryVerifier(
+                ProviderHttpClient(session),
+                fallback=ConcurrentBatchVerifier(single),
+                graphql_url=str(server.make_url("/graphql")),
+            )
+            results = await verifier.verify_many([github, gitlab])
+
+        assert results == {github: False, gitlab: True}
+        single.verify.assert_called_once_with(
+            repository_id=gitlab.repository_id, provider=gitlab.provider, owner=gitlab.owner
+        )
+
+    @pytest.mark.asyncio
+    async def test_other_providers_without_fallback_are_not_found(self):
+        gitlab = RemoteRepository(RepositoryId("repo"), Provider(ProviderType.GITLAB), Owner("org"))
+        async with aiohttp.ClientSession() as session:
+            verifier = GitHubBatchRepositoryVerifier(ProviderHttpClient(session), graphql_url="http://unused")
+            results = await verifier.verify_many([gitlab])
+
+        assert results == {gitlab: False}
+
+    @pytest.mark.asyncio
+    async def test_query_errors_other_than_not_found_raise(self):
+        stub = _GraphQLStub(set(), extra_errors=[{"type": "RATE_LIMITED", "message": "slow down"}])
+        async with TestServer(stub.app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubBatchRepositoryVerifier(
+                ProviderHttpClient(session), graphql_url=str(server.make_url("/graphql"))
+            )
+            with pytest.raises(ProviderQueryError) as exc_info:
+                await verifier.verify_many([_github("org", "repo")])
+
+        assert exc_info.value.errors == ["slow down"]
@@ -0,0 +1,71 @@
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from adapters.outbound.providers import ProviderHttpClient, ProviderRequestError
+from adapters.outbound.providers.github import GitHubRepositoryVerifier
+from domain.project.value_objects import Owner, Provider, ProviderType, RepositoryId
+
+
+def _make_app() -> web.Application:
+    async def repository(request: web.Request) -> web.Response:
+        owner = request.match_info["owner"]
+        if owner == "broken":
+            return web.Response(status=502)
+        if owner == "octocat":
+            return web.json_response({"full_name": f"{owner}/{request.match_info['repo']}"})
+        return web.json_response({"message": "Not Found"}, status=404)
+
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}", repository)
+    return app
+
+
+class TestGitHubRepositoryVerifier:
+    """Test suite for GitHubRepositoryVerifier against a local stub of the GitHub API."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("owner", "expected"),
+        [("octocat", True), ("someone-else", False)],
+    )
+    async def test_verify_github_repository(self, owner, expected):
+        async with TestServer(_make_app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubRepositoryVerifier(
+                ProviderHttpClient(session), api_url=str(server.make_url(""))
+            )
+            result = await verifier.verify(
+                repository_id=RepositoryId("hello-world"),
+                provider=Provider(ProviderType.GITHUB),
+                owner=Owner(owner),
+            )
+
+        assert result is expected
+
+    @pytest.mark.asyncio
+    async def test_verify_other_provider_is_not_found(self):
+        async with aiohttp.ClientSession() as session:
+            verifier = GitHubRepositoryVerifier(ProviderHttpClient(session), api_url="http://unused")
+            result = await verifier.verify(
+                repository_id=RepositoryId("hello-world"),
+                provider=Provider(ProviderType.GITLAB),
+                owner=Owner("octocat"),
+            )
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_verify_unexpected_status_raises(self):
+        async with TestServer(_make_app()) as server, aiohttp.ClientSession() as session:
+            verifier = GitHubRepositoryVerifier(
+                ProviderHttpClient(session), api_url=str(server.make_url(""))
+            )
+            with pytest.raises(ProviderRequestError) as exc_info:
+                await verifier.verify(
+                    repository_id=RepositoryId("hello-world"),
+                    provider=Provider(ProviderType.GITHUB),
+                    owner=Owner("broken"),
+                )
+
+        assert exc_info.value.status == 502
@@ -0,0 +1,223 @@
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from adapters.outbound.providers import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitBreakingBatchVerifier,
+    CircuitBreakingVerifier,
+    CircuitOpenError,
+    CircuitState,
+    ProviderHttpClient,
+    ProviderRequestError,
+)
+from domain.project.ports import (
+    BatchRemoteRepositoryVerifier,
+    RemoteRepository,
+    RemoteRepositoryVerifier,
+)
+from domain.project.value_objects import Owner, Provider, ProviderType, RepositoryId
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _fail() -> None:
+    raise ProviderRequestError("https://api.github.com/repos/a/b", 503)
+
+
+async def _succeed() -> str:
+    return "ok"
+
+
+def _breaker(clock: _FakeClock, name: str = "github", **kwargs) -> CircuitBreaker:
+    options = {"window_size": 4, "minimum_calls": 4, "open_seconds": 10.0, **kwargs}
+    return CircuitBreaker(name, clock=clock, **options)
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_opens_when_failure_rate_reaches_threshold(self):
+        breaker = _breaker(_FakeClock())
+
+        await breaker.call(_succeed)
+        await breaker.call(_succeed)
+        for _ in range(2):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_stays_closed_below_minimum_calls(self):
+        breaker = _breaker(_FakeClock())
+
+        for _ in range(3):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        breaker = _breaker(_FakeClock())
+        for _ in range(4):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+        operation = AsyncMock()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await breaker.call(operation)
+
+        operation.assert_not_called()
+        assert exc_info.value.retry_after == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_successful_trial_call_closes_circuit(self):
+        clock = _FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+
+        clock.now = 10.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert await breaker.call(_succeed) == "ok"
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_trial_call_reopens_circuit(self):
+        clock = _FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+
+        clock.now = 10.0
+        with pytest.raises(ProviderRequestError):
+            await breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_half_open_limits_concurrent_trial_calls(self):
+        clock = _FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            with pytest.raises(ProviderRequestError):
+                await breaker.call(_fail)
+        clock.now = 10.0
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    @pytest.mark.asyncio
+    async def test_unrelated_errors_are_not_failures(self):
+        breaker = _breaker(_FakeClock(), minimum_calls=1)
+
+        async def broken() -> None:
+            raise ValueError("bug")
+
+        with pytest.raises(ValueError):
+            await breaker.call(broken)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [403, 429])
+    async def test_rate_limit_rejections_are_not_failures(self, status):
+        breaker = _breaker(_FakeClock(), minimum_calls=1)
+
+        async def rejected() -> None:
+            raise ProviderRequestError("https://api.github.com/repos/a/b", status)
+
+        with pytest.raises(ProviderRequestError):
+            await breaker.call(rejected)
+
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestCircuitBreakingVerifier:
+    """Test suite for per-provider isolation of CircuitBreakingVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_open_github_circuit_does_not_affect_gitlab(self):
+        clock = _FakeClock()
+        registry = CircuitBreakerRegistry(lambda name: _breaker(clock, name))
+        verifier = AsyncMock(spec=RemoteRepositoryVerifier)
+        verifier.verify.side_effect = ProviderRequestError("url", 503)
+        guarded = CircuitBreakingVerifier(verifier, registry)
+        github = Provider(ProviderType.GITHUB)
+        gitlab = Provider(ProviderType.GITLAB)
+        args = {"repository_id": RepositoryId("repo"), "owner": Owner("owner")}
+
+        for _ in range(4):
+            with pytest.raises(ProviderRequestError):
+                await guarded.verify(provider=github, **args)
+        with pytest.raises(CircuitOpenError):
+            await guarded.verify(provider=github, **args)
+
+        verifier.verify.side_effect = None
+        verifier.verify.return_value = True
+        assert await guarded.verify(provider=gitlab, **args) is True
+        assert registry.states() == {"github": CircuitState.OPEN, "gitlab": CircuitState.CLOSED}
+
+
+class TestCircuitBreakingBatchVerifier:
+    """Test suite for CircuitBreakingBatchVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_guards_each_provider_of_a_batch_with_its_breaker(self):
+        clock = _FakeClock()
+        registry = CircuitBreakerRegistry(lambda name: _breaker(clock, name))
+        github = RemoteRepository(RepositoryId("repo"), Provider(ProviderType.GITHUB), Owner("owner"))
+        gitlab = RemoteRepository(RepositoryId("repo"), Provider(ProviderType.GITLAB), Owner("owner"))
+        verifier = AsyncMock(spec=BatchRemoteRepositoryVerifier)
+        verifier.verify_many.side_effect = lambda batch: {repository: True for repository in batch}
+        guarded = CircuitBreakingBatchVerifier(verifier, registry)
+        for _ in range(4):
+            registry.get("github").record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            await guarded.verify_many([github, gitlab])
+        assert await guarded.verify_many([gitlab, gitlab]) == {gitlab: True}
+        verifier.verify_many.assert_called_once_with([gitlab])
+
+
+class TestProviderHttpClientCircuitBreaker:
+    """Test suite for the circuit breaker of ProviderHttpClient."""
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_the_circuit(self):
+        hits: list[str] = []
+
+        async def degraded(request: web.Request) -> web.Response:
+            hits.append(request.path)
+            return web.Response(status=503)
+
+        app = web.Application()
+        app.router.add_get("/repos/a/b", degraded)
+        breaker = _breaker(_FakeClock())
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(session, circuit_breaker=breaker)
+            url = str(server.make_url("/repos/a/b"))
+            for _ in range(4):
+                response = await client.get(url)
+                assert response.status == 503
+            with pytest.raises(CircuitOpenError):
+                await client.get(url)
+
+        assert len(hits) == 4
@@ -0,0 +1,26 @@
+import pytest
+
+from adapters.outbound.providers import (
+    CircuitBreaker,
+    CircuitBreakerProbe,
+    CircuitBreakerRegistry,
+    ProviderError,
+)
+
+
+class TestCircuitBreakerProbe:
+    """Test suite for CircuitBreakerProbe."""
+
+    @pytest.mark.asyncio
+    async def test_fails_while_a_circuit_is_open(self):
+        registry = CircuitBreakerRegistry(
+            lambda name: CircuitBreaker(name, window_size=1, minimum_calls=1)
+        )
+        probe = CircuitBreakerProbe(registry)
+        registry.get("gitlab")
+        await probe.check()
+
+        registry.get("github").record_failure()
+
+        with pytest.raises(ProviderError, match="github"):
+            await probe.check()
@@ -0,0 +1,126 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from adapters.outbound.providers import (
+    CachedResponse,
+    InMemoryHttpValidatorCache,
+    ProviderHttpClient,
+)
+
+ETAG = '"v1"'
+
+
+def _make_app(hits: list[dict[str, str]]) -> web.Application:
+    async def repository(request: web.Request) -> web.Response:
+        hits.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG, "X-RateLimit-Remaining": "59"})
+        return web.json_response({"name": "repo"}, headers={"ETag": ETAG, "X-RateLimit-Remaining": "60"})
+
+    async def uncacheable(request: web.Request) -> web.Response:
+        hits.append(dict(request.headers))
+        return web.json_response({"name": "repo"})
+
+    app = web.Application()
+    app.router.add_get("/repo", repository)
+    app.router.add_get("/uncacheable", uncacheable)
+    return app
+
+
+class TestProviderHttpClient:
+    """Test suite for conditional requests in ProviderHttpClient."""
+
+    @pytest.mark.asyncio
+    async def test_second_get_is_conditional_and_served_from_cache(self):
+        hits: list[dict[str, str]] = []
+        cache = InMemoryHttpValidatorCache()
+        async with TestServer(_make_app(hits)) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(session, cache)
+            url = str(server.make_url("/repo"))
+
+            first = await client.get(url)
+            second = await client.get(url)
+
+        assert first.status == 200
+        assert first.from_cache is False
+        assert "If-None-Match" not in hits[0]
+
+        assert hits[1]["If-None-Match"] == ETAG
+        assert second.status == 200
+        assert second.from_cache is True
+        assert second.json_body() == {"name": "repo"}
+        # Fresh headers of the 304 answer win over the cached ones
+        assert second.headers["x-ratelimit-remaining"] == "59"
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_are_not_cached(self):
+        hits: list[dict[str, str]] = []
+        cache = InMemoryHttpValidatorCache()
+        async with TestServer(_make_app(hits)) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(session, cache)
+            url = str(server.make_url("/uncacheable"))
+
+            await client.get(url)
+            response = await client.get(url)
+
+        assert len(cache) == 0
+        assert response.from_cache is False
+        assert all("If-None-Match" not in headers for headers in hits)
+
+    @pytest.mark.asyncio
+    async def test_default_headers_are_sent(self):
+        hits: list[dict[str, str]] = []
+        async with TestServer(_make_app(hits)) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(session, headers={"Authorization": "Bearer token"})
+            await client.get(str(server.make_url("/repo")))
+
+        assert hits[0]["Authorization"] == "Bearer token"
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_are_coalesced(self):
+        hits: list[dict[str, str]] = []
+        async with TestServer(_make_app(hits)) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(session, coalesce_gets=True)
+            url = str(server.make_url("/uncacheable"))
+
+            responses = await asyncio.gather(*(client.get(url) for _ in range(5)))
+
+        assert len(hits) == 1
+        assert [response.json_body() for response in responses] == [{"name": "repo"}] * 5
+
+
+class TestInMemoryHttpValidatorCache:
+    """Test suite for InMemoryHttpValidatorCache."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_entry(self):
+        cache = InMemoryHttpValidatorCache(max_entries=2)
+        entry = CachedResponse(status=200, headers={}, body=b"{}", etag=ETAG)
+
+        await cache.set("a", entry)
+        await cache.set("b", entry)
+        await cache.get("a")
+        await cache.set("c", entry)
+
+        assert await cache.get("a") == entry
+        assert await cache.get("b") is None
+        assert await cache.get("c") == entry
+
+    def test_conditional_headers(self):
+        entry = CachedResponse(
+            status=200,
+            headers={},
+            body=b"",
+            etag=ETAG,
+            last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+
+        assert entry.conditional_headers() == {
+            "If-None-Match": ETAG,
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
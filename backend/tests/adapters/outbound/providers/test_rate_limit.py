@@ -0,0 +1,207 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from adapters.outbound.providers import (
+    ProviderHttpClient,
+    RateLimitScheduler,
+    RequestPriority,
+    request_priority,
+)
+
+WINDOW_SECONDS = 0.25
+REQUESTS_PER_WINDOW = 5
+
+
+class _FakeRateLimitedProvider:
+    """Local provider stub enforcing a fixed-window limit like GitHub does."""
+
+    def __init__(self) -> None:
+        self.accepted = 0
+        self.rejected = 0
+        self._window_started = time.time()
+        self._used = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/resource", self._handle)
+        return app
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        now = time.time()
+        if now - self._window_started >= WINDOW_SECONDS:
+            self._window_started = now
+            self._used = 0
+
+        reset = self._window_started + WINDOW_SECONDS
+        if self._used >= REQUESTS_PER_WINDOW:
+            self.rejected += 1
+            return web.Response(
+                status=429,
+                headers={
+                    "Retry-After": f"{reset - now:.3f}",
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": f"{reset:.3f}",
+                },
+            )
+
+        self._used += 1
+        self.accepted += 1
+        return web.json_response(
+            {},
+            headers={
+                "X-RateLimit-Remaining": str(REQUESTS_PER_WINDOW - self._used),
+                "X-RateLimit-Reset": f"{reset:.3f}",
+            },
+        )
+
+
+class TestRateLimitSchedulerSimulation:
+    """Simulates a burst of requests against a provider that enforces limits."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_smoothed_and_every_request_succeeds(self):
+        provider = _FakeRateLimitedProvider()
+        scheduler = RateLimitScheduler(rate=REQUESTS_PER_WINDOW / WINDOW_SECONDS, burst=REQUESTS_PER_WINDOW)
+        async with TestServer(provider.app()) as server, aiohttp.ClientSession() as session:
+            client = ProviderHttpClient(
+                session,
+                scheduler=scheduler,
+                rate_limit_key=RateLimitScheduler.bucket_key("github", "token"),
+                max_rate_limit_retries=10,
+            )
+            url = str(server.make_url("/resource"))
+
+            started = time.monotonic()
+            responses = await asyncio.gather(*(client.get(url) for _ in range(20)))
+            elapsed = time.monotonic() - started
+
+        assert [response.status for response in responses] == [200] * 20
+        assert provider.accepted == 20
+        # 20 requests at 5 per window need at least three full windows
+        assert elapsed >= 3 * WINDOW_SECONDS * 0.9
+        # Rejections only happen while the scheduler learns the quota
+        assert provider.rejected < 20
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_isolated_per_credential(self):
+        scheduler = RateLimitScheduler(rate=1.0, burst=1)
+        exhausted = RateLimitScheduler.bucket_key("github", "first-token")
+        fresh = RateLimitScheduler.bucket_key("github", "second-token")
+
+        await scheduler.acquire(exhausted)
+        await asyncio.wait_for(scheduler.acquire(fresh), timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(scheduler.acquire(exhausted), timeout=0.1)
+
+
+class TestRateLimitScheduler:
+    """Test suite for priorities and header handling of RateLimitScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_are_released_before_background_ones(self):
+        scheduler = RateLimitScheduler(rate=50.0, burst=1)
+        await scheduler.acquire("github")
+        released: list[str] = []
+
+        async def request(name: str, priority: RequestPriority) -> None:
+            await scheduler.acquire("github", priority)
+            released.append(name)
+
+        background = [
+            asyncio.create_task(request(f"background-{i}", RequestPriority.BACKGROUND))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+
+        assert released[0] == "interactive"
+        assert released[1:] == ["background-0", "background-1", "background-2"]
+
+    @pytest.mark.asyncio
+    async def test_priority_is_taken_from_context(self):
+        scheduler = RateLimitScheduler(rate=50.0, burst=1)
+        await scheduler.acquire("github")
+        released: list[str] = []
+
+        async def request(name: str) -> None:
+            await scheduler.acquire("github")
+            released.append(name)
+
+        with request_priority(RequestPriority.BACKGROUND):
+            background = asyncio.create_task(request("background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive"))
+        await asyncio.gather(background, interactive)
+
+        assert released == ["interactive", "background"]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_the_bucket(self):
+        scheduler = RateLimitScheduler(rate=1000.0, burst=10)
+        scheduler.observe("github", 429, {"retry-after": "0.2"})
+
+        started = time.monotonic()
+        await scheduler.acquire("github")
+
+        assert time.monotonic() - started >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_pauses_until_reset(self):
+        scheduler = RateLimitScheduler(rate=1000.0, burst=10)
+        scheduler.observe(
+            "github",
+            200,
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(time.time() + 0.2)},
+        )
+
+        started = time.monotonic()
+        await scheduler.acquire("github")
+
+        assert time.monotonic() - started >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_quota_rate_is_clamped_to_minimum_rate(self):
+        scheduler = RateLimitScheduler(rate=1000.0, burst=1, min_rate=20.0)
+        scheduler.observe(
+            "github",
+            200,
+            {"x-ratelimit-remaining": "1", "x-ratelimit-reset": str(time.time() + 1e300)},
+        )
+        await scheduler.acquire("github")
+
+        await asyncio.wait_for(scheduler.acquire("github"), timeout=0.2)
+
+    @pytest.mark.parametrize(
+        "options", [{"rate": 0.0}, {"rate": -1.0}, {"min_rate": 0.0}, {"burst": 0}]
+    )
+    def test_rejects_rates_that_cannot_release_requests(self, options):
+        with pytest.raises(ValueError):
+            RateLimitScheduler(**options)
+
+    @pytest.mark.asyncio
+    async def test_malformed_quota_headers_are_ignored(self):
+        scheduler = RateLimitScheduler(rate=1000.0, burst=10)
+        for remaining, reset in (("many", str(time.time() + 60)), ("0", "soon"), ("0", "nan")):
+            scheduler.observe(
+                "github", 200, {"x-ratelimit-remaining": remaining, "x-ratelimit-reset": reset}
+            )
+
+        await asyncio.wait_for(scheduler.acquire("github"), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_consume_a_token(self):
+        scheduler = RateLimitScheduler(rate=20.0, burst=1)
+        await scheduler.acquire("github")
+
+        cancelled = asyncio.create_task(scheduler.acquire("github"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await asyncio.wait_for(scheduler.acquire("github"), timeout=0.2)
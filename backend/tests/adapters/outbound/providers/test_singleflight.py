@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from adapters.outbound.providers import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def operation() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flights.do("key", operation)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [42] * 5
+        assert calls == 1
+        assert flights.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flights: SingleFlight[str, str] = SingleFlight()
+
+        async def echo(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flights.do("a", lambda: echo("a")), flights.do("b", lambda: echo("b"))
+        )
+
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_the_shared_call(self):
+        flights: SingleFlight[str, int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def operation() -> int:
+            await release.wait()
+            return 7
+
+        cancelled = asyncio.create_task(flights.do("key", operation))
+        remaining = asyncio.create_task(flights.do("key", operation))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await remaining == 7
+        assert cancelled.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_exception_is_raised_to_every_waiter_and_key_is_released(self):
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def failing() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            flights.do("key", failing), flights.do("key", failing), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+        assert calls == 1
+
+        with pytest.raises(RuntimeError):
+            await flights.do("key", failing)
+        assert calls == 2
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from adapters.outbound.providers import CoalescingVerifier, ConcurrentBatchVerifier
+from domain.project.ports import RemoteRepository
+from domain.project.value_objects import Owner, Provider, ProviderType, RepositoryId
+
+
+class _SlowVerifier:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def verify(self, repository_id, provider, owner) -> bool:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return str(repository_id).endswith("0")
+
+
+class TestConcurrentBatchVerifier:
+    """Test suite for ConcurrentBatchVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_verifies_every_repository_with_bounded_concurrency(self):
+        single = _SlowVerifier()
+        repositories = [
+            RemoteRepository(RepositoryId(f"repo-{i}"), Provider(ProviderType.GITLAB), Owner("org"))
+            for i in range(20)
+        ]
+
+        results = await ConcurrentBatchVerifier(single, concurrency=4).verify_many(repositories)
+
+        assert single.max_in_flight == 4
+        assert [results[r] for r in repositories] == [i % 10 == 0 for i in range(20)]
+
+
+class TestCoalescingVerifier:
+    """Test suite for CoalescingVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_verifications_share_one_call(self):
+        single = _SlowVerifier()
+        verifier = CoalescingVerifier(single)
+        calls = 0
+        original = single.verify
+
+        async def counting_verify(**kwargs) -> bool:
+            nonlocal calls
+            calls += 1
+            return await original(**kwargs)
+
+        single.verify = counting_verify
+        args = {
+            "repository_id": RepositoryId("repo-0"),
+            "provider": Provider(ProviderType.GITHUB),
+            "owner": Owner("org"),
+        }
+        other = {**args, "owner": Owner("other-org")}
+
+        results = await asyncio.gather(
+            verifier.verify(**args), verifier.verify(**args), verifier.verify(**other)
+        )
+
+        assert results == [True, True, True]
+        assert calls == 2
@@ -0,0 +1,78 @@
+import pytest
+
+from adapters.outbound.rate_limit import InMemoryRateLimitStore
+from application.ports import RateLimit
+
+LIMIT = RateLimit(limit=2, window_seconds=10)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryRateLimitStore:
+    """Test suite for InMemoryRateLimitStore."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_requests_above_the_limit(self):
+        store = InMemoryRateLimitStore(clock=_FakeClock())
+
+        first = await store.consume("key", LIMIT)
+        second = await store.consume("key", LIMIT)
+        third = await store.consume("key", LIMIT)
+
+        assert first.allowed and second.allowed
+        assert not third.allowed
+        assert third.retry_after_seconds == pytest.approx(15.0)
+
+    @pytest.mark.asyncio
+    async def test_keys_are_limited_separately(self):
+        store = InMemoryRateLimitStore(clock=_FakeClock())
+        await store.consume("noisy", LIMIT)
+        await store.consume("noisy", LIMIT)
+
+        decision = await store.consume("quiet", LIMIT)
+
+        assert decision.allowed
+
+    @pytest.mark.asyncio
+    async def test_previous_window_slides_out_gradually(self):
+        clock = _FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        await store.consume("key", LIMIT)
+        await store.consume("key", LIMIT)
+
+        clock.now = 12.0
+        rejected = await store.consume("key", LIMIT)
+        clock.now = 12.0 + rejected.retry_after_seconds
+        allowed = await store.consume("key", LIMIT)
+
+        assert not rejected.allowed
+        assert rejected.retry_after_seconds == pytest.approx(3.0)
+        assert allowed.allowed
+
+    @pytest.mark.asyncio
+    async def test_idle_key_starts_over(self):
+        clock = _FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        await store.consume("key", LIMIT)
+        await store.consume("key", LIMIT)
+
+        clock.now = 25.0
+
+        assert (await store.consume("key", LIMIT)).allowed
+        assert (await store.consume("key", LIMIT)).allowed
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_key(self):
+        store = InMemoryRateLimitStore(max_keys=1, clock=_FakeClock())
+        await store.consume("a", LIMIT)
+        await store.consume("a", LIMIT)
+
+        await store.consume("b", LIMIT)
+
+        assert (await store.consume("a", LIMIT)).allowed
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -7,7 +8,7 @@ from application.commands.handlers.create_project_command_handler import (
     CreateProjectCommandHandler,
 )
 from domain.project.aggregate import Project
-from domain.project.exceptions import ProjectAlreadyExistsError
+from domain.project.exceptions import ProjectAlreadyExistsError, RemoteRepositoryDoesNotExistError
 from domain.project.services.create_project_service import CreateProjectService
 from domain.ports import UnitOfWork
 from domain.ports.specifications import ProjectAlreadyExistsSpecification
@@ -343,3 +344,131 @@ class TestCreateProjectCommandHandler:
 
         # Verify specification factory gets the original command
         mock_specification_factory.assert_called_once_with(command)
+
+
+class TestCreateProjectCommandHandlerOptimistic:
+    """Test suite for the optimistic mode overlapping the existence query with verification."""
+
+    @pytest.fixture
+    def mock_uow(self):
+        mock = AsyncMock(spec=UnitOfWork)
+        mock.__aenter__.return_value = mock
+        mock.__aexit__.return_value = None
+        return mock
+
+    @pytest.fixture
+    def mock_create_project_service(self):
+        return AsyncMock(spec=CreateProjectService)
+
+    @pytest.fixture
+    def valid_command(self):
+        return CreateProjectCommand(
+            rules=["Rule 1"],
+            url="https://github.com/test-owner/test-repo",
+        )
+
+    @pytest.fixture
+    def handler(self, mock_uow, mock_create_project_service):
+        spec_factory = Mock(return_value=Mock(spec=ProjectAlreadyExistsSpecification))
+        return CreateProjectCommandHandler(
+            uow=mock_uow,
+            create_project_service=mock_create_project_service,
+            specification_factory=spec_factory,
+            optimistic=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_and_verification_overlap(
+        self, handler, valid_command, mock_uow, mock_create_project_service
+    ):
+        project = Mock(spec=Project)
+        query_started = asyncio.Event()
+        verification_started = asyncio.Event()
+
+        # Each side waits for the other to start, so neither finishes if they run in turn
+        async def query(spec):
+            query_started.set()
+            await verification_started.wait()
+            return False
+
+        async def verify_and_create(url, rules):
+            verification_started.set()
+            await query_started.wait()
+            return project
+
+        mock_uow.make_query.side_effect = query
+        mock_create_project_service.create.side_effect = verify_and_create
+
+        await asyncio.wait_for(handler.handle(valid_command), timeout=5)
+
+        mock_uow.save.assert_called_once_with(project)
+        mock_uow.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_existing_project_cancels_verification(
+        self, handler, valid_command, mock_uow, mock_create_project_service
+    ):
+        cancelled = asyncio.Event()
+
+        async def never_finishing_create(url, rules):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def slow_query(spec):
+            await asyncio.sleep(0.01)
+            return True
+
+        mock_uow.make_query.side_effect = slow_query
+        mock_create_project_service.create.side_effect = never_finishing_create
+
+        with pytest.raises(ProjectAlreadyExistsError):
+            await handler.handle(valid_command)
+
+        assert cancelled.is_set()
+        mock_uow.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_already_exists_wins_over_verification_error(
+        self, handler, valid_command, mock_uow, mock_create_project_service
+    ):
+        async def slow_query(spec):
+            await asyncio.sleep(0.01)
+            return True
+
+        mock_uow.make_query.side_effect = slow_query
+        mock_create_project_service.create.side_effect = RemoteRepositoryDoesNotExistError(
+            "test-repo", "github"
+        )
+
+        with pytest.raises(ProjectAlreadyExistsError):
+            await handler.handle(valid_command)
+
+    @pytest.mark.asyncio
+    async def test_verification_error_raised_when_project_is_new(
+        self, handler, valid_command, mock_uow, mock_create_project_service
+    ):
+        mock_uow.make_query.return_value = False
+        mock_create_project_service.create.side_effect = RemoteRepositoryDoesNotExistError(
+            "test-repo", "github"
+        )
+
+        with pytest.raises(RemoteRepositoryDoesNotExistError):
+            await handler.handle(valid_command)
+
+        mock_uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_error_propagates(
+        self, handler, valid_command, mock_uow, mock_create_project_service
+    ):
+        query_exception = Exception("Query execution error")
+        mock_uow.make_query.side_effect = query_exception
+
+        with pytest.raises(Exception) as exc_info:
+            await handler.handle(valid_command)
+
+        assert exc_info.value is query_exception
+        mock_uow.save.assert_not_called()
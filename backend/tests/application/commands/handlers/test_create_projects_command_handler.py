@@ -0,0 +1,184 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.commands.commands import CreateProjectsCommand
+from application.commands.handlers.create_projects_command_handler import (
+    DUPLICATE_IN_BATCH,
+    VERIFICATION_FAILED,
+    CreateProjectsCommandHandler,
+)
+from domain.ports import UnitOfWork
+from domain.ports.specifications import ExistingProjectsSpecification
+from domain.project.exceptions import RemoteRepositoryDoesNotExistError
+from domain.project.factories import (
+    DefaultPoliciesFactory,
+    ProjectFactory,
+    URLBasedValueObjectsFactory,
+)
+from domain.project.services import CreateProjectService
+
+
+class _TrackingBatchVerifier:
+    """Batch verifier stub recording its batches and concurrent calls."""
+
+    def __init__(self, missing: set[str], failing: set[str]):
+        self.missing = missing
+        self.failing = failing
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def verify_many(self, repositories):
+        names = [str(repository.repository_id) for repository in repositories]
+        self.batches.append(names)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if self.failing.intersection(names):
+            raise TimeoutError
+        return {repository: str(repository.repository_id) not in self.missing for repository in repositories}
+
+
+class TestCreateProjectsCommandHandler:
+    """Test suite for CreateProjectsCommandHandler."""
+
+    @pytest.fixture
+    def mock_uow(self):
+        mock = AsyncMock(spec=UnitOfWork)
+        mock.__aenter__.return_value = mock
+        mock.__aexit__.return_value = None
+        mock.make_query.return_value = set()
+        return mock
+
+    @pytest.fixture
+    def verifier(self):
+        return _TrackingBatchVerifier(missing={"missing-repo"}, failing={"slow-repo"})
+
+    @pytest.fixture
+    def mock_specification_factory(self):
+        return Mock(return_value=Mock(spec=ExistingProjectsSpecification))
+
+    @pytest.fixture
+    def handler(self, mock_uow, verifier, mock_specification_factory):
+        value_objects_factory = URLBasedValueObjectsFactory()
+        service = CreateProjectService(
+            project_factory=ProjectFactory(DefaultPoliciesFactory(), value_objects_factory),
+            value_objects_factory=value_objects_factory,
+            remote_repository_verifiers=[],
+        )
+        return CreateProjectsCommandHandler(
+            uow=mock_uow,
+            create_project_service=service,
+            batch_verifier=verifier,
+            value_objects_factory=value_objects_factory,
+            specification_factory=mock_specification_factory,
+            max_concurrent_verifications=2,
+            verification_batch_size=5,
+        )
+
+    @pytest.mark.asyncio
+    async def test_creates_batch_with_one_query_and_one_batched_save(
+        self, handler, mock_uow, mock_specification_factory, verifier
+    ):
+        urls = [f"https://github.com/org/repo-{i}" for i in range(30)]
+
+        outcomes = await handler.handle(CreateProjectsCommand(rules=["Rule"], urls=urls))
+
+        assert all(outcome.created for outcome in outcomes)
+        assert [outcome.project_id for outcome in outcomes] == [f"github:org:repo-{i}" for i in range(30)]
+        mock_specification_factory.assert_called_once_with([f"github:org:repo-{i}" for i in range(30)])
+        mock_uow.make_query.assert_called_once()
+        mock_uow.save_all.assert_called_once()
+        assert len(mock_uow.save_all.call_args.args[0]) == 30
+        mock_uow.commit.assert_called_once()
+        assert [len(batch) for batch in verifier.batches] == [5] * 6
+
+    @pytest.mark.asyncio
+    async def test_verification_respects_concurrency_limit(self, handler, verifier):
+        urls = [f"https://github.com/org/repo-{i}" for i in range(30)]
+
+        await handler.handle(CreateProjectsCommand(rules=[], urls=urls))
+
+        assert verifier.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_outcome_per_url(self, handler, mock_uow):
+        mock_uow.make_query.return_value = {"github:org:existing"}
+        urls = [
+            "https://github.com/org/new-repo",
+            "https://github.com/org/existing",
+            "https://github.com/org/missing-repo",
+            "not-a-url",
+            "https://github.com/org/new-repo.git",
+        ]
+
+        outcomes = await handler.handle(CreateProjectsCommand(rules=[], urls=urls))
+
+        assert [(outcome.url, outcome.error) for outcome in outcomes] == [
+            ("https://github.com/org/new-repo", None),
+            ("https://github.com/org/existing", "project_already_exists"),
+            ("https://github.com/org/missing-repo", RemoteRepositoryDoesNotExistError("", "").status),
+            ("not-a-url", "invalid_url_format"),
+            ("https://github.com/org/new-repo.git", DUPLICATE_IN_BATCH),
+        ]
+        saved = mock_uow.save_all.call_args.args[0]
+        assert [project.id() for project in saved] == ["github:org:new-repo"]
+
+    @pytest.mark.asyncio
+    async def test_reports_every_repeat_of_a_url(self, handler, mock_uow):
+        urls = ["https://github.com/org/repo", "https://github.com/org/other", "https://github.com/org/repo"]
+
+        outcomes = await handler.handle(CreateProjectsCommand(rules=[], urls=urls))
+
+        assert [(outcome.url, outcome.error) for outcome in outcomes] == [
+            ("https://github.com/org/repo", None),
+            ("https://github.com/org/other", None),
+            ("https://github.com/org/repo", DUPLICATE_IN_BATCH),
+        ]
+        saved = mock_uow.save_all.call_args.args[0]
+        assert [project.id() for project in saved] == ["github:org:repo", "github:org:other"]
+
+    @pytest.mark.asyncio
+    async def test_verifies_outside_the_unit_of_work(self, handler, mock_uow, verifier):
+        entered = []
+        mock_uow.__aenter__.side_effect = lambda: entered.append(True) or mock_uow
+        mock_uow.__aexit__.side_effect = lambda *exc: entered.pop()
+        verify_many = verifier.verify_many
+
+        async def verify_outside(repositories):
+            assert entered == []
+            return await verify_many(repositories)
+
+        verifier.verify_many = verify_outside
+
+        outcomes = await handler.handle(CreateProjectsCommand(rules=[], urls=["https://github.com/org/repo"]))
+
+        assert [outcome.created for outcome in outcomes] == [True]
+        assert mock_uow.__aenter__.call_count == 2
+        mock_uow.save_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reports_verification_errors_per_url_of_the_batch(self, handler, mock_uow):
+        urls = ["https://github.com/org/slow-repo"] + [f"https://github.com/org/repo-{i}" for i in range(5)]
+
+        outcomes = await handler.handle(CreateProjectsCommand(rules=[], urls=urls))
+
+        assert [outcome.error for outcome in outcomes] == [VERIFICATION_FAILED] * 5 + [None]
+        saved = mock_uow.save_all.call_args.args[0]
+        assert [project.id() for project in saved] == ["github:org:repo-4"]
+        mock_uow.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_propagate_without_commit(self, handler, mock_uow, verifier):
+        async def broken(repositories):
+            raise ConnectionError("provider unreachable")
+
+        verifier.verify_many = broken
+
+        with pytest.raises(ConnectionError):
+            await handler.handle(CreateProjectsCommand(rules=[], urls=["https://github.com/org/repo"]))
+
+        mock_uow.commit.assert_not_called()
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from adapters.outbound.idempotency import InMemoryIdempotencyStore
+from application.commands.commands import CreateProjectCommand
+from application.commands.exceptions import IdempotencyKeyReusedError
+from application.commands.middlewares import IdempotencyMiddleware
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+URL = "https://github.com/test-owner/test-repo"
+
+
+class _CountingHandler:
+    def __init__(self, result="created", error: Exception | None = None, delay: float = 0):
+        self.calls = 0
+        self._result = result
+        self._error = error
+        self._delay = delay
+
+    async def __call__(self, command):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class TestIdempotencyMiddleware:
+    """Test suite for IdempotencyMiddleware."""
+
+    @pytest.fixture
+    def middleware(self):
+        return IdempotencyMiddleware(InMemoryIdempotencyStore(), ttl_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_returns_stored_result_without_running_handler(self, middleware):
+        handler = _CountingHandler()
+        command = CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1")
+
+        first = await middleware(command, handler)
+        second = await middleware(command.model_copy(), handler)
+
+        assert first == second == "created"
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_commands_without_key_always_run(self, middleware):
+        handler = _CountingHandler()
+        command = CreateProjectCommand(rules=[], url=URL)
+
+        await middleware(command, handler)
+        await middleware(command, handler)
+
+        assert handler.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_domain_errors_are_replayed(self, middleware):
+        handler = _CountingHandler(error=ProjectAlreadyExistsError(URL))
+        command = CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1")
+
+        for _ in range(2):
+            with pytest.raises(ProjectAlreadyExistsError):
+                await middleware(command, handler)
+
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_each_replay_raises_a_fresh_error(self, middleware):
+        handler = _CountingHandler(error=ProjectAlreadyExistsError(URL))
+        command = CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1")
+
+        errors = []
+        for _ in range(3):
+            with pytest.raises(ProjectAlreadyExistsError) as error:
+                await middleware(command, handler)
+            errors.append(error.value)
+
+        assert errors[1] is not errors[2]
+        assert errors[2].message == errors[0].message
+        assert errors[2].status == "project_already_exists"
+
+    @pytest.mark.asyncio
+    async def test_keys_are_scoped_by_client(self, middleware):
+        handler = _CountingHandler()
+
+        for client_id, rules in (("a", []), ("b", ["Other"])):
+            await middleware(
+                CreateProjectCommand(
+                    rules=rules, url=URL, client_id=client_id, idempotency_key="key-1"
+                ),
+                handler,
+            )
+
+        assert handler.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_not_stored(self, middleware):
+        handler = _CountingHandler(error=ConnectionError("database down"))
+        command = CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await middleware(command, handler)
+
+        assert handler.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_wait_for_in_flight_command(self, middleware):
+        handler = _CountingHandler(delay=0.01)
+        command = CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1")
+
+        results = await asyncio.gather(*(middleware(command, handler) for _ in range(5)))
+
+        assert results == ["created"] * 5
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_key_reused_with_different_payload_is_rejected(self, middleware):
+        handler = _CountingHandler()
+        await middleware(CreateProjectCommand(rules=[], url=URL, idempotency_key="key-1"), handler)
+
+        with pytest.raises(IdempotencyKeyReusedError):
+            await middleware(
+                CreateProjectCommand(rules=["Other"], url=URL, idempotency_key="key-1"), handler
+            )
+
+        assert handler.calls == 1
@@ -0,0 +1,37 @@
+import logging
+
+import pytest
+
+from application.commands.commands import CreateProjectCommand
+from application.commands.middlewares import LoggingMiddleware
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+
+@pytest.fixture
+def command():
+    return CreateProjectCommand(rules=[], url="https://github.com/test-owner/test-repo")
+
+
+class TestLoggingMiddleware:
+    """Test suite for LoggingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_logs_handled_command(self, command, caplog):
+        async def next_step(cmd):
+            return None
+
+        with caplog.at_level(logging.INFO):
+            await LoggingMiddleware()(command, next_step)
+
+        assert "Command CreateProjectCommand handled" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_logs_domain_error_as_warning(self, command, caplog):
+        async def next_step(cmd):
+            raise ProjectAlreadyExistsError(cmd.url)
+
+        with caplog.at_level(logging.INFO), pytest.raises(ProjectAlreadyExistsError):
+            await LoggingMiddleware()(command, next_step)
+
+        assert caplog.records[-1].levelno == logging.WARNING
+        assert "project_already_exists" in caplog.text
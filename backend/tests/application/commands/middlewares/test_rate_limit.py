@@ -0,0 +1,123 @@
+import pytest
+
+from adapters.outbound.idempotency import InMemoryIdempotencyStore
+from adapters.outbound.rate_limit import InMemoryRateLimitStore
+from application.commands.commands import CreateProjectCommand, CreateProjectsCommand
+from application.commands.exceptions import RateLimitExceededError
+from application.commands.middlewares import (
+    CommandRateLimits,
+    IdempotencyMiddleware,
+    RateLimitMiddleware,
+)
+from application.ports import RateLimit
+
+URL = "https://github.com/test-owner/test-repo"
+OTHER_URL = "https://github.com/test-owner/other-repo"
+
+
+class _CountingHandler:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, command):
+        self.calls += 1
+        return "created"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _project_ids(command):
+    return [command.url] if isinstance(command, CreateProjectCommand) else []
+
+
+def _middleware(per_client: int = 10, per_project: int = 10) -> RateLimitMiddleware:
+    limits = {
+        CreateProjectCommand: CommandRateLimits(
+            per_client=RateLimit(limit=per_client, window_seconds=60),
+            per_project=RateLimit(limit=per_project, window_seconds=60),
+        )
+    }
+    return RateLimitMiddleware(InMemoryRateLimitStore(), limits, _project_ids)
+
+
+class TestRateLimitMiddleware:
+    """Test suite for RateLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_noisy_client_does_not_limit_others(self):
+        middleware = _middleware(per_client=1)
+        handler = _CountingHandler()
+        await middleware(CreateProjectCommand(rules=[], url=URL, client_id="noisy"), handler)
+
+        with pytest.raises(RateLimitExceededError) as error:
+            await middleware(
+                CreateProjectCommand(rules=[], url=OTHER_URL, client_id="noisy"), handler
+            )
+        await middleware(CreateProjectCommand(rules=[], url=OTHER_URL, client_id="quiet"), handler)
+
+        assert handler.calls == 2
+        assert error.value.retry_after_seconds > 0
+        assert error.value.status == "rate_limit_exceeded"
+
+    @pytest.mark.asyncio
+    async def test_limits_each_project_across_clients(self):
+        middleware = _middleware(per_project=1)
+        handler = _CountingHandler()
+        await middleware(CreateProjectCommand(rules=[], url=URL, client_id="a"), handler)
+
+        with pytest.raises(RateLimitExceededError):
+            await middleware(CreateProjectCommand(rules=[], url=URL, client_id="b"), handler)
+        await middleware(CreateProjectCommand(rules=[], url=OTHER_URL, client_id="b"), handler)
+
+        assert handler.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_clients_without_id_share_a_limit(self):
+        middleware = _middleware(per_client=1)
+        handler = _CountingHandler()
+        await middleware(CreateProjectCommand(rules=[], url=URL), handler)
+
+        with pytest.raises(RateLimitExceededError):
+            await middleware(CreateProjectCommand(rules=[], url=OTHER_URL), handler)
+
+    @pytest.mark.asyncio
+    async def test_command_types_without_limits_pass_through(self):
+        middleware = _middleware(per_client=0)
+        handler = _CountingHandler()
+
+        await middleware(CreateProjectsCommand(urls=[URL], rules=[]), handler)
+
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_not_replayed_to_idempotent_retries(self):
+        clock = _FakeClock()
+        rate_limits = RateLimitMiddleware(
+            InMemoryRateLimitStore(clock=clock),
+            {
+                CreateProjectCommand: CommandRateLimits(
+                    per_client=RateLimit(limit=1, window_seconds=60)
+                )
+            },
+            _project_ids,
+        )
+        idempotency = IdempotencyMiddleware(InMemoryIdempotencyStore(), ttl_seconds=3600)
+        handler = _CountingHandler()
+
+        async def dispatch(command):
+            return await idempotency(command, lambda c: rate_limits(c, handler))
+
+        await dispatch(CreateProjectCommand(rules=[], url=URL, client_id="a"))
+        retried = CreateProjectCommand(rules=[], url=OTHER_URL, client_id="a", idempotency_key="k")
+        with pytest.raises(RateLimitExceededError) as error:
+            await dispatch(retried)
+        clock.now += error.value.retry_after_seconds
+
+        assert await dispatch(retried) == "created"
+        assert handler.calls == 2
@@ -0,0 +1,59 @@
+import pytest
+
+from application.commands.commands import CreateProjectCommand
+from application.commands.middlewares import RetryMiddleware
+
+
+@pytest.fixture
+def command():
+    return CreateProjectCommand(rules=[], url="https://github.com/test-owner/test-repo")
+
+
+class TestRetryMiddleware:
+    """Test suite for RetryMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_until_success(self, command):
+        attempts = 0
+
+        async def next_step(cmd):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise ConnectionError("database restarted")
+            return "done"
+
+        middleware = RetryMiddleware((ConnectionError,), max_attempts=3, backoff_seconds=0)
+
+        assert await middleware(command, next_step) == "done"
+        assert attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, command):
+        attempts = 0
+
+        async def next_step(cmd):
+            nonlocal attempts
+            attempts += 1
+            raise ConnectionError("database down")
+
+        middleware = RetryMiddleware((ConnectionError,), max_attempts=2, backoff_seconds=0)
+
+        with pytest.raises(ConnectionError):
+            await middleware(command, next_step)
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self, command):
+        attempts = 0
+
+        async def next_step(cmd):
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("invalid")
+
+        middleware = RetryMiddleware((ConnectionError,), backoff_seconds=0)
+
+        with pytest.raises(ValueError):
+            await middleware(command, next_step)
+        assert attempts == 1
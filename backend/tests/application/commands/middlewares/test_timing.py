@@ -0,0 +1,56 @@
+import pytest
+
+from adapters.outbound.metrics import InMemoryMetricsRegistry
+from application.commands.commands import CreateProjectCommand
+from application.commands.middlewares import (
+    COMMAND_DURATION_SECONDS,
+    COMMANDS_IN_FLIGHT,
+    TimingMiddleware,
+)
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+
+@pytest.fixture
+def command():
+    return CreateProjectCommand(rules=[], url="https://github.com/test-owner/test-repo")
+
+
+class TestTimingMiddleware:
+    """Test suite for TimingMiddleware metrics."""
+
+    @pytest.mark.asyncio
+    async def test_records_latency_and_in_flight_gauge(self, command):
+        metrics = InMemoryMetricsRegistry()
+        middleware = TimingMiddleware(metrics)
+        in_flight_during_call: list[float] = []
+
+        async def next_step(cmd):
+            in_flight_during_call.append(metrics.gauge(COMMANDS_IN_FLIGHT, {"command": "CreateProjectCommand"}))
+            return "done"
+
+        assert await middleware(command, next_step) == "done"
+
+        assert in_flight_during_call == [1.0]
+        assert metrics.gauge(COMMANDS_IN_FLIGHT, {"command": "CreateProjectCommand"}) == 0.0
+        histogram = metrics.histogram(
+            COMMAND_DURATION_SECONDS, {"command": "CreateProjectCommand", "outcome": "success"}
+        )
+        assert histogram is not None
+        assert histogram.count == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_as_errors(self, command):
+        metrics = InMemoryMetricsRegistry()
+
+        async def next_step(cmd):
+            raise ProjectAlreadyExistsError(cmd.url)
+
+        with pytest.raises(ProjectAlreadyExistsError):
+            await TimingMiddleware(metrics)(command, next_step)
+
+        histogram = metrics.histogram(
+            COMMAND_DURATION_SECONDS, {"command": "CreateProjectCommand", "outcome": "error"}
+        )
+        assert histogram is not None
+        assert histogram.count == 1
+        assert metrics.gauge(COMMANDS_IN_FLIGHT, {"command": "CreateProjectCommand"}) == 0.0
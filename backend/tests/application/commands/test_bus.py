@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from application.commands.bus import CommandBus, Middleware, NextStep
+from application.commands.commands import Command, CreateProjectCommand
+from application.commands.exceptions import CommandHandlerNotFoundError
+
+
+class _EchoHandler:
+    instances = 0
+
+    def __init__(self) -> None:
+        _EchoHandler.instances += 1
+
+    async def handle(self, command: CreateProjectCommand) -> str:
+        return command.url
+
+
+class _RecordingMiddleware(Middleware):
+    def __init__(self, name: str, calls: list[str]):
+        self._name = name
+        self._calls = calls
+
+    async def __call__(self, command: Command, next_step: NextStep) -> Any:
+        self._calls.append(f"{self._name}:before")
+        result = await next_step(command)
+        self._calls.append(f"{self._name}:after")
+        return result
+
+
+@pytest.fixture
+def command():
+    return CreateProjectCommand(rules=[], url="https://github.com/test-owner/test-repo")
+
+
+class TestCommandBus:
+    """Test suite for CommandBus dispatching and middleware ordering."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_returns_handler_result(self, command):
+        bus = CommandBus()
+        bus.register(CreateProjectCommand, _EchoHandler)
+
+        assert await bus.dispatch(command) == command.url
+
+    @pytest.mark.asyncio
+    async def test_handler_is_built_for_every_dispatch(self, command):
+        bus = CommandBus()
+        bus.register(CreateProjectCommand, _EchoHandler)
+        _EchoHandler.instances = 0
+
+        await bus.dispatch(command)
+        await bus.dispatch(command)
+
+        assert _EchoHandler.instances == 2
+
+    @pytest.mark.asyncio
+    async def test_middlewares_wrap_handler_in_order(self, command):
+        calls: list[str] = []
+        bus = CommandBus([_RecordingMiddleware("outer", calls), _RecordingMiddleware("inner", calls)])
+        bus.register(CreateProjectCommand, _EchoHandler)
+
+        await bus.dispatch(command)
+
+        assert calls == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_without_handler_raises(self, command):
+        with pytest.raises(CommandHandlerNotFoundError) as exc_info:
+            await CommandBus().dispatch(command)
+
+        assert exc_info.value.command_type == "CreateProjectCommand"
+
+    def test_registering_twice_raises(self):
+        bus = CommandBus()
+        bus.register(CreateProjectCommand, _EchoHandler)
+
+        with pytest.raises(ValueError):
+            bus.register(CreateProjectCommand, _EchoHandler)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from application.health import HealthMonitor, HealthStatus
+
+
+class _Probe:
+    def __init__(self, error: Exception | None = None, delay: float = 0.0):
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+
+    async def check(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+
+class TestHealthMonitor:
+    """Test suite for HealthMonitor."""
+
+    def test_is_starting_before_the_first_run(self):
+        monitor = HealthMonitor({"database": _Probe()})
+
+        assert monitor.report().status is HealthStatus.STARTING
+        assert not monitor.report().ready
+
+    @pytest.mark.asyncio
+    async def test_ready_when_every_probe_passes(self):
+        monitor = HealthMonitor({"database": _Probe(), "providers": _Probe()})
+
+        report = await monitor.refresh()
+
+        assert report.status is HealthStatus.READY
+        assert set(report.checks) == {"database", "providers"}
+        assert all(check.latency_ms >= 0 for check in report.checks.values())
+
+    @pytest.mark.asyncio
+    async def test_failing_non_critical_probe_degrades(self):
+        monitor = HealthMonitor(
+            {"database": _Probe(), "providers": _Probe(RuntimeError("open"))},
+            critical=frozenset({"database"}),
+        )
+
+        report = await monitor.refresh()
+
+        assert report.status is HealthStatus.DEGRADED
+        assert report.ready
+        assert report.checks["providers"].error == "RuntimeError('open')"
+
+    @pytest.mark.asyncio
+    async def test_slow_critical_probe_makes_service_unavailable(self):
+        monitor = HealthMonitor({"database": _Probe(delay=1.0)}, timeout_seconds=0.01)
+
+        report = await monitor.refresh()
+
+        assert report.status is HealthStatus.UNAVAILABLE
+        assert not report.checks["database"].healthy
+
+    @pytest.mark.asyncio
+    async def test_reports_are_served_from_cache(self):
+        probe = _Probe()
+        monitor = HealthMonitor({"database": probe}, interval_seconds=60)
+        monitor.start()
+        await asyncio.sleep(0.01)
+
+        for _ in range(100):
+            monitor.report()
+        await monitor.stop()
+
+        assert probe.calls == 1
+        assert monitor.report().status is HealthStatus.READY
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adapters.outbound.jobs import InMemoryJobQueue
+from application.commands.bus import CommandBus
+from application.commands.commands import CreateProjectCommand
+from application.commands.exceptions import RateLimitExceededError
+from application.jobs import (
+    CommandJobHandler,
+    JobTypeOptions,
+    JobWorkerPool,
+    command_job_type,
+    enqueue_command,
+)
+from application.ports import Job, JobStatus
+from domain.exception import DomainError
+
+
+class _RecordingHandler:
+    def __init__(self, delay: float = 0.0, failures: int = 0, error: Exception | None = None):
+        self.delay = delay
+        self.failures = failures
+        self.error = error or RuntimeError("transient")
+        self.handled: list[Job] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def handle(self, job: Job) -> None:
+        self.handled.append(job)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if len(self.handled) <= self.failures:
+                raise self.error
+        finally:
+            self.running -= 1
+
+
+async def _run_until(pool: JobWorkerPool, condition, timeout: float = 2.0) -> None:
+    task = asyncio.create_task(pool.run())
+    try:
+        async with asyncio.timeout(timeout):
+            while not condition():
+                await asyncio.sleep(0.005)
+    finally:
+        pool.stop()
+        await task
+
+
+class TestJobWorkerPool:
+    """Test suite for JobWorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_per_job_type(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(delay=0.02)
+        jobs = [await queue.enqueue("analysis", {"n": n}) for n in range(6)]
+        pool = JobWorkerPool(
+            queue,
+            {"analysis": handler},
+            {"analysis": JobTypeOptions(concurrency=2)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: all(queue.status(job.id) is JobStatus.DONE for job in jobs))
+
+        assert len(handler.handled) == 6
+        assert handler.max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_jobs_with_backoff(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(failures=2)
+        job = await queue.enqueue("analysis", {})
+        pool = JobWorkerPool(
+            queue,
+            {"analysis": handler},
+            {"analysis": JobTypeOptions(retry_backoff=0.01)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DONE)
+
+        assert [handled.attempts for handled in handler.handled] == [1, 2, 3]
+        assert queue.last_error(job.id) == "RuntimeError('transient')"
+
+    @pytest.mark.asyncio
+    async def test_buries_job_after_max_attempts(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(failures=10)
+        job = await queue.enqueue("analysis", {}, max_attempts=2)
+        pool = JobWorkerPool(
+            queue,
+            {"analysis": handler},
+            {"analysis": JobTypeOptions(retry_backoff=0.01)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DEAD)
+
+        assert len(handler.handled) == 2
+
+    @pytest.mark.asyncio
+    async def test_buries_job_on_domain_error_without_retry(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(failures=1, error=DomainError("Project already exists"))
+        job = await queue.enqueue("analysis", {})
+        pool = JobWorkerPool(queue, {"analysis": handler}, poll_interval=0.01)
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DEAD)
+
+        assert len(handler.handled) == 1
+        assert queue.last_error(job.id) == "Project already exists"
+
+    @pytest.mark.asyncio
+    async def test_defers_rate_limited_job_until_its_limit_allows(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(failures=1, error=RateLimitExceededError("client 'a'", 0.05))
+        job = await queue.enqueue("analysis", {})
+        pool = JobWorkerPool(
+            queue,
+            {"analysis": handler},
+            {"analysis": JobTypeOptions(retry_backoff=10.0)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DONE)
+
+        assert len(handler.handled) == 2
+        assert queue.last_error(job.id) == "Rate limit exceeded for client 'a'"
+
+    @pytest.mark.asyncio
+    async def test_cancels_job_exceeding_visibility_timeout(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(delay=1.0)
+        job = await queue.enqueue("analysis", {}, max_attempts=1)
+        pool = JobWorkerPool(
+            queue,
+            {"analysis": handler},
+            {"analysis": JobTypeOptions(visibility_timeout=0.02)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DEAD)
+
+        assert queue.last_error(job.id) == "TimeoutError()"
+
+    @pytest.mark.asyncio
+    async def test_runs_delayed_job_once_due(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler()
+        run_at = datetime.now(UTC) + timedelta(seconds=0.05)
+        job = await queue.enqueue("analysis", {}, run_at=run_at)
+        pool = JobWorkerPool(queue, {"analysis": handler}, poll_interval=0.01)
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DONE)
+
+        assert datetime.now(UTC) >= run_at
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_running_jobs(self):
+        queue = InMemoryJobQueue()
+        handler = _RecordingHandler(delay=0.05)
+        job = await queue.enqueue("analysis", {})
+        pool = JobWorkerPool(queue, {"analysis": handler}, poll_interval=0.01)
+
+        await _run_until(pool, lambda: handler.running == 1)
+
+        assert queue.status(job.id) is JobStatus.DONE
+
+
+class TestCommandJobHandler:
+    """Test suite for running queued commands through the command bus."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_queued_command(self):
+        queue = InMemoryJobQueue()
+        handler = AsyncMock()
+        bus = CommandBus()
+        bus.register(CreateProjectCommand, lambda: handler)
+        command = CreateProjectCommand(rules=["rule"], url="https://github.com/owner/repo")
+        job = await enqueue_command(queue, command)
+        pool = JobWorkerPool(
+            queue,
+            {command_job_type(CreateProjectCommand): CommandJobHandler(bus, CreateProjectCommand)},
+            poll_interval=0.01,
+        )
+
+        await _run_until(pool, lambda: queue.status(job.id) is JobStatus.DONE)
+
+        assert job.job_type == "CreateProjectCommand"
+        handler.handle.assert_awaited_once_with(command)
@@ -0,0 +1,129 @@
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from fastapi.testclient import TestClient
+
+from adapters.outbound.projects import InMemoryUnitOfWork
+from application.commands.commands import CreateProjectCommand, CreateProjectsCommand
+from application.commands.exceptions import RateLimitExceededError
+from bootstrap import Container, Settings, bootstrap_web_api, open_container
+from domain.project.exceptions import ProjectAlreadyExistsError
+
+
+def _github_app() -> web.Application:
+    async def repository(request: web.Request) -> web.Response:
+        return web.json_response({"id": 1, "name": request.match_info["repo"]})
+
+    async def graphql(request: web.Request) -> web.Response:
+        variables = (await request.json())["variables"]
+        data = {f"r{i}": {"id": str(i)} for i in range(len(variables) // 2)}
+        return web.json_response({"data": data})
+
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}", repository)
+    app.router.add_post("/graphql", graphql)
+    return app
+
+
+class TestSettings:
+    """Test suite for reading Settings from the environment."""
+
+    def test_reads_upper_cased_variables(self):
+        settings = Settings.from_env(
+            {"DATABASE_URL": "postgresql+asyncpg://db/app", "PROVIDER_BURST": "3"}
+        )
+
+        assert settings.database_url == "postgresql+asyncpg://db/app"
+        assert settings.provider_burst == 3
+        assert settings.github_token is None
+
+
+class TestContainer:
+    """Test suite for the composition root."""
+
+    @pytest.mark.asyncio
+    async def test_builds_a_unit_of_work_per_call(self):
+        async with aiohttp.ClientSession() as session:
+            container = Container(Settings(), session)
+
+            assert isinstance(container.unit_of_work(), InMemoryUnitOfWork)
+            assert container.unit_of_work() is not container.unit_of_work()
+
+    @pytest.mark.asyncio
+    async def test_dispatches_commands_against_shared_singletons(self):
+        command = CreateProjectCommand(rules=["rule"], url="https://github.com/owner/repo")
+        async with TestServer(_github_app()) as server:
+            settings = Settings(github_api_url=str(server.make_url("")))
+            async with open_container(settings) as container:
+                await container.bus.dispatch(command)
+
+                with pytest.raises(ProjectAlreadyExistsError):
+                    await container.bus.dispatch(command)
+
+    @pytest.mark.asyncio
+    async def test_verifies_batches_through_graphql(self):
+        urls = ["https://github.com/owner/repo", "https://github.com/owner/other"]
+        async with TestServer(_github_app()) as server:
+            settings = Settings(github_api_url=str(server.make_url("")))
+            async with open_container(settings) as container:
+                outcomes = await container.bus.dispatch(CreateProjectsCommand(rules=[], urls=urls))
+
+        assert [outcome.error for outcome in outcomes] == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_batches_count_against_per_project_limits(self):
+        single = CreateProjectCommand(rules=[], url="https://github.com/owner/repo")
+        batch = CreateProjectsCommand(rules=[], urls=["https://github.com/owner/other", single.url])
+        async with TestServer(_github_app()) as server:
+            settings = Settings(github_api_url=str(server.make_url("")), create_project_rate_per_project=1)
+            async with open_container(settings) as container:
+                await container.bus.dispatch(single)
+
+                with pytest.raises(RateLimitExceededError):
+                    await container.bus.dispatch(batch)
+
+    @pytest.mark.asyncio
+    async def test_reports_provider_failures_per_url_in_batches(self):
+        async def failing(request: web.Request) -> web.Response:
+            return web.Response(status=502)
+
+        app = web.Application()
+        app.router.add_post("/graphql", failing)
+        command = CreateProjectsCommand(rules=[], urls=["https://github.com/owner/repo"])
+        async with TestServer(app) as server:
+            settings = Settings(github_api_url=str(server.make_url("")))
+            async with open_container(settings) as container:
+                outcomes = await container.bus.dispatch(command)
+
+        assert [outcome.error for outcome in outcomes] == ["verification_failed"]
+
+    @pytest.mark.asyncio
+    async def test_closes_the_http_session_on_exit(self):
+        async with open_container(Settings()) as container:
+            session = container.provider_client._session
+
+        assert session.closed
+
+
+class TestWebApiLifespan:
+    """Test suite for the startup and shutdown of the web API."""
+
+    def test_container_lives_for_the_application_lifetime(self):
+        app = bootstrap_web_api(Settings())
+
+        with TestClient(app):
+            container = app.state.container
+            assert app.state.command_bus is container.bus
+
+        assert container.provider_client._session.closed
+
+    def test_serves_prometheus_metrics(self):
+        app = bootstrap_web_api(Settings())
+
+        with TestClient(app) as client:
+            client.get("/api/v1/health/live")
+            response = client.get("/metrics")
+
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'route="/api/v1/health/live"' in response.text
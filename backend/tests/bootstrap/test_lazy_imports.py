@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+DEFERRED_MODULES = ["aiohttp", "asyncpg", "sqlalchemy"]
+
+
+class TestLazyImports:
+    """Test suite for keeping heavy adapters out of the web app import."""
+
+    def test_web_app_import_defers_provider_and_database_adapters(self):
+        code = (
+            "import sys, bootstrap.web_app; "
+            f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
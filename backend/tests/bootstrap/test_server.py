@@ -0,0 +1,51 @@
+import os
+
+import uvicorn
+
+from bootstrap import Settings, run_server, server_config
+
+TUNED_ENV = {
+    "PORT": "9000",
+    "WEB_WORKERS": "4",
+    "WEB_BACKLOG": "4096",
+    "WEB_KEEP_ALIVE_SECONDS": "90",
+    "WEB_GRACEFUL_SHUTDOWN_SECONDS": "20",
+}
+
+
+class TestServerConfig:
+    """Test suite for the production server configuration."""
+
+    def test_maps_settings_to_tuned_server_options(self):
+        settings = Settings.from_env(TUNED_ENV)
+
+        config = server_config(settings)
+
+        assert config.port == 9000
+        assert config.workers == 4
+        assert config.loop == "uvloop"
+        assert config.http == "httptools"
+        assert config.lifespan == "on"
+        assert config.backlog == 4096
+        assert config.timeout_keep_alive == 90
+        assert config.timeout_graceful_shutdown == 20
+        assert config.reload is False
+
+    def test_zero_workers_uses_every_available_cpu(self):
+        config = server_config(Settings(web_workers=0))
+
+        assert config.workers == (os.process_cpu_count() or 1)
+
+
+class TestRunServer:
+    """Test suite for run_server."""
+
+    def test_serves_with_the_server_config(self, monkeypatch):
+        settings = Settings.from_env(TUNED_ENV)
+        calls = []
+        monkeypatch.setattr(uvicorn, "run", lambda app, **options: calls.append((app, options)))
+
+        run_server(settings)
+
+        [(app, options)] = calls
+        assert vars(uvicorn.Config(app, **options)) == vars(server_config(settings))
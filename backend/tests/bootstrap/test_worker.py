@@ -0,0 +1,16 @@
+import pytest
+
+from adapters.outbound.jobs import InMemoryJobQueue
+from application.commands.bus import CommandBus
+from application.commands.commands import CreateProjectsCommand
+from bootstrap import bootstrap_worker
+
+
+class TestBootstrapWorker:
+    """Test suite for bootstrapping the job worker."""
+
+    def test_refuses_a_queue_kept_in_process_memory(self):
+        with pytest.raises(ValueError, match="DATABASE_URL"):
+            bootstrap_worker(
+                InMemoryJobQueue(), CommandBus(), [CreateProjectsCommand]
+            )
@@ -0,0 +1,152 @@
+import pytest
+
+from domain.analysis.exceptions import MalformedDiffError
+from domain.analysis.value_objects import Diff, DiffLine, FileStatus, LineKind
+
+GIT_DIFF = b"""diff --git a/app/main.py b/app/main.py
+index 3b18e51..a9f3c2d 100644
+--- a/app/main.py
++++ b/app/main.py
+@@ -1,4 +1,5 @@ def main():
+ import os
+-import sys
++import sys
++import json
+ 
+ print(os.getcwd())
+@@ -10 +11,0 @@ def run():
+-    return None
+diff --git a/docs/new file.md b/docs/new file.md
+new file mode 100644
+index 0000000..e69de29
+--- /dev/null
++++ b/docs/new file.md
+@@ -0,0 +1 @@
++-- not a header
+\\ No newline at end of file
+diff --git a/old.txt b/new.txt
+similarity index 90%
+rename from old.txt
+rename to new.txt
+diff --git a/logo.png b/logo.png
+deleted file mode 100644
+index 5a1c2f3..0000000
+Binary files a/logo.png and /dev/null differ
+"""
+
+
+class TestDiff:
+    """Test cases for Diff value object."""
+
+    def test_files_with_paths_and_status(self) -> None:
+        """Test parsing the header of every changed file."""
+        files = list(Diff(GIT_DIFF).files())
+
+        assert [(file.old_path, file.new_path, file.status) for file in files] == [
+            ("app/main.py", "app/main.py", FileStatus.MODIFIED),
+            (None, "docs/new file.md", FileStatus.ADDED),
+            ("old.txt", "new.txt", FileStatus.RENAMED),
+            ("logo.png", None, FileStatus.DELETED),
+        ]
+        assert [file.is_binary for file in files] == [False, False, False, True]
+        assert files[3].path == "logo.png"
+
+    def test_hunks_with_ranges(self) -> None:
+        """Test finding the hunks of a file with their ranges."""
+        file = next(Diff(GIT_DIFF).files())
+
+        hunks = list(file.hunks())
+
+        assert [(h.old_start, h.old_count, h.new_start, h.new_count) for h in hunks] == [
+            (1, 4, 1, 5),
+            (10, 1, 11, 0),
+        ]
+        assert hunks[0].section == "def main():"
+        assert bytes(hunks[1].raw) == b"-    return None\n"
+
+    def test_lines_are_numbered_in_old_and_new_file(self) -> None:
+        """Test numbering the lines of a hunk."""
+        hunk = next(next(Diff(GIT_DIFF).files()).hunks())
+
+        lines = list(hunk.lines())
+
+        assert lines[:4] == [
+            DiffLine(LineKind.CONTEXT, "import os", 1, 1),
+            DiffLine(LineKind.REMOVED, "import sys", 2, None),
+            DiffLine(LineKind.ADDED, "import sys", None, 2),
+            DiffLine(LineKind.ADDED, "import json", None, 3),
+        ]
+        assert lines[-1] == DiffLine(LineKind.CONTEXT, "print(os.getcwd())", 4, 5)
+
+    def test_skips_missing_newline_marker(self) -> None:
+        """Test that the no-newline marker is not a line of the hunk."""
+        file = list(Diff(GIT_DIFF).files())[1]
+
+        lines = list(next(file.hunks()).lines())
+
+        assert lines == [DiffLine(LineKind.ADDED, "-- not a header", None, 1)]
+
+    def test_wraps_memoryview_without_copying(self) -> None:
+        """Test that hunks are views over the original buffer."""
+        buffer = bytearray(GIT_DIFF)
+        hunk = next(next(Diff(memoryview(buffer)).files()).hunks())
+
+        buffer[hunk.start + 1 : hunk.start + 7] = b"IMPORT"
+
+        assert hunk.text.startswith(" IMPORT os")
+
+    def test_plain_unified_diff(self) -> None:
+        """Test splitting a diff without git headers on its file headers."""
+        diff = Diff(
+            b"--- a.txt\t2025-01-01 10:00:00\n+++ a.txt\t2025-01-02 10:00:00\n"
+            b"@@ -1 +1 @@\n-old\n+new\n"
+            b"--- b.txt\n+++ b.txt\n@@ -1,2 +1 @@\n keep\n-drop\n"
+        )
+
+        files = list(diff.files())
+
+        assert [file.path for file in files] == ["a.txt", "b.txt"]
+        assert [line.content for line in next(files[1].hunks()).lines()] == ["keep", "drop"]
+
+    def test_plain_diff_is_not_split_inside_hunks(self) -> None:
+        """Test that removed "-- " and added "++ " lines do not open a file."""
+        diff = Diff(
+            b"--- schema.sql\n+++ schema.sql\n@@ -1 +1 @@\n--- old comment\n+++ new\n"
+            b"--- b.sql\n+++ b.sql\n@@ -1 +1,2 @@\n-x\n+y\n+z\n"
+        )
+
+        files = list(diff.files())
+
+        assert [file.path for file in files] == ["schema.sql", "b.sql"]
+        assert [line.content for line in next(files[0].hunks()).lines()] == [
+            "-- old comment",
+            "++ new",
+        ]
+
+    def test_quoted_paths_with_octal_escapes(self) -> None:
+        """Test decoding paths git quotes for their non-ASCII bytes."""
+        diff = Diff(
+            b'diff --git "a/docs/\\303\\251t\\303\\251.md" "b/docs/\\303\\251t\\303\\251.md"\n'
+            b'rename from "docs/\\303\\251t\\303\\251.md"\n'
+            b'rename to "docs/tab\\there.md"\n'
+        )
+
+        file = next(diff.files())
+
+        assert (file.old_path, file.new_path) == ("docs/été.md", "docs/tab\there.md")
+
+    def test_empty_diff_has_no_files(self) -> None:
+        """Test that an empty diff is valid."""
+        assert list(Diff(b"").files()) == []
+
+    def test_text_without_file_header_is_rejected(self) -> None:
+        """Test rejecting content that is not a diff."""
+        with pytest.raises(MalformedDiffError):
+            Diff(b"<html>Not found</html>")
+
+    def test_invalid_hunk_header_is_rejected(self) -> None:
+        """Test rejecting a hunk header without ranges."""
+        diff = Diff(b"--- a.txt\n+++ a.txt\n@@ broken @@\n+x\n")
+
+        with pytest.raises(MalformedDiffError):
+            list(next(diff.files()).hunks())
@@ -7,7 +7,7 @@ from domain.project.exceptions import RemoteRepositoryDoesNotExistError
 from domain.project.factories import DefaultPoliciesFactory, ProjectFactory, URLBasedValueObjectsFactory
 from domain.project.ports import RemoteRepositoryVerifier
 from domain.project.services.create_project_service import CreateProjectService
-from domain.project.value_objects import ProviderType, Provider, RepositoryId
+from domain.project.value_objects import Owner, ProviderType, Provider, RepositoryId
 
 
 class TestCreateProjectService:
@@ -105,7 +105,9 @@ class TestCreateProjectService:
 
         # Verify verifier was called with correct parameters extracted from URL
         mock_verifier_success.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
 
     @pytest.mark.asyncio
@@ -123,7 +125,9 @@ class TestCreateProjectService:
 
         # Verify verifier was called with correct parameters extracted from URL
         mock_verifier_failure.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
 
     @pytest.mark.asyncio
@@ -147,7 +151,9 @@ class TestCreateProjectService:
 
         # Verify only first verifier was called (loop breaks on first success)
         success_verifier.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
         # Second verifier should NOT be called because loop breaks on first success
         failure_verifier.verify.assert_not_called()
@@ -171,10 +177,14 @@ class TestCreateProjectService:
 
         # Verify both verifiers were called
         success_verifier.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
         failure_verifier.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
 
     @pytest.mark.asyncio
@@ -194,10 +204,14 @@ class TestCreateProjectService:
 
         # Verify both verifiers were called
         success_verifier.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
         failure_verifier.verify.assert_called_once_with(
-            repository_id=RepositoryId("test-repo"), provider=Provider(ProviderType.GITHUB)
+            repository_id=RepositoryId("test-repo"),
+            provider=Provider(ProviderType.GITHUB),
+            owner=Owner("test-owner"),
         )
 
     @pytest.mark.asyncio
@@ -238,7 +252,8 @@ class TestCreateProjectService:
             assert str(result._owner) == case["expected_owner"]
             mock_verifier_success.verify.assert_called_once_with(
                 repository_id=RepositoryId(case["expected_repo"]),
-                provider=Provider(case["expected_provider"])
+                provider=Provider(case["expected_provider"]),
+                owner=Owner(case["expected_owner"]),
             )
 
     @pytest.mark.asyncio